@@ -0,0 +1,22 @@
+"""
+Lead Researcher Skill Scripts
+"""
+
+from .cache import PageCache
+from .fetch import Fetcher, HttpFetcher, CachedFetcher, fetch_all
+from .extract import extract_page, condense
+from .research import build_urls, research_lead
+from .format_output import format_lead_markdown
+
+__all__ = [
+    'PageCache',
+    'Fetcher',
+    'HttpFetcher',
+    'CachedFetcher',
+    'fetch_all',
+    'extract_page',
+    'condense',
+    'build_urls',
+    'research_lead',
+    'format_lead_markdown'
+]
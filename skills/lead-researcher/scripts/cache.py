@@ -0,0 +1,105 @@
+"""
+On-disk cache with TTL
+Fetched pages and lead analyses, so repeat lookups skip the network and the model
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from src.utils import codec
+
+
+class PageCache:
+    """Compressed JSON entries keyed by URL (or any string), expiring after a TTL"""
+
+    def __init__(self, path: str, ttl_seconds: float = 7 * 24 * 3600):
+        """
+        Initialize cache
+
+        Args:
+            path: Cache directory
+            ttl_seconds: Age after which an entry is evicted
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger("nexus.lead_researcher.cache")
+        self.hits = 0
+        self.misses = 0
+
+    def _file(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.path / digest[:2] / f"{digest}.json.gz"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a fresh entry
+
+        Args:
+            key: Entry key (e.g. URL)
+
+        Returns:
+            Stored value, or None if missing or expired (expired entries are deleted)
+        """
+        target = self._file(key)
+        try:
+            with gzip.open(target, 'rb') as f:
+                entry = codec.loads(f.read())
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Dropping unreadable cache entry {target}: {e}")
+            target.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.ttl_seconds:
+            target.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry.get("value")
+
+    def put(self, key: str, value: Any):
+        """
+        Store an entry
+
+        Args:
+            key: Entry key
+            value: JSON-serializable value
+        """
+        target = self._file(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(target.name + '.tmp')
+
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            f.write(codec.dumps({"key": key, "stored_at": time.time(), "value": value}))
+        os.replace(tmp_path, target)
+
+    def evict_expired(self) -> int:
+        """
+        Delete every expired entry
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.path.exists():
+            return 0
+
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        for entry in self.path.glob("*/*.json.gz"):
+            # Entries are written once, so mtime is the store time
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink(missing_ok=True)
+                removed += 1
+
+        if removed:
+            self.logger.info(f"Evicted {removed} expired cache entries")
+        return removed
@@ -0,0 +1,157 @@
+"""
+Local text extraction
+Turn fetched HTML into a compact research digest before the model sees it
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Dict, List
+
+
+# Elements whose text is never useful for qualification
+SKIPPED_TAGS = {"script", "style", "noscript", "svg", "nav", "footer", "header", "form", "template"}
+
+BLOCK_TAGS = {"p", "div", "section", "article", "li", "h1", "h2", "h3", "h4", "td", "br", "tr", "dd", "dt"}
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+PHONE_RE = re.compile(r"(?:\+?1[ .-]?)?\(?\d{3}\)?[ .-]?\d{3}[ .-]?\d{4}")
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+MIN_LINE_WORDS = 4
+
+
+class _TextExtractor(HTMLParser):
+    """Collect title, meta description and visible text blocks"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.description = ""
+        self.blocks: List[str] = []
+        self.emails: List[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+        self._current: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "meta" and (attrs.get("name") or attrs.get("property", "")).lower() in (
+            "description", "og:description"
+        ):
+            self.description = self.description or (attrs.get("content") or "").strip()
+        elif tag == "a" and (attrs.get("href") or "").startswith("mailto:"):
+            self.emails.append(attrs["href"][len("mailto:"):].split("?")[0])
+
+        if tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+        if tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif not self._skip_depth:
+            self._current.append(data)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def _flush(self):
+        text = " ".join("".join(self._current).split())
+        self._current = []
+        if text:
+            self.blocks.append(text)
+
+
+def extract_page(html: str) -> Dict[str, object]:
+    """
+    Extract the useful text of one page
+
+    Args:
+        html: Page body
+
+    Returns:
+        Dictionary with title, description, blocks (visible text) and contacts
+        (emails and phone numbers)
+    """
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+
+    text = "\n".join(parser.blocks)
+    contacts = list(dict.fromkeys(
+        parser.emails + EMAIL_RE.findall(text) + [p.strip() for p in PHONE_RE.findall(text)]
+    ))
+
+    return {
+        "title": " ".join(parser.title.split()),
+        "description": parser.description,
+        "blocks": parser.blocks,
+        "contacts": contacts
+    }
+
+
+def condense(pages: Dict[str, str], max_chars: int = 12000) -> str:
+    """
+    Build one research digest from several pages
+
+    Boilerplate (short lines, text repeated across pages) is dropped and
+    each page contributes in turn until the character budget is spent, so
+    every source is represented.
+
+    Args:
+        pages: HTML body by URL
+        max_chars: Size budget for the digest
+
+    Returns:
+        Digest text, one section per page
+    """
+    seen = set()
+    sections = []
+    contacts: List[str] = []
+
+    for url, html in pages.items():
+        page = extract_page(html)
+        contacts.extend(page["contacts"])
+
+        lines = []
+        for block in [page["description"]] + page["blocks"]:
+            for sentence in SENTENCE_RE.split(block):
+                key = sentence.casefold()
+                if len(sentence.split()) < MIN_LINE_WORDS or key in seen:
+                    continue
+                seen.add(key)
+                lines.append(sentence)
+
+        if lines:
+            sections.append((f"--- {page['title'] or url} ({url}) ---", lines))
+
+    # Round-robin across pages so a long page can't crowd out the others
+    output = [[header] for header, _ in sections]
+    budget = max_chars - sum(len(header) + 1 for header, _ in sections)
+    position = 0
+    while budget > 0 and any(position < len(lines) for _, lines in sections):
+        for index, (_, lines) in enumerate(sections):
+            if position < len(lines) and len(lines[position]) < budget:
+                output[index].append(lines[position])
+                budget -= len(lines[position]) + 1
+        position += 1
+
+    digest = "\n\n".join("\n".join(section) for section in output)
+
+    unique_contacts = list(dict.fromkeys(contacts))
+    if unique_contacts:
+        digest += "\n\n--- Coordonnées trouvées ---\n" + "\n".join(unique_contacts)
+
+    return digest
@@ -0,0 +1,140 @@
+"""
+Page fetching
+Pluggable fetchers: concurrent HTTP with the resilience layer, plus an on-disk cache in front
+"""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional, Protocol
+
+import httpx
+
+from src.utils.resilience import Resilience, CircuitOpenError, DeadlineExceededError
+
+from .cache import PageCache
+
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+USER_AGENT = "NEXUS lead-researcher (+https://github.com/chrisboulet/Nexus)"
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Tell whether a page fetch error is worth retrying"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS
+    return isinstance(error, httpx.TransportError)
+
+
+class Fetcher(Protocol):
+    """Anything that can turn a URL into page text"""
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """Return the page body, or None if it can't be fetched"""
+        ...
+
+
+class HttpFetcher:
+    """Fetch pages over HTTP, a bounded number at a time"""
+
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        resilience: Optional[Resilience] = None,
+        max_concurrency: int = 6,
+        timeout: float = 10.0
+    ):
+        """
+        Initialize fetcher
+
+        Args:
+            http_client: Connection pool (a client per request if None)
+            resilience: Shared retry/circuit-breaker layer
+            max_concurrency: Maximum pages downloaded at once
+            timeout: Per-request timeout in seconds
+        """
+        self.http_client = http_client
+        self.resilience = resilience or Resilience()
+        self.timeout = timeout
+        self.logger = logging.getLogger("nexus.lead_researcher.fetch")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        Download a page
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Response text, or None on a client error or after retries fail
+        """
+        async def send(client: httpx.AsyncClient) -> str:
+            response = await client.get(
+                url,
+                headers={"User-Agent": USER_AGENT},
+                timeout=self.timeout,
+                follow_redirects=True
+            )
+            response.raise_for_status()
+            return response.text
+
+        async def request() -> str:
+            if self.http_client is not None:
+                return await send(self.http_client)
+            async with httpx.AsyncClient() as client:
+                return await send(client)
+
+        async with self._semaphore:
+            try:
+                return await self.resilience.call(
+                    "web",
+                    "fetch",
+                    request,
+                    retry_on=is_transient_error
+                )
+            except (httpx.HTTPError, CircuitOpenError, DeadlineExceededError) as e:
+                self.logger.warning(f"Failed to fetch {url}: {e}")
+                return None
+
+
+class CachedFetcher:
+    """Serve pages from a PageCache, fetching and storing misses"""
+
+    def __init__(self, fetcher: Fetcher, cache: PageCache):
+        """
+        Initialize cached fetcher
+
+        Args:
+            fetcher: Fetcher used on cache misses
+            cache: On-disk page cache
+        """
+        self.fetcher = fetcher
+        self.cache = cache
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """Return the cached page, or fetch and cache it"""
+        body = self.cache.get(url)
+        if body is not None:
+            return body
+
+        body = await self.fetcher.fetch(url)
+        if body is not None:
+            self.cache.put(url, body)
+        return body
+
+
+async def fetch_all(fetcher: Fetcher, urls: Iterable[str]) -> Dict[str, str]:
+    """
+    Fetch pages concurrently
+
+    Args:
+        fetcher: Fetcher to use
+        urls: Page URLs (duplicates are fetched once)
+
+    Returns:
+        Body of every page that could be fetched, by URL
+    """
+    unique = list(dict.fromkeys(urls))
+    bodies = await asyncio.gather(*(fetcher.fetch(url) for url in unique))
+    return {url: body for url, body in zip(unique, bodies) if body}
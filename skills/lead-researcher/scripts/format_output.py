@@ -0,0 +1,97 @@
+"""
+Output formatting for leads
+Generate markdown reports
+"""
+
+from typing import Any, Dict
+
+
+def format_lead_markdown(results: Dict[str, Any]) -> str:
+    """
+    Format a lead profile as markdown
+
+    Args:
+        results: Results from research_lead
+
+    Returns:
+        Markdown report
+    """
+    stats = results.get("stats", {})
+    lead = results.get("lead", {})
+    company = lead.get("company") or results.get("company", "")
+
+    lines = [f"## 🔎 Lead - {company}", ""]
+
+    profile = [
+        ("Secteur", lead.get("sector")),
+        ("Taille", lead.get("size")),
+        ("CA estimé", lead.get("estimated_revenue"))
+    ]
+    for label, value in profile:
+        if value:
+            lines.append(f"- **{label}** : {value}")
+
+    fit_score = lead.get("fit_score")
+    if fit_score is not None:
+        line = f"- **Score fit** : {fit_score}/10"
+        if lead.get("fit_rationale"):
+            line += f" — {lead['fit_rationale']}"
+        lines.append(line)
+    lines.append("")
+
+    contacts = lead.get("contacts") or []
+    if contacts:
+        lines.append("### 👥 Contacts clés")
+        for contact in contacts:
+            if isinstance(contact, dict):
+                line = f"- {contact.get('name', 'Inconnu')}"
+                if contact.get("role"):
+                    line += f" ({contact['role']})"
+            else:
+                line = f"- {contact}"
+            lines.append(line)
+        lines.append("")
+
+    sections = [
+        ("approach_angles", "💡 Angles d'approche"),
+        ("next_actions", "➡️ Prochaines actions")
+    ]
+    for key, label in sections:
+        if lead.get(key):
+            lines.append(f"### {label}")
+            lines.extend(f"- {item}" for item in lead[key])
+            lines.append("")
+
+    lines.append("---")
+    lines.append("")
+
+    if stats.get("dry_run"):
+        lines.append("🔍 DRY-RUN : fiche non créée dans le CRM Notion")
+    elif results.get("crm_updated"):
+        lines.append("🔄 Fiche mise à jour dans le CRM Notion")
+    elif results.get("crm_created"):
+        lines.append("✅ Fiche créée dans le CRM Notion")
+    else:
+        lines.append("⚠️  Fiche non créée dans le CRM Notion")
+
+    lines.append(
+        f"🌐 Pages : {stats.get('pages_fetched', 0)}/{stats.get('pages_requested', 0)} "
+        f"en {stats.get('fetch_seconds', 0)}s "
+        f"({stats.get('cache_hits', 0)} depuis le cache)"
+    )
+
+    if stats.get("analysis_cached"):
+        lines.append("🧮 Analyse réutilisée depuis le cache (aucun token)")
+    else:
+        tokens = stats.get("tokens") or {}
+        if tokens.get("calls"):
+            lines.append(
+                f"🧮 Tokens : {tokens.get('input_tokens', 0)} en entrée, "
+                f"{tokens.get('output_tokens', 0)} en sortie"
+            )
+
+    if lead.get("sources"):
+        lines.append("")
+        lines.append("📚 Sources : " + ", ".join(lead["sources"]))
+
+    return "\n".join(lines)
@@ -0,0 +1,163 @@
+"""
+Lead research script
+Main logic for the lead researcher workflow
+"""
+
+import hashlib
+import logging
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+from .cache import PageCache
+from .extract import condense
+from .fetch import CachedFetcher, Fetcher, fetch_all
+
+
+def build_urls(company: str, sources: List[str], site: Optional[str] = None) -> List[str]:
+    """
+    Expand source URL templates for a company
+
+    Args:
+        company: Company name
+        sources: URL templates with {company} and/or {site} placeholders
+        site: Company website root; templates using {site} are skipped without it
+
+    Returns:
+        Unique URLs to fetch
+    """
+    urls = []
+    for source in sources:
+        if "{site}" in source and not site:
+            continue
+        urls.append(source.format(
+            company=quote(company.replace(" ", "_")),
+            site=(site or "").rstrip("/")
+        ))
+    return list(dict.fromkeys(urls))
+
+
+async def research_lead(
+    company: str,
+    fetcher: Fetcher,
+    claude_connector,
+    notion_connector,
+    template,
+    sources: List[str],
+    site: Optional[str] = None,
+    cache: Optional[PageCache] = None,
+    dry_run: bool = False,
+    max_chars: int = 12000
+) -> Dict[str, Any]:
+    """
+    Main lead research workflow
+
+    Pages are fetched concurrently (and served from the on-disk cache when
+    fresh), condensed locally, then qualified with a single Claude call.
+    The analysis is cached too, keyed by prompt and research text, so a
+    repeat lookup costs no network and no tokens.
+
+    Args:
+        company: Company name
+        fetcher: Page fetcher (e.g. HttpFetcher)
+        claude_connector: Claude API connector
+        notion_connector: Notion connector bound to the CRM database
+        template: Lead research prompt template
+        sources: URL templates with {company} and/or {site} placeholders
+        site: Company website root
+        cache: Page and analysis cache (no caching if None)
+        dry_run: If True, don't create or update the CRM entry
+        max_chars: Size budget of the condensed research sent to Claude
+
+    Returns:
+        Dictionary with the lead profile and statistics
+    """
+    logger = logging.getLogger("nexus.lead_researcher")
+    started = time.perf_counter()
+
+    # Step 1: Fetch pages
+    urls = build_urls(company, sources, site)
+    if cache is not None:
+        fetcher = CachedFetcher(fetcher, cache)
+    logger.info(f"Fetching {len(urls)} pages for {company}")
+    pages = await fetch_all(fetcher, urls)
+    fetch_seconds = time.perf_counter() - started
+
+    stats = {
+        "pages_requested": len(urls),
+        "pages_fetched": len(pages),
+        "fetch_seconds": round(fetch_seconds, 2),
+        "tokens": dict(claude_connector.usage),
+        "dry_run": dry_run
+    }
+    if cache is not None:
+        stats["cache_hits"] = cache.hits
+
+    if not pages:
+        logger.warning(f"No page could be fetched for {company}")
+        return {
+            "success": False,
+            "message": "Aucune page n'a pu être récupérée",
+            "company": company,
+            "stats": stats
+        }
+
+    # Step 2: Condense locally
+    research = condense(pages, max_chars=max_chars)
+    stats["research_chars"] = len(research)
+
+    # Step 3: Qualify with Claude (or reuse a cached analysis of the same research)
+    analysis_key = "lead:" + hashlib.sha256(
+        f"{template.hash}\n{company}\n{research}".encode('utf-8')
+    ).hexdigest()
+    cached = cache.get(analysis_key) if cache is not None else None
+
+    if cached is not None:
+        logger.info(f"Reusing cached analysis for {company}")
+        lead = cached["lead"]
+        crm_created = cached.get("crm_created", False)
+        stats["analysis_cached"] = True
+    else:
+        lead = await claude_connector.analyze_lead(company, research, template)
+        crm_created = False
+        stats["analysis_cached"] = False
+
+    stats["tokens"] = dict(claude_connector.usage)
+
+    if lead is None:
+        return {
+            "success": False,
+            "message": "Échec de l'analyse du lead",
+            "company": company,
+            "stats": stats
+        }
+
+    lead.setdefault("company", company)
+    lead["sources"] = list(pages)
+
+    # Step 4: Create the CRM entry, or refresh it if the company is already there
+    crm_page = None
+    crm_updated = False
+    if not dry_run and not crm_created:
+        existing = await notion_connector.find_crm_entry(company)
+        if existing is not None:
+            crm_page = await notion_connector.update_crm_entry(existing["id"], lead)
+            crm_updated = crm_page is not None
+        else:
+            crm_page = await notion_connector.create_crm_entry(lead)
+        crm_created = crm_page is not None
+
+    if cache is not None and (cached is None or crm_created != cached.get("crm_created", False)):
+        cache.put(analysis_key, {"lead": lead, "crm_created": crm_created})
+
+    stats["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+
+    return {
+        "success": True,
+        "company": company,
+        "lead": lead,
+        "crm_entry": crm_page,
+        "crm_created": crm_created,
+        "crm_updated": crm_updated,
+        "stats": stats
+    }
@@ -2,7 +2,33 @@
 Priority Detector Skill Scripts
 """
 
-from .analyze import analyze_priorities
-from .format_output import format_priorities_markdown
+from .analyze import analyze_priorities, merge_results
+from .format_output import (
+    format_priorities_markdown,
+    format_priorities_json,
+    iter_priorities_markdown,
+    iter_priorities_json,
+    iter_new_priorities_markdown,
+    format_priority_record,
+    format_stats_record
+)
+from .delta import LifelogDeltaStore
+from .partitions import DailyPartitionStore
+from .skill import run_skill, fetch_days, format_report
 
-__all__ = ['analyze_priorities', 'format_priorities_markdown']
+__all__ = [
+    'analyze_priorities',
+    'merge_results',
+    'format_priorities_markdown',
+    'format_priorities_json',
+    'iter_priorities_markdown',
+    'iter_priorities_json',
+    'iter_new_priorities_markdown',
+    'format_priority_record',
+    'format_stats_record',
+    'LifelogDeltaStore',
+    'DailyPartitionStore',
+    'run_skill',
+    'fetch_days',
+    'format_report'
+]
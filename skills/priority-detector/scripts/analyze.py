@@ -3,9 +3,16 @@ Priority analysis script
 Main logic for priority detection workflow
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any
-from datetime import datetime
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from datetime import date, datetime, timedelta
+
+from src.utils.memory import peak_rss_mb
+from src.utils.models import Lifelog, Priority
+
+from .partitions import group_by_day, period_days
+from .rank import PRIORITY_TYPES, merge_ranked, rank_priorities, title_key
 
 
 async def analyze_priorities(
@@ -13,7 +20,21 @@ async def analyze_priorities(
     claude_connector,
     notion_connector,
     period: str = "today",
-    dry_run: bool = False
+    dry_run: bool = False,
+    resilience=None,
+    search_index=None,
+    context_snippets: int = 0,
+    entity_index=None,
+    on_priority: Optional[Callable[[str, Priority], None]] = None,
+    confidence_threshold: float = 0.0,
+    max_priorities_per_day: Optional[int] = None,
+    bounded_memory: bool = False,
+    chunk_chars: int = 40000,
+    since: Optional[datetime] = None,
+    lifelogs: Optional[List[Any]] = None,
+    delta_store=None,
+    partitions=None,
+    window_days: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Main priority detection workflow
@@ -24,79 +45,701 @@ async def analyze_priorities(
         notion_connector: Notion API connector
         period: Time period (today/week)
         dry_run: If True, don't create Notion TODOs
+        resilience: Shared resilience layer whose retry stats are reported
+        search_index: Local search index updated with fetched lifelogs
+        context_snippets: Number of past lifelogs pulled from the index into the prompt
+        entity_index: Per-contact index updated with lifelogs and extracted priorities
+        on_priority: Called with (type, item) as soon as each priority above the
+            confidence threshold is extracted; switches Claude to streaming mode.
+            Items of the run that were not extracted by this run (stored for
+            unchanged lifelogs or reused days) follow once the analysis is done;
+            each type and title is emitted once
+        confidence_threshold: Items below this confidence are dropped
+        max_priorities_per_day: Keep only the top-k ranked items per day of the period
+        bounded_memory: Parse lifelogs incrementally and analyze them in chunks,
+            dropping transcripts once analyzed, so memory stays flat as the window grows
+        chunk_chars: Transcript characters per Claude call in bounded-memory mode
+        since: Only analyze lifelogs recorded after this time (revalidation)
+        lifelogs: Lifelogs already fetched (e.g. by the skill runner), as
+            Lifelog or dictionaries; skips the Limitless fetch
+        delta_store: LifelogDeltaStore; only segments added since the previous
+            run are sent to Claude and merged with the items stored per lifelog,
+            and items that already have a TODO are not created again
+            (ignored in bounded-memory mode)
+        partitions: DailyPartitionStore; a full-day run stores its items as
+            the day's partition (and refetches past days stored before they
+            were over, so they become final), and longer periods are rolled up
+            from the stored days, analyzing only the missing or changed ones
+            (ignored in bounded-memory mode and with `since`)
+        window_days: Days, ending today, that `lifelogs` were fetched for
+            (defaults to the period); see DailyPartitionStore.window_days
 
     Returns:
-        Dictionary with results and statistics
+        Dictionary with results and statistics; `priorities` holds Priority
+        items by type, `outcomes` the Notion outcome of each (created, failed
+        or skipped) by type and title
     """
     logger = logging.getLogger("nexus.priority_detector")
 
-    # Step 1: Fetch lifelogs from Limitless
-    logger.info(f"Fetching lifelogs for period: {period}")
-
     days = 1 if period == "today" else 7
-    lifelogs = await limitless_connector.get_lifelogs(days=days)
+    partition_stats = None
+    # The connector logs failed calls and returns no items; its error count tells them apart
+    errors_before = claude_connector.usage["errors"]
+    if on_priority is not None:
+        on_priority = _once_per_title(on_priority)
+    max_priorities = None
+    if max_priorities_per_day:
+        max_priorities = max_priorities_per_day * days
 
-    if not lifelogs:
-        logger.warning("No lifelogs found")
-        return {
-            "success": False,
-            "message": "No lifelogs found for this period",
-            "priorities": {"engagements": [], "demandes": [], "deadlines": []},
-            "stats": {}
-        }
+    if bounded_memory and lifelogs is None:
+        # Chunks never hold a whole lifelog window, so there is no delta to plan
+        delta_store = None
 
-    logger.info(f"Retrieved {len(lifelogs)} lifelogs")
+        # Steps 1-3 interleaved, one chunk of lifelogs at a time
+        lifelogs_analyzed, priorities, total_priorities, ranking_stats = await _analyze_in_chunks(
+            limitless_connector,
+            claude_connector,
+            period=period,
+            days=days,
+            chunk_chars=chunk_chars,
+            since=since,
+            search_index=search_index,
+            context_snippets=context_snippets,
+            entity_index=entity_index,
+            on_priority=on_priority,
+            confidence_threshold=confidence_threshold,
+            max_priorities=max_priorities
+        )
+        if not lifelogs_analyzed:
+            logger.warning("No lifelogs found")
+            return _no_lifelogs_result(resilience)
 
-    # Step 2: Analyze with Claude
-    logger.info("Analyzing lifelogs with Claude...")
-    priorities = await claude_connector.analyze_priorities(lifelogs, period)
+    elif partitions is not None and days > 1 and since is None:
+        # Steps 1-2 only for the days not already stored, then merge the days
+        rollup = await _rollup_partitions(
+            limitless_connector,
+            claude_connector,
+            partitions,
+            period=period,
+            days=days,
+            lifelogs=lifelogs,
+            window_days=window_days,
+            delta_store=delta_store,
+            search_index=search_index,
+            context_snippets=context_snippets,
+            entity_index=entity_index,
+            on_priority=on_priority,
+            confidence_threshold=confidence_threshold
+        )
+        lifelogs_analyzed, priorities, sources, partition_stats = rollup
+        if not lifelogs_analyzed:
+            logger.warning("No lifelogs found")
+            return _no_lifelogs_result(resilience)
 
-    total_priorities = (
-        len(priorities.get("engagements", [])) +
-        len(priorities.get("demandes", [])) +
-        len(priorities.get("deadlines", []))
-    )
+        _stream_remaining(priorities, on_priority, confidence_threshold)
+        total_priorities = _count(priorities)
+        logger.info(f"Detected {total_priorities} priorities over {days} days")
+
+        # Step 3: Rank, apply confidence threshold and daily cap
+        priorities, ranking_stats = rank_priorities(
+            priorities,
+            confidence_threshold=confidence_threshold,
+            max_priorities=max_priorities,
+            lifelogs=sources
+        )
+
+    else:
+        # Past days stored before they were over are refetched once to become final
+        settle: List[date] = []
+        failed = 0
+        today = date.today()
+        if partitions is not None and days == 1 and since is None:
+            # Given lifelogs can only settle the days they cover
+            candidates = period_days(7 if lifelogs is None else window_days or days, today)[:-1]
+            settle = partitions.unsettled_days(candidates)
+
+        # Step 1: Fetch lifelogs and conversations from Limitless
+        fetched_at = datetime.now()
+        if lifelogs is None:
+            window_days = (today - settle[0]).days + 1 if settle else days
+            logger.info(f"Fetching lifelogs for period: {period}")
+            lifelogs = await limitless_connector.get_window(days=window_days, since=since)
+
+        # Only the fields the analysis reads are kept past this point
+        lifelogs = [Lifelog.from_dict(lifelog) for lifelog in lifelogs or []]
+
+        if days == 1 and since is None and (window_days or days) > 1:
+            # Days before today were fetched to settle them, or for another skill
+            first = today - timedelta(days=window_days - 1)
+            by_day = group_by_day(lifelogs, first=first, last=today)
+            lifelogs = by_day.pop(today, [])
+        if settle:
+            past = [log for day in settle for log in by_day.get(day, [])]
+            _index_lifelogs(past, search_index, 0, entity_index)
+            computed, failed = await _refresh_days(
+                claude_connector, partitions, settle, by_day, period, [],
+                delta_store, None, confidence_threshold, fetched_at
+            )
+            logger.info(
+                f"Settled {len(settle) - failed} past days ({computed} recomputed, "
+                f"{failed} left for the next run)"
+            )
+
+        if not lifelogs:
+            logger.warning("No lifelogs found")
+            return _no_lifelogs_result(resilience)
+
+        logger.info(f"Retrieved {len(lifelogs)} lifelogs")
+        lifelogs_analyzed = len(lifelogs)
+
+        # Keep the local search indexes in sync and pull relevant history
+        context = _index_lifelogs(lifelogs, search_index, context_snippets, entity_index)
+
+        # Step 2: Analyze with Claude, only what was added since the last run
+        priorities = await _analyze_lifelogs(
+            claude_connector, lifelogs, period, context, delta_store,
+            on_priority, confidence_threshold
+        )
+        if partitions is not None and days == 1 and since is None:
+            # A failed analysis leaves the stored day as it was, to be computed again
+            if priorities is not None:
+                partitions.save(date.today(), priorities, lifelogs, now=fetched_at)
+            partition_stats = {
+                "reused": 0,
+                "computed": int(priorities is not None),
+                "failed": failed + int(priorities is None),
+                "settled": len(settle) - failed
+            }
+        if priorities is None:
+            priorities = {item_type: [] for item_type in PRIORITY_TYPES}
 
-    logger.info(f"Detected {total_priorities} priorities")
+        _stream_remaining(priorities, on_priority, confidence_threshold)
+        total_priorities = _count(priorities)
 
-    if total_priorities == 0:
+        logger.info(f"Detected {total_priorities} priorities")
+
+        # Step 3: Rank, apply confidence threshold and daily cap
+        priorities, ranking_stats = rank_priorities(
+            priorities,
+            confidence_threshold=confidence_threshold,
+            max_priorities=max_priorities,
+            lifelogs=lifelogs
+        )
+
+    kept_priorities = ranking_stats["kept"]
+
+    if kept_priorities < total_priorities:
+        logger.info(
+            f"Kept {kept_priorities}/{total_priorities} priorities "
+            f"({ranking_stats['below_threshold']} below confidence {confidence_threshold:.0%}, "
+            f"{ranking_stats['over_limit']} over the limit of {max_priorities})"
+        )
+
+    if entity_index is not None:
+        entity_index.add_priorities(priorities)
+
+    analysis_errors = claude_connector.usage["errors"] - errors_before
+    if analysis_errors:
+        logger.error(f"{analysis_errors} Claude analyses failed; their lifelogs will be analyzed again")
+
+    if kept_priorities == 0:
         return {
-            "success": True,
-            "message": "No priorities detected in lifelogs",
+            "success": not analysis_errors,
+            "message": (
+                f"Claude analysis failed ({analysis_errors} errors)" if analysis_errors
+                else "No priorities detected in lifelogs" if total_priorities == 0
+                else "No priorities above the confidence threshold"
+            ),
             "priorities": priorities,
-            "stats": {
-                "lifelogs_analyzed": len(lifelogs),
-                "priorities_detected": 0,
+            "stats": _with_run_stats({
+                "lifelogs_analyzed": lifelogs_analyzed,
+                "priorities_detected": total_priorities,
+                "priorities_kept": 0,
+                "filtered_low_confidence": ranking_stats["below_threshold"],
+                "filtered_over_limit": ranking_stats["over_limit"],
+                "tokens": dict(claude_connector.usage),
                 "todos_created": 0
-            }
+            }, resilience, delta_store, partition_stats)
         }
 
-    # Step 3: Create TODOs in Notion
-    todos_created = 0
+    # Step 4: Create TODOs in Notion
+    todos_created = todos_failed = todos_skipped = 0
     notion_url = ""
+    # created, failed or skipped (already has a TODO), by type and title
+    outcomes: Dict[str, Dict[str, str]] = {item_type: {} for item_type in PRIORITY_TYPES}
 
     if not dry_run:
         logger.info("Creating TODOs in Notion...")
-        creation_stats = notion_connector.create_todos_batch(priorities)
+        to_create = priorities
+        if delta_store is not None:
+            to_create, todos_skipped = delta_store.split_created(priorities)
+            if todos_skipped:
+                logger.info(f"Skipping {todos_skipped} priorities that already have a TODO")
+            for item_type in PRIORITY_TYPES:
+                pending = {id(item) for item in to_create[item_type]}
+                for item in priorities.get(item_type, []):
+                    if id(item) not in pending:
+                        outcomes[item_type][item.title] = "skipped"
+
+        creation_stats = await notion_connector.create_todos_batch(to_create, outcomes=outcomes)
         todos_created = creation_stats.get("total", 0)
+        todos_failed = creation_stats.get("failed", 0)
+
+        if delta_store is not None:
+            # Failed items are left unmarked so the next run retries them
+            delta_store.mark_created({
+                item_type: [item for item in items if outcomes[item_type].get(item.title) == "created"]
+                for item_type, items in to_create.items()
+            })
+            delta_store.save()
         notion_url = notion_connector.get_database_url()
         logger.info(f"Created {todos_created} TODOs in Notion")
     else:
         logger.info("DRY-RUN mode: Skipping Notion TODO creation")
 
-    # Step 4: Return results
+    # Step 5: Return results
+    message = (
+        f"Analyzed {lifelogs_analyzed} lifelogs, detected {total_priorities} priorities, "
+        f"kept {kept_priorities}"
+    )
+    if analysis_errors:
+        message = f"Claude analysis failed ({analysis_errors} errors); {message}"
     return {
-        "success": True,
-        "message": f"Analyzed {len(lifelogs)} lifelogs, detected {total_priorities} priorities",
+        "success": not analysis_errors,
+        "message": message,
         "priorities": priorities,
-        "stats": {
-            "lifelogs_analyzed": len(lifelogs),
+        "stats": _with_run_stats({
+            "lifelogs_analyzed": lifelogs_analyzed,
             "priorities_detected": total_priorities,
+            "priorities_kept": kept_priorities,
+            "filtered_low_confidence": ranking_stats["below_threshold"],
+            "filtered_over_limit": ranking_stats["over_limit"],
+            "tokens": dict(claude_connector.usage),
             "todos_created": todos_created,
+            "todos_failed": todos_failed,
+            "todos_skipped": todos_skipped,
             "engagements": len(priorities.get("engagements", [])),
             "demandes": len(priorities.get("demandes", [])),
             "deadlines": len(priorities.get("deadlines", []))
-        },
+        }, resilience, delta_store, partition_stats),
+        "outcomes": outcomes,
         "notion_url": notion_url,
         "dry_run": dry_run
     }
+
+
+def merge_results(
+    cached: Dict[str, Any],
+    delta: Dict[str, Any],
+    period: str = "today",
+    max_priorities_per_day: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Merge a revalidation run into pre-warmed results
+
+    Args:
+        cached: Results saved by the pre-warm run
+        delta: Results of the run over lifelogs recorded since the pre-warm
+        period: Time period (today/week)
+        max_priorities_per_day: Keep only the top-k merged items per day of the period
+
+    Returns:
+        Combined results; `new_priorities` holds the items the delta added
+    """
+    max_priorities = None
+    if max_priorities_per_day:
+        max_priorities = max_priorities_per_day * (1 if period == "today" else 7)
+
+    priorities, added, dropped = merge_ranked(
+        cached.get("priorities", {}),
+        delta.get("priorities", {}),
+        max_priorities=max_priorities
+    )
+
+    old, new = cached.get("stats", {}), delta.get("stats", {})
+
+    def total(key: str) -> int:
+        return old.get(key, 0) + new.get(key, 0)
+
+    stats = {
+        "lifelogs_analyzed": total("lifelogs_analyzed"),
+        "priorities_detected": total("priorities_detected"),
+        "priorities_kept": _count(priorities),
+        "filtered_low_confidence": total("filtered_low_confidence"),
+        "filtered_over_limit": total("filtered_over_limit") + dropped,
+        "todos_created": total("todos_created"),
+        "todos_failed": total("todos_failed"),
+        "todos_skipped": total("todos_skipped"),
+        "engagements": len(priorities["engagements"]),
+        "demandes": len(priorities["demandes"]),
+        "deadlines": len(priorities["deadlines"]),
+        "revalidated_lifelogs": new.get("lifelogs_analyzed", 0)
+    }
+    # Run-level metrics describe the revalidation that just happened
+    for key in ("tokens", "resilience", "peak_rss_mb", "delta", "partitions"):
+        if key in new:
+            stats[key] = new[key]
+
+    return {
+        "success": cached.get("success", False) or delta.get("success", False),
+        "message": (
+            f"Pre-warmed results plus {new.get('lifelogs_analyzed', 0)} new lifelogs, "
+            f"{_count(added)} new priorities"
+        ),
+        "priorities": priorities,
+        "new_priorities": added,
+        "stats": stats,
+        "notion_url": delta.get("notion_url") or cached.get("notion_url", ""),
+        "dry_run": delta.get("dry_run", cached.get("dry_run", False))
+    }
+
+
+def _index_lifelogs(
+    lifelogs: List[Lifelog],
+    search_index,
+    context_snippets: int,
+    entity_index
+) -> List[Dict[str, Any]]:
+    """Add lifelogs to the local indexes; returns related past snippets for the prompt"""
+    context = []
+    if search_index is not None:
+        if context_snippets:
+            context = search_index.related_context(lifelogs, limit=context_snippets)
+        search_index.add_lifelogs(lifelogs)
+    if entity_index is not None:
+        entity_index.add_lifelogs(lifelogs)
+    return context
+
+
+async def _analyze_lifelogs(
+    claude_connector,
+    lifelogs: List[Lifelog],
+    period: str,
+    context: List[Dict[str, Any]],
+    delta_store,
+    on_priority: Optional[Callable[[str, Priority], None]],
+    confidence_threshold: float
+) -> Optional[Dict[str, List[Priority]]]:
+    """
+    Extract the priorities of a set of lifelogs, through the delta store if any
+
+    Returns:
+        Unranked items by type: the newly extracted ones, or with a delta
+        store every item stored for these lifelogs plus the unattributed
+        ones it could not store; None if the analysis failed (nothing is
+        stored, so the lifelogs are sent again on the next run)
+    """
+    logger = logging.getLogger("nexus.priority_detector")
+
+    pending = delta_store.plan(lifelogs) if delta_store is not None else lifelogs
+    if pending:
+        logger.info("Analyzing lifelogs with Claude...")
+        priorities = await _extract_priorities(
+            claude_connector, pending, period, context, on_priority, confidence_threshold
+        )
+    else:
+        logger.info("No new transcript segments since the last run")
+        priorities = {item_type: [] for item_type in PRIORITY_TYPES}
+
+    if delta_store is None or priorities is None:
+        return priorities
+
+    unstored = delta_store.record(pending, lifelogs, priorities)
+    delta_store.save()
+    delta = delta_store.stats
+    logger.info(
+        f"Delta: {delta['new']} new, {delta['appended']} extended, "
+        f"{delta['unchanged']} unchanged lifelogs; sent {delta['chars_sent']}/"
+        f"{delta['chars_total']} transcript characters"
+    )
+    stored = delta_store.priorities(lifelogs)
+    return {item_type: stored[item_type] + unstored[item_type] for item_type in PRIORITY_TYPES}
+
+
+async def _rollup_partitions(
+    limitless_connector,
+    claude_connector,
+    partitions,
+    period: str,
+    days: int,
+    lifelogs: Optional[List[Any]] = None,
+    window_days: Optional[int] = None,
+    delta_store=None,
+    search_index=None,
+    context_snippets: int = 0,
+    entity_index=None,
+    on_priority: Optional[Callable[[str, Priority], None]] = None,
+    confidence_threshold: float = 0.0
+) -> Tuple[int, Dict[str, List[Priority]], List[Lifelog], Dict[str, int]]:
+    """
+    Recompute the missing or stale days of a period, then merge every day
+
+    Lifelogs are fetched from midnight of the oldest stale day only (usually
+    today), split by local day and analyzed day by day. Given lifelogs
+    cover `window_days` days; stale days before them are left as they are.
+
+    Returns:
+        Tuple (lifelogs covered by the period, merged unranked priorities,
+        sources for recency scoring, partition stats)
+    """
+    logger = logging.getLogger("nexus.priority_detector")
+
+    today = date.today()
+    all_days = period_days(days, today)
+    stale = partitions.stale_days(all_days)
+    logger.info(
+        f"Rolling up {period}: {len(all_days) - len(stale)} stored days, "
+        f"{len(stale)} to check"
+    )
+
+    fetched_at = datetime.now()
+    if lifelogs is None:
+        window_days = (today - stale[0]).days + 1 if stale else 0
+        if window_days:
+            logger.info(f"Fetching lifelogs for the last {window_days} days")
+            lifelogs = await limitless_connector.get_window(days=window_days)
+    else:
+        window_days = window_days or days
+        stale = [day for day in stale if (today - day).days < window_days]
+
+    lifelogs = [Lifelog.from_dict(lifelog) for lifelog in lifelogs or []]
+    first = today - timedelta(days=max(window_days, 1) - 1)
+    by_day = group_by_day(lifelogs, first=first, last=today)
+    fetched = [log for day in stale for log in by_day.get(day, [])]
+    context = _index_lifelogs(fetched, search_index, context_snippets, entity_index)
+
+    computed, failed = await _refresh_days(
+        claude_connector, partitions, stale, by_day, period, context,
+        delta_store, on_priority, confidence_threshold, fetched_at
+    )
+
+    priorities, sources, lifelogs_covered = partitions.rollup(all_days)
+    return lifelogs_covered, priorities, sources, {
+        "reused": len(all_days) - computed - failed,
+        "computed": computed,
+        "failed": failed
+    }
+
+
+async def _refresh_days(
+    claude_connector,
+    partitions,
+    days: List[date],
+    by_day: Dict[date, List[Lifelog]],
+    period: str,
+    context: List[Dict[str, Any]],
+    delta_store,
+    on_priority: Optional[Callable[[str, Priority], None]],
+    confidence_threshold: float,
+    fetched_at: datetime
+) -> Tuple[int, int]:
+    """
+    Bring stored days up to date with freshly fetched lifelogs
+
+    A day whose lifelogs are unchanged keeps its partition, which becomes
+    final once the day has settled; the other days are analyzed and stored.
+    A day whose analysis failed keeps its previous partition, if any, not
+    final, so the next run computes it again.
+
+    Returns:
+        Tuple (days analyzed and stored, days whose analysis failed)
+    """
+    changed = [day for day in days if not partitions.matches(day, by_day.get(day, []))]
+    for day in days:
+        if day not in changed:
+            partitions.finalize(day, fetched_at)
+
+    async def compute(day: date) -> Optional[Dict[str, List[Priority]]]:
+        day_lifelogs = by_day.get(day, [])
+        if not day_lifelogs:
+            return {item_type: [] for item_type in PRIORITY_TYPES}
+        return await _analyze_lifelogs(
+            claude_connector, day_lifelogs, period, context, delta_store,
+            on_priority, confidence_threshold
+        )
+
+    found = await asyncio.gather(*(compute(day) for day in changed))
+    failed = 0
+    for day, priorities in zip(changed, found):
+        if priorities is None:
+            failed += 1
+            continue
+        partitions.save(day, priorities, by_day.get(day, []), now=fetched_at)
+    return len(changed) - failed, failed
+
+
+async def _extract_priorities(
+    claude_connector,
+    lifelogs: List[Lifelog],
+    period: str,
+    context: List[Dict[str, Any]],
+    on_priority: Optional[Callable[[str, Priority], None]],
+    confidence_threshold: float
+) -> Optional[Dict[str, List[Priority]]]:
+    """
+    Run Claude on a set of lifelogs, streaming items to on_priority if given
+
+    Returns:
+        Items by type, or None if the connector reported an error meanwhile
+        (another analysis running concurrently may be the one that failed,
+        so a success can be counted as a failure, never the reverse)
+    """
+    errors = claude_connector.usage["errors"]
+    if on_priority is None:
+        priorities = await claude_connector.analyze_priorities(lifelogs, period, context=context)
+        return priorities if claude_connector.usage["errors"] == errors else None
+
+    priorities = {item_type: [] for item_type in PRIORITY_TYPES}
+    async for item_type, item in claude_connector.stream_priorities(
+        lifelogs, period, context=context
+    ):
+        priorities[item_type].append(item)
+        # Streamed items can't be un-sent, so only the threshold applies here;
+        # the top-k cut still decides what reaches Notion
+        if item.confidence >= confidence_threshold:
+            on_priority(item_type, item)
+    return priorities if claude_connector.usage["errors"] == errors else None
+
+
+def _once_per_title(on_priority: Callable[[str, Priority], None]) -> Callable[[str, Priority], None]:
+    """Wrap a streaming callback so each type and title is emitted once per run"""
+    emitted = set()
+
+    def emit(item_type: str, item: Priority):
+        key = (item_type, title_key(item))
+        if key not in emitted:
+            emitted.add(key)
+            on_priority(item_type, item)
+
+    return emit
+
+
+def _stream_remaining(
+    priorities: Dict[str, List[Priority]],
+    on_priority: Optional[Callable[[str, Priority], None]],
+    confidence_threshold: float
+):
+    """Stream the run's items that were not extracted live (stored or reused ones)"""
+    if on_priority is None:
+        return
+    for item_type in PRIORITY_TYPES:
+        for item in priorities.get(item_type, []):
+            if item.confidence >= confidence_threshold:
+                on_priority(item_type, item)
+
+
+async def _analyze_in_chunks(
+    limitless_connector,
+    claude_connector,
+    period: str,
+    days: int,
+    chunk_chars: int,
+    since: Optional[datetime] = None,
+    search_index=None,
+    context_snippets: int = 0,
+    entity_index=None,
+    on_priority: Optional[Callable[[str, Priority], None]] = None,
+    confidence_threshold: float = 0.0,
+    max_priorities: Optional[int] = None
+) -> Tuple[int, Dict[str, List[Priority]], int, Dict[str, int]]:
+    """
+    Analyze lifelogs chunk by chunk as they are parsed from the Limitless response
+
+    Transcripts are released once their chunk is analyzed (only title and
+    date are kept for recency scoring) and the running top-k is trimmed after
+    every chunk, so memory does not grow with the window.
+
+    Returns:
+        Tuple (lifelogs analyzed, ranked priorities, priorities detected, ranking stats)
+    """
+    logger = logging.getLogger("nexus.priority_detector")
+
+    priorities: Dict[str, List[Priority]] = {item_type: [] for item_type in PRIORITY_TYPES}
+    ranking_stats = {"kept": 0, "below_threshold": 0, "over_limit": 0}
+    sources: List[Lifelog] = []
+    chunk: List[Lifelog] = []
+    chunk_size = 0
+    lifelogs_analyzed = 0
+    total_priorities = 0
+
+    async def flush():
+        nonlocal priorities, total_priorities
+
+        context = []
+        if search_index is not None:
+            if context_snippets:
+                context = search_index.related_context(chunk, limit=context_snippets)
+            search_index.add_lifelogs(chunk)
+        if entity_index is not None:
+            entity_index.add_lifelogs(chunk)
+
+        logger.info(f"Analyzing a chunk of {len(chunk)} lifelogs with Claude...")
+        found = await _extract_priorities(
+            claude_connector, chunk, period, context, on_priority, confidence_threshold
+        ) or {}
+        total_priorities += _count(found)
+
+        sources.extend(Lifelog(title=log.title, date=log.date) for log in chunk)
+        chunk.clear()
+
+        merged = {
+            item_type: priorities[item_type] + found.get(item_type, [])
+            for item_type in PRIORITY_TYPES
+        }
+        # Each dropped item is counted once: survivors are above the threshold
+        priorities, stats = rank_priorities(
+            merged,
+            confidence_threshold=confidence_threshold,
+            max_priorities=max_priorities,
+            lifelogs=sources
+        )
+        ranking_stats["kept"] = stats["kept"]
+        ranking_stats["below_threshold"] += stats["below_threshold"]
+        ranking_stats["over_limit"] += stats["over_limit"]
+
+    async for lifelog in limitless_connector.iter_window(days=days, since=since):
+        lifelogs_analyzed += 1
+        lifelog = Lifelog.from_dict(lifelog)
+        chunk.append(lifelog)
+        chunk_size += len(lifelog.transcript)
+        if chunk_size >= chunk_chars:
+            await flush()
+            chunk_size = 0
+
+    if chunk:
+        await flush()
+
+    logger.info(f"Analyzed {lifelogs_analyzed} lifelogs, detected {total_priorities} priorities")
+    return lifelogs_analyzed, priorities, total_priorities, ranking_stats
+
+
+def _count(priorities: Dict[str, List[Priority]]) -> int:
+    """Total number of items across priority types"""
+    return sum(len(priorities.get(item_type, [])) for item_type in PRIORITY_TYPES)
+
+
+def _no_lifelogs_result(resilience) -> Dict[str, Any]:
+    """Result of a run with nothing to analyze"""
+    return {
+        "success": False,
+        "message": "No lifelogs found for this period",
+        "priorities": {"engagements": [], "demandes": [], "deadlines": []},
+        "stats": _with_run_stats({}, resilience)
+    }
+
+
+def _with_run_stats(
+    stats: Dict[str, Any],
+    resilience,
+    delta_store=None,
+    partition_stats: Optional[Dict[str, int]] = None
+) -> Dict[str, Any]:
+    """Attach retry counts, delta and partition savings, wasted time and peak memory to the run stats"""
+    if resilience is not None:
+        stats["resilience"] = resilience.stats()
+    if delta_store is not None:
+        stats["delta"] = dict(delta_store.stats)
+    if partition_stats is not None:
+        stats["partitions"] = partition_stats
+    stats["peak_rss_mb"] = peak_rss_mb()
+    return stats
@@ -0,0 +1,325 @@
+"""
+Append-aware delta analysis
+Remember what was analyzed in each lifelog so later runs only send what was added
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from src.utils import codec
+from src.utils.models import Lifelog, Priority, parse_priorities, priorities_to_dict
+
+from .rank import PRIORITY_TYPES, title_key
+
+
+# Prefix of the entries holding items the model could not tie to one lifelog;
+# each is scoped to the lifelogs analyzed together (see record())
+UNATTRIBUTED = "_unattributed"
+
+
+def segment_hashes(transcript: str) -> List[str]:
+    """Hash of each non-empty transcript line (one speaker turn per line)"""
+    return [
+        hashlib.sha1(" ".join(line.split()).encode('utf-8')).hexdigest()[:16]
+        for line in transcript.splitlines()
+        if line.strip()
+    ]
+
+
+def _segments(transcript: str) -> List[str]:
+    return [line for line in transcript.splitlines() if line.strip()]
+
+
+class LifelogDeltaStore:
+    """Per-lifelog segment hashes and extracted items, persisted between runs"""
+
+    def __init__(
+        self,
+        path: str,
+        template_id: str = "",
+        overlap_segments: int = 3,
+        max_age_days: int = 8
+    ):
+        """
+        Initialize store
+
+        Args:
+            path: JSON file holding the state
+            template_id: Prompt template id; state from another template is discarded
+            overlap_segments: Already-analyzed segments resent as context before new ones
+            max_age_days: Lifelogs not seen for longer are forgotten on save
+        """
+        self.path = Path(path)
+        self.template_id = template_id
+        self.overlap_segments = overlap_segments
+        self.max_age_days = max_age_days
+        self.logger = logging.getLogger("nexus.priority_detector.delta")
+        self.stats = {"unchanged": 0, "appended": 0, "new": 0, "chars_sent": 0, "chars_total": 0}
+        self._lifelogs: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = codec.read_json(self.path)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable delta state {self.path}: {e}")
+            return
+
+        if data.get("template") != self.template_id:
+            self.logger.info("Prompt template changed, re-analyzing lifelogs in full")
+            return
+        self._lifelogs = data.get("lifelogs", {})
+        legacy = self._lifelogs.get(UNATTRIBUTED)
+        if legacy is not None:
+            # Unscoped items from older states can't be tied back to their lifelogs
+            legacy["items"] = {}
+        for entry in self._lifelogs.values():
+            entry["items"] = parse_priorities(entry.get("items", {}))
+
+    def save(self):
+        """Write the state, dropping lifelogs not seen recently and items of forgotten lifelogs"""
+        cutoff = (datetime.now() - timedelta(days=self.max_age_days)).isoformat()
+        self._lifelogs = {
+            key: entry for key, entry in self._lifelogs.items()
+            if entry.get("scope") or entry.get("seen_at", "") >= cutoff
+        }
+        # Unattributed items live as long as the lifelogs they came from
+        self._lifelogs = {
+            key: entry for key, entry in self._lifelogs.items()
+            if not entry.get("scope") or all(log_id in self._lifelogs for log_id in entry["scope"])
+        }
+
+        codec.write_json(self.path, {
+            "template": self.template_id,
+            "lifelogs": {
+                key: {**entry, "items": priorities_to_dict(entry.get("items", {}))}
+                for key, entry in self._lifelogs.items()
+            }
+        })
+
+    def plan(self, lifelogs: List[Lifelog]) -> List[Lifelog]:
+        """
+        Decide what each lifelog still needs analyzed
+
+        A lifelog whose stored segments are a prefix of its current ones was
+        only extended: just the new segments are sent, after the last
+        `overlap_segments` already analyzed ones as context. Lifelogs with
+        no id, not seen before or edited in place are sent in full.
+
+        Args:
+            lifelogs: Lifelogs of the run
+
+        Returns:
+            Lifelogs to analyze; extended ones carry only their new segments in
+            `transcript` and the context in `overlap`
+        """
+        pending = []
+        for lifelog in lifelogs:
+            transcript = lifelog.transcript
+            self.stats["chars_total"] += len(transcript)
+            entry = self._lifelogs.get(lifelog.id) if lifelog.id else None
+
+            if entry is None:
+                self.stats["new"] += 1
+                self.stats["chars_sent"] += len(transcript)
+                pending.append(lifelog)
+                continue
+
+            hashes = segment_hashes(transcript)
+            known = entry["segments"]
+            entry["seen_at"] = datetime.now().isoformat()
+
+            if hashes == known:
+                self.stats["unchanged"] += 1
+            elif hashes[:len(known)] == known:
+                segments = _segments(transcript)
+                delta = lifelog.with_transcript(
+                    "\n".join(segments[len(known):]),
+                    overlap="\n".join(segments[max(0, len(known) - self.overlap_segments):len(known)])
+                )
+                self.stats["appended"] += 1
+                self.stats["chars_sent"] += len(delta.transcript) + len(delta.overlap)
+                pending.append(delta)
+            else:
+                # Edited in place: previous items may no longer hold
+                self.stats["new"] += 1
+                self.stats["chars_sent"] += len(transcript)
+                pending.append(lifelog)
+
+        return pending
+
+    def record(
+        self,
+        analyzed: List[Lifelog],
+        lifelogs: List[Lifelog],
+        priorities: Dict[str, List[Priority]]
+    ) -> Dict[str, List[Priority]]:
+        """
+        Store the items extracted from analyzed lifelogs
+
+        Items are attributed through their `lifelog_id`. Items of an extended
+        lifelog are merged with the ones stored for it (same title and type
+        counts once); a lifelog analyzed in full replaces its items.
+
+        Items tied to none of the analyzed lifelogs are stored in an entry
+        scoped to the lifelogs sent together, and only returned with all of
+        them. They are not stored if one of those lifelogs has no id (it will
+        be sent in full again).
+
+        Args:
+            analyzed: Lifelogs returned by plan() and sent to the model
+            lifelogs: Full lifelogs of the run (for the new segment hashes)
+            priorities: Items extracted from `analyzed`
+
+        Returns:
+            Unattributed items that were not stored, by type
+        """
+        by_id = {log.id: log for log in lifelogs if log.id}
+        analyzed_ids = {log.id for log in analyzed if log.id}
+        extended = {log.id for log in analyzed if log.id and log.overlap is not None}
+        titles = {log.id: log.title for log in analyzed if log.id}
+
+        found: Dict[str, Dict[str, List[Priority]]] = {}
+        unattributed: Dict[str, List[Priority]] = {t: [] for t in PRIORITY_TYPES}
+        for item_type in PRIORITY_TYPES:
+            for item in priorities.get(item_type, []):
+                key = item.lifelog_id or ""
+                if key not in analyzed_ids:
+                    # Fall back to the lifelog named in the source
+                    matches = [i for i, title in titles.items() if title and title in item.source]
+                    key = matches[0] if len(matches) == 1 else (
+                        next(iter(analyzed_ids)) if len(analyzed) == 1 and analyzed_ids else None
+                    )
+                if key is None:
+                    unattributed[item_type].append(item)
+                    continue
+                item.lifelog_id = key
+                found.setdefault(key, {t: [] for t in PRIORITY_TYPES})[item_type].append(item)
+
+        now = datetime.now().isoformat()
+        for key in analyzed_ids:
+            entry = self._lifelogs.get(key, {})
+            items = found.get(key, {t: [] for t in PRIORITY_TYPES})
+            if key in extended:
+                items = self._merge(entry.get("items", {}), items)
+
+            self._lifelogs[key] = {
+                "segments": segment_hashes(by_id[key].transcript) if key in by_id else [],
+                "items": items,
+                # TODO markers outlive re-analysis so edits don't duplicate TODOs
+                "created": entry.get("created", []),
+                "seen_at": now
+            }
+
+        if not any(unattributed.values()) or len(analyzed_ids) < len(analyzed):
+            return unattributed
+
+        scope = sorted(analyzed_ids)
+        key = f"{UNATTRIBUTED}:{hashlib.sha1(','.join(scope).encode('utf-8')).hexdigest()[:16]}"
+        entry = self._lifelogs.get(key, {})
+        self._lifelogs[key] = {
+            "scope": scope,
+            "items": self._merge(entry.get("items", {}), unattributed),
+            "created": entry.get("created", []),
+            "seen_at": now
+        }
+        return {t: [] for t in PRIORITY_TYPES}
+
+    def priorities(self, lifelogs: List[Lifelog]) -> Dict[str, List[Priority]]:
+        """
+        All items stored for a set of lifelogs
+
+        Unattributed items are included when every lifelog they were
+        extracted from is part of the set.
+
+        Args:
+            lifelogs: Lifelogs of the run
+
+        Returns:
+            Items by type
+        """
+        ids = {log.id for log in lifelogs if log.id}
+        keys = [log.id for log in lifelogs if log.id] + [
+            key for key, entry in self._lifelogs.items()
+            if entry.get("scope") and set(entry["scope"]) <= ids
+        ]
+        merged: Dict[str, List[Priority]] = {item_type: [] for item_type in PRIORITY_TYPES}
+        for key in dict.fromkeys(keys):
+            items = self._lifelogs.get(key, {}).get("items", {})
+            for item_type in PRIORITY_TYPES:
+                merged[item_type].extend(items.get(item_type, []))
+        return merged
+
+    def split_created(
+        self,
+        priorities: Dict[str, List[Priority]]
+    ) -> Tuple[Dict[str, List[Priority]], int]:
+        """
+        Drop items that already have a Notion TODO
+
+        Args:
+            priorities: Ranked items by type
+
+        Returns:
+            Tuple (items without a TODO yet, number of items skipped)
+        """
+        created = {marker for entry in self._lifelogs.values() for marker in entry.get("created", [])}
+        pending: Dict[str, List[Priority]] = {item_type: [] for item_type in PRIORITY_TYPES}
+        skipped = 0
+        for item_type in PRIORITY_TYPES:
+            for item in priorities.get(item_type, []):
+                if f"{item_type}:{title_key(item)}" in created:
+                    skipped += 1
+                else:
+                    pending[item_type].append(item)
+        return pending, skipped
+
+    def mark_created(self, priorities: Dict[str, List[Priority]]):
+        """
+        Remember that these items now have a Notion TODO
+
+        The marker goes with the entry holding the item: its lifelog, else the
+        unattributed entry storing it. Items stored nowhere (from lifelogs
+        without id) get a marker-only entry, so their TODO is not created again.
+        """
+        for item_type in PRIORITY_TYPES:
+            for item in priorities.get(item_type, []):
+                marker = f"{item_type}:{title_key(item)}"
+                entry = self._lifelogs.get(item.lifelog_id or "") or self._holder(item_type, item)
+                if marker not in entry.setdefault("created", []):
+                    entry["created"].append(marker)
+
+    def _holder(self, item_type: str, item: Priority) -> Dict[str, Any]:
+        """Unattributed entry storing an item, or the marker-only entry"""
+        key = title_key(item)
+        for entry in self._lifelogs.values():
+            if entry.get("scope") and any(
+                title_key(stored) == key for stored in entry["items"].get(item_type, [])
+            ):
+                return entry
+        # Holds no items, only TODO markers
+        entry = self._lifelogs.setdefault(UNATTRIBUTED, {"items": {}, "created": []})
+        entry["seen_at"] = datetime.now().isoformat()
+        return entry
+
+    @staticmethod
+    def _merge(
+        stored: Dict[str, List[Priority]],
+        found: Dict[str, List[Priority]]
+    ) -> Dict[str, List[Priority]]:
+        """Stored items followed by new ones not already known by title"""
+        merged = {}
+        for item_type in PRIORITY_TYPES:
+            items = list(stored.get(item_type, []))
+            known = {title_key(item) for item in items}
+            for item in found.get(item_type, []):
+                if title_key(item) not in known:
+                    known.add(title_key(item))
+                    items.append(item)
+            merged[item_type] = items
+        return merged
@@ -0,0 +1,308 @@
+"""
+Prompt evaluation
+Run prompt variants over a labeled corpus and compare precision, recall, tokens and latency
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Set
+
+from src.connectors import ClaudeConnector
+from src.utils.models import PRIORITY_TYPES
+from src.utils.prompts import PromptTemplate
+from src.utils.text import tokenize
+
+# Minimum title similarity for a predicted item to match an expected one
+MATCH_THRESHOLD = 0.5
+
+CHARS_PER_TOKEN = 4
+
+
+logger = logging.getLogger("nexus.evaluate")
+
+
+def load_corpus(path: str) -> List[Dict[str, Any]]:
+    """
+    Load a labeled corpus
+
+    Each JSONL line is a lifelog (`id`, `title`, `date`, `transcript`) plus
+    `expected`: {engagements: [titles], demandes: [...], deadlines: [...]}.
+
+    Args:
+        path: JSONL corpus file
+
+    Returns:
+        List of samples
+    """
+    samples = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                samples.append(json.loads(line))
+    return samples
+
+
+def title_similarity(a: str, b: str) -> float:
+    """Jaccard similarity of the stemmed, accent-folded title tokens"""
+    tokens_a: Set[str] = set(tokenize(a))
+    tokens_b: Set[str] = set(tokenize(b))
+    if not tokens_a or not tokens_b:
+        return 0.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+
+def count_matches(predicted: List[str], expected: List[str], threshold: float = MATCH_THRESHOLD) -> int:
+    """
+    Count predicted titles matching a distinct expected title
+
+    Args:
+        predicted: Titles extracted by the model
+        expected: Labeled titles
+        threshold: Minimum similarity for a match
+
+    Returns:
+        Number of true positives (greedy, best pairs first)
+    """
+    pairs = sorted(
+        (
+            (title_similarity(p, e), i, j)
+            for i, p in enumerate(predicted)
+            for j, e in enumerate(expected)
+        ),
+        reverse=True
+    )
+
+    used_predicted, used_expected = set(), set()
+    for similarity, i, j in pairs:
+        if similarity < threshold:
+            break
+        if i in used_predicted or j in used_expected:
+            continue
+        used_predicted.add(i)
+        used_expected.add(j)
+
+    return len(used_predicted)
+
+
+class StubClient:
+    """Stand-in for AsyncAnthropic returning a canned response text"""
+
+    def __init__(self, text: str):
+        self.messages = SimpleNamespace(create=self._create)
+        self._text = text
+
+    async def _create(self, model: str, max_tokens: int, messages: List[Dict[str, Any]]):
+        """Return the canned text with estimated token usage"""
+        prompt = messages[0]["content"]
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=self._text)],
+            usage=SimpleNamespace(
+                input_tokens=len(prompt) // CHARS_PER_TOKEN,
+                output_tokens=len(self._text) // CHARS_PER_TOKEN
+            )
+        )
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def evaluate_variant(
+    template: PromptTemplate,
+    corpus: List[Dict[str, Any]],
+    make_connector: Callable[[PromptTemplate, Dict[str, Any]], ClaudeConnector]
+) -> Dict[str, Any]:
+    """
+    Evaluate one prompt variant
+
+    Args:
+        template: Prompt template under test
+        corpus: Labeled samples
+        make_connector: Builds the Claude connector used for a sample
+
+    Returns:
+        Metrics for the variant; `errors` counts samples whose analysis failed
+        (request error or unreadable response)
+    """
+    true_positives = predicted_total = expected_total = 0
+    input_tokens = output_tokens = errors = 0
+    latencies = []
+
+    for sample in corpus:
+        connector = make_connector(template, sample)
+        before = dict(connector.usage)
+
+        started = time.perf_counter()
+        priorities = await connector.analyze_priorities([sample], period="today")
+        latencies.append((time.perf_counter() - started) * 1000)
+
+        input_tokens += connector.usage["input_tokens"] - before["input_tokens"]
+        output_tokens += connector.usage["output_tokens"] - before["output_tokens"]
+        if connector.usage["errors"] > before["errors"]:
+            errors += 1
+
+        expected = sample.get("expected", {})
+        for item_type in PRIORITY_TYPES:
+            predicted_titles = [item.title for item in priorities.get(item_type, [])]
+            expected_titles = expected.get(item_type, [])
+            true_positives += count_matches(predicted_titles, expected_titles)
+            predicted_total += len(predicted_titles)
+            expected_total += len(expected_titles)
+
+    return {
+        "variant": template.name,
+        "template_id": template.id,
+        "samples": len(corpus),
+        "true_positives": true_positives,
+        "predicted": predicted_total,
+        "expected": expected_total,
+        "errors": errors,
+        # No prediction means no false positive; evaluate_prompts still rejects
+        # a variant that predicts nothing while items are expected
+        "precision": round(true_positives / predicted_total, 3) if predicted_total else 1.0,
+        "recall": round(true_positives / expected_total, 3) if expected_total else 1.0,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "latency_ms_avg": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+        "latency_ms_p95": round(_percentile(latencies, 0.95), 1)
+    }
+
+
+async def evaluate_prompts(
+    corpus: List[Dict[str, Any]],
+    templates: List[PromptTemplate],
+    make_connector: Callable[[PromptTemplate, Dict[str, Any]], ClaudeConnector],
+    min_precision: float = 0.9,
+    min_recall: float = 0.5
+) -> Dict[str, Any]:
+    """
+    Evaluate prompt variants and recommend one
+
+    Args:
+        corpus: Labeled samples
+        templates: Prompt variants to compare
+        make_connector: Builds the Claude connector used for a sample
+        min_precision: Precision target a variant must reach
+        min_recall: Recall target a variant must reach
+
+    Returns:
+        Dictionary with per-variant metrics (each with `passed`) and the
+        recommended variant (cheapest in input tokens among those passing)
+    """
+    variants = []
+    for template in templates:
+        logger.info(f"Evaluating {template.id} on {len(corpus)} samples")
+        variant = await evaluate_variant(template, corpus, make_connector)
+        variant["passed"] = _passes(variant, min_precision, min_recall)
+        variants.append(variant)
+
+    eligible = [v for v in variants if v["passed"]]
+    recommended = min(eligible, key=lambda v: (v["input_tokens"], -v["recall"])) if eligible else None
+
+    return {
+        "min_precision": min_precision,
+        "min_recall": min_recall,
+        "variants": variants,
+        "recommended": recommended["variant"] if recommended else None
+    }
+
+
+def _passes(variant: Dict[str, Any], min_precision: float, min_recall: float) -> bool:
+    """
+    Tell whether a variant reaches the targets
+
+    A variant with failed analyses, or predicting nothing while items are
+    expected, fails whatever its scores: its precision and token counts are
+    not comparable.
+    """
+    if variant["errors"]:
+        return False
+    if variant["expected"] and not variant["predicted"]:
+        return False
+    return variant["precision"] >= min_precision and variant["recall"] >= min_recall
+
+
+def load_stubs(path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Load canned responses
+
+    Args:
+        path: JSON file mapping variant name -> sample id -> response text
+
+    Returns:
+        Responses by variant and sample id
+    """
+    with open(Path(path), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def stub_connector_factory(
+    stubs: Dict[str, Dict[str, str]],
+    model: str
+) -> Callable[[PromptTemplate, Dict[str, Any]], ClaudeConnector]:
+    """
+    Build connectors answering from canned responses (no network)
+
+    Args:
+        stubs: Responses by variant and sample id
+        model: Model name reported in requests
+
+    Returns:
+        Connector factory for evaluate_prompts
+    """
+    def make_connector(template: PromptTemplate, sample: Dict[str, Any]) -> ClaudeConnector:
+        text = stubs.get(template.name, {}).get(sample.get("id"), "{}")
+        return ClaudeConnector(
+            api_key="stub",
+            model=model,
+            client=StubClient(text),
+            prompt_template=template
+        )
+
+    return make_connector
+
+
+def format_evaluation_markdown(report: Dict[str, Any]) -> str:
+    """
+    Format an evaluation report as markdown
+
+    Args:
+        report: Output of evaluate_prompts
+
+    Returns:
+        Markdown table with one row per variant
+    """
+    lines = [
+        "## 🧪 Évaluation des prompts",
+        "",
+        "| Variante | Précision | Rappel | Erreurs | Tokens entrée | Tokens sortie | Latence moy. | p95 | Objectif |",
+        "|---|---|---|---|---|---|---|---|---|"
+    ]
+
+    for v in report["variants"]:
+        lines.append(
+            f"| {v['template_id']} | {v['precision']:.0%} | {v['recall']:.0%} | {v['errors']} | "
+            f"{v['input_tokens']} | {v['output_tokens']} | "
+            f"{v['latency_ms_avg']:.0f} ms | {v['latency_ms_p95']:.0f} ms | "
+            f"{'✅' if v['passed'] else '❌'} |"
+        )
+
+    targets = (
+        f"précision ≥ {report['min_precision']:.0%}, rappel ≥ {report['min_recall']:.0%}, sans erreur"
+    )
+    lines.append("")
+    if report["recommended"]:
+        lines.append(f"✅ Recommandée : **{report['recommended']}** ({targets}, moins de tokens)")
+    else:
+        lines.append(f"⚠️  Aucune variante n'atteint l'objectif ({targets})")
+
+    return "\n".join(lines)
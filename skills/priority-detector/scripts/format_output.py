@@ -3,23 +3,42 @@ Output formatting for priorities
 Generate markdown reports
 """
 
-from typing import Dict, List, Any
+import json
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime
 
+from src.utils import codec
+from src.utils.models import Priority, priorities_to_dict
 
-def format_priorities_markdown(
+
+# Singular record kind for each priorities key
+PRIORITY_KINDS = {
+    "engagements": "engagement",
+    "demandes": "demande",
+    "deadlines": "deadline"
+}
+
+# Markdown section of each priorities key, in report order
+SECTION_TITLES = {
+    "engagements": "Engagements pris",
+    "demandes": "Demandes reçues",
+    "deadlines": "Deadlines"
+}
+
+
+def iter_priorities_markdown(
     results: Dict[str, Any],
     period: str = "today"
-) -> str:
+) -> Iterator[str]:
     """
-    Format priorities as markdown
+    Generate the markdown report line by line
 
     Args:
         results: Results from analyze_priorities
         period: Time period (today/week)
 
-    Returns:
-        Formatted markdown string
+    Yields:
+        Markdown lines
     """
     priorities = results.get("priorities", {})
     stats = results.get("stats", {})
@@ -35,95 +54,149 @@ def format_priorities_markdown(
         title = f"Priorités de la semaine - {date_str}"
 
     # Build markdown
-    lines = [
-        f"## 🎯 {title}",
-        ""
-    ]
-
-    # Engagements
-    engagements = priorities.get("engagements", [])
-    if engagements:
-        lines.append("### Engagements pris")
-        for item in engagements:
-            title_text = item.get("title", "Sans titre")
-            source = item.get("source", "")
-            confidence = item.get("confidence", 1.0)
-
-            line = f"- [ ] {title_text}"
-            if source:
-                line += f" ({source})"
-            if confidence < 0.9:
-                line += f" [confiance: {confidence:.0%}]"
-
-            lines.append(line)
-        lines.append("")
-
-    # Demandes
-    demandes = priorities.get("demandes", [])
-    if demandes:
-        lines.append("### Demandes reçues")
-        for item in demandes:
-            title_text = item.get("title", "Sans titre")
-            source = item.get("source", "")
-            confidence = item.get("confidence", 1.0)
-
-            line = f"- [ ] {title_text}"
-            if source:
-                line += f" ({source})"
-            if confidence < 0.9:
-                line += f" [confiance: {confidence:.0%}]"
-
-            lines.append(line)
-        lines.append("")
-
-    # Deadlines
-    deadlines = priorities.get("deadlines", [])
-    if deadlines:
-        lines.append("### Deadlines")
-        for item in deadlines:
-            title_text = item.get("title", "Sans titre")
-            date_str = item.get("date", "")
-            source = item.get("source", "")
-            confidence = item.get("confidence", 1.0)
-
-            line = f"- [ ] {title_text}"
-            if date_str:
-                line += f" (deadline: {date_str})"
-            if source:
-                line += f" [{source}]"
-            if confidence < 0.9:
-                line += f" [confiance: {confidence:.0%}]"
-
-            lines.append(line)
-        lines.append("")
+    yield f"## 🎯 {title}"
+    yield ""
+
+    for item_type, heading in SECTION_TITLES.items():
+        items = priorities.get(item_type, [])
+        if not items:
+            continue
+
+        yield f"### {heading}"
+        for item in items:
+            line = f"- [ ] {item.title}"
+            if item_type == "deadlines":
+                if item.date:
+                    line += f" (deadline: {item.date})"
+                if item.source:
+                    line += f" [{item.source}]"
+            elif item.source:
+                line += f" ({item.source})"
+            if item.confidence < 0.9:
+                line += f" [confiance: {item.confidence:.0%}]"
+
+            yield line
+        yield ""
 
     # Stats
-    lines.append("---")
-    lines.append("")
+    yield "---"
+    yield ""
 
-    total = stats.get("priorities_detected", 0)
+    total = stats.get("priorities_kept", stats.get("priorities_detected", 0))
     if total == 0:
-        lines.append("✅ Aucune priorité détectée pour cette période")
+        yield "✅ Aucune priorité détectée pour cette période"
     else:
         if dry_run:
-            lines.append(f"🔍 DRY-RUN : {total} priorités détectées (non créées dans Notion)")
+            yield f"🔍 DRY-RUN : {total} priorités détectées (non créées dans Notion)"
         else:
             created = stats.get("todos_created", 0)
-            lines.append(f"✅ {created} TODOs créés dans Notion")
+            yield f"✅ {created} TODOs créés dans Notion"
+            if stats.get("todos_failed"):
+                yield f"⚠️  {stats['todos_failed']} TODOs non créés (échec Notion)"
 
             if notion_url:
-                lines.append(f"🔗 Voir dans Notion : {notion_url}")
+                yield f"🔗 Voir dans Notion : {notion_url}"
 
-    lines.append("")
+    yield ""
 
     # Debug stats
     lifelogs = stats.get("lifelogs_analyzed", 0)
-    lines.append(f"📊 Statistiques : {lifelogs} lifelogs analysés")
+    yield f"📊 Statistiques : {lifelogs} lifelogs analysés"
 
-    return "\n".join(lines)
+    filtered = stats.get("filtered_low_confidence", 0) + stats.get("filtered_over_limit", 0)
+    if filtered:
+        yield (
+            f"🧹 {filtered} priorités écartées "
+            f"({stats.get('filtered_low_confidence', 0)} sous le seuil de confiance, "
+            f"{stats.get('filtered_over_limit', 0)} au-delà de la limite)"
+        )
+
+    tokens = stats.get("tokens", {})
+    if tokens.get("calls"):
+        yield (
+            f"🧮 Tokens : {tokens.get('input_tokens', 0)} en entrée, "
+            f"{tokens.get('output_tokens', 0)} en sortie"
+        )
+
+    delta = stats.get("delta", {})
+    if delta.get("unchanged") or delta.get("appended"):
+        yield (
+            f"♻️  Delta : {delta.get('unchanged', 0)} lifelogs inchangés, "
+            f"{delta.get('appended', 0)} prolongés, {delta.get('new', 0)} nouveaux "
+            f"({delta.get('chars_sent', 0)}/{delta.get('chars_total', 0)} caractères envoyés)"
+        )
+
+    partitions = stats.get("partitions", {})
+    if partitions.get("reused"):
+        yield (
+            f"🗓️  Partitions : {partitions['reused']} jours repris, "
+            f"{partitions.get('computed', 0)} recalculés"
+        )
+    elif partitions.get("settled"):
+        yield f"🗓️  Partitions : {partitions['settled']} jours précédents vérifiés"
+    if partitions.get("failed"):
+        yield f"⚠️  Partitions : {partitions['failed']} jours en échec, recalculés au prochain run"
+
+    if stats.get("peak_rss_mb"):
+        yield f"💾 Mémoire max : {stats['peak_rss_mb']:.0f} Mo"
+
+    resilience = stats.get("resilience", {})
+    if resilience.get("retries") or resilience.get("failures"):
+        yield (
+            f"🔁 Résilience : {resilience.get('retries', 0)} retries, "
+            f"{resilience.get('failures', 0)} échecs, "
+            f"{resilience.get('wasted_seconds', 0):.1f}s perdues"
+        )
+    if resilience.get("open_circuits"):
+        yield f"⛔ Services indisponibles : {', '.join(resilience['open_circuits'])}"
+
+
+def format_priorities_markdown(
+    results: Dict[str, Any],
+    period: str = "today"
+) -> str:
+    """
+    Format priorities as markdown
+
+    Args:
+        results: Results from analyze_priorities
+        period: Time period (today/week)
+
+    Returns:
+        Formatted markdown string
+    """
+    return "\n".join(iter_priorities_markdown(results, period))
+
+
+def iter_new_priorities_markdown(
+    new_priorities: Dict[str, List[Priority]],
+    since: datetime
+) -> Iterator[str]:
+    """
+    Generate the markdown for priorities found after a pre-warmed report
+
+    Args:
+        new_priorities: Items added by the revalidation, by type
+        since: End of the pre-warmed window
+
+    Yields:
+        Markdown lines
+    """
+    total = sum(len(items) for items in new_priorities.values())
+    if total == 0:
+        yield f"🔄 Aucune nouvelle priorité depuis {since:%H:%M}"
+        return
+
+    yield f"### 🔄 Nouveau depuis {since:%H:%M}"
+    for item_type, items in new_priorities.items():
+        for item in items:
+            line = f"- [ ] {item.title} ({PRIORITY_KINDS.get(item_type, item_type)})"
+            if item.date:
+                line += f" (deadline: {item.date})"
+            yield line
 
 
-def format_simple_list(priorities: Dict[str, List[Dict[str, Any]]]) -> str:
+def format_simple_list(priorities: Dict[str, List[Priority]]) -> str:
     """
     Format priorities as simple list (for debugging)
 
@@ -147,3 +220,111 @@ def format_simple_list(priorities: Dict[str, List[Dict[str, Any]]]) -> str:
     lines.append(f"  - Deadlines: {len(priorities.get('deadlines', []))}")
 
     return "\n".join(lines)
+
+
+def format_priority_record(
+    item_type: str,
+    item: Priority,
+    profile: Optional[str] = None
+) -> str:
+    """
+    Format one priority as an NDJSON line
+
+    Args:
+        item_type: Priorities key (engagements/demandes/deadlines)
+        item: Priority item
+        profile: Profile name for multi-profile runs
+
+    Returns:
+        Single-line JSON record
+    """
+    record = {"type": "priority", "kind": PRIORITY_KINDS.get(item_type, item_type)}
+    if profile:
+        record["profile"] = profile
+    record.update(item.to_dict())
+    return codec.dumps(record)
+
+
+def format_stats_record(
+    results: Dict[str, Any],
+    period: str = "today",
+    elapsed: Optional[float] = None,
+    profile: Optional[str] = None
+) -> str:
+    """
+    Format the final run summary as an NDJSON line
+
+    Args:
+        results: Results from analyze_priorities
+        period: Time period (today/week)
+        elapsed: Execution time in seconds
+        profile: Profile name for multi-profile runs
+
+    Returns:
+        Single-line JSON record
+    """
+    record = {
+        "type": "stats",
+        "period": period,
+        "success": results.get("success", False),
+        "message": results.get("message", ""),
+        "dry_run": results.get("dry_run", False),
+        "notion_url": results.get("notion_url", ""),
+        "stats": results.get("stats", {})
+    }
+    if profile:
+        record["profile"] = profile
+    if elapsed is not None:
+        record["elapsed_seconds"] = round(elapsed, 3)
+    return codec.dumps(record)
+
+
+def iter_priorities_json(
+    results: Dict[str, Any],
+    period: str = "today",
+    elapsed: Optional[float] = None
+) -> Iterator[str]:
+    """
+    Encode the full results as one JSON document, piece by piece
+
+    Args:
+        results: Results from analyze_priorities
+        period: Time period (today/week)
+        elapsed: Execution time in seconds
+
+    Yields:
+        Chunks of the indented JSON document
+    """
+    document = {
+        "period": period,
+        "success": results.get("success", False),
+        "message": results.get("message", ""),
+        "dry_run": results.get("dry_run", False),
+        "notion_url": results.get("notion_url", ""),
+        "priorities": priorities_to_dict(results.get("priorities", {})),
+        "stats": results.get("stats", {})
+    }
+    if elapsed is not None:
+        document["elapsed_seconds"] = round(elapsed, 3)
+    # The standard encoder streams an indented document chunk by chunk
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=2, default=str)
+    return encoder.iterencode(document)
+
+
+def format_priorities_json(
+    results: Dict[str, Any],
+    period: str = "today",
+    elapsed: Optional[float] = None
+) -> str:
+    """
+    Format the full results as one JSON document
+
+    Args:
+        results: Results from analyze_priorities
+        period: Time period (today/week)
+        elapsed: Execution time in seconds
+
+    Returns:
+        Indented JSON string
+    """
+    return "".join(iter_priorities_json(results, period, elapsed))
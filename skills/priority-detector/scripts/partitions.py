@@ -0,0 +1,301 @@
+"""
+Daily partitions
+Store each calendar day's priorities so longer periods are rolled up from them
+"""
+
+import hashlib
+import logging
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils import codec
+from src.utils.models import Lifelog, Priority, local_day, parse_priorities, priorities_to_dict
+from src.utils.search_index import lifelog_id
+
+from .rank import PRIORITY_TYPES, title_key
+
+
+def period_days(days: int, today: Optional[date] = None) -> List[date]:
+    """
+    Calendar days of a period ending today
+
+    Args:
+        days: Number of days (1 = today only)
+        today: Last day (defaults to today)
+
+    Returns:
+        Days, oldest first
+    """
+    today = today or date.today()
+    return [today - timedelta(days=offset) for offset in reversed(range(days))]
+
+
+def group_by_day(lifelogs: Iterable[Lifelog], first: date, last: date) -> Dict[date, List[Lifelog]]:
+    """
+    Split the lifelogs of a fetch window by the local day they were recorded
+
+    The window is what Limitless returned for these days, so lifelogs dated
+    outside it (started before midnight, unreadable date) are kept in its
+    first or last day, as a single-day run would.
+
+    Args:
+        lifelogs: Lifelogs fetched from midnight of `first`
+        first: First day of the window
+        last: Last day of the window (today)
+
+    Returns:
+        Lifelogs by day
+    """
+    grouped: Dict[date, List[Lifelog]] = {}
+    for lifelog in lifelogs:
+        day = min(max(local_day(lifelog.date) or last, first), last)
+        grouped.setdefault(day, []).append(lifelog)
+    return grouped
+
+
+def _digest(lifelog: Lifelog) -> str:
+    """Fingerprint of a lifelog's transcript, to tell whether it changed since stored"""
+    return hashlib.sha1(lifelog.transcript.encode('utf-8')).hexdigest()[:16]
+
+
+class DailyPartitionStore:
+    """One JSON file of extracted priorities per local calendar day"""
+
+    def __init__(
+        self,
+        path: str,
+        template_id: str = "",
+        settle_hours: float = 1.0,
+        retention_days: int = 35
+    ):
+        """
+        Initialize store
+
+        Args:
+            path: Directory holding one file per day
+            template_id: Prompt template id; partitions from another template are stale
+            settle_hours: Time after midnight for late uploads to reach Limitless;
+                a partition whose lifelogs were fetched later than that is final
+            retention_days: Partitions older than this are deleted on save
+        """
+        self.path = Path(path)
+        self.template_id = template_id
+        self.settle_hours = settle_hours
+        self.retention_days = retention_days
+        self.logger = logging.getLogger("nexus.priority_detector.partitions")
+
+    def _file(self, day: date) -> Path:
+        return self.path / f"{day.isoformat()}.json"
+
+    def load(self, day: date) -> Optional[Dict[str, Any]]:
+        """
+        Load a day's partition
+
+        Args:
+            day: Calendar day
+
+        Returns:
+            Partition with `priorities` (Priority items by type), `sources`
+            (Lifelog id, title and date), `digests` (transcript fingerprint by
+            lifelog id), `computed_at` and `final`; None if missing, unreadable
+            or made with another prompt template
+        """
+        target = self._file(day)
+        if not target.exists():
+            return None
+
+        try:
+            partition = codec.read_json(target)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable partition {target}: {e}")
+            return None
+
+        if partition.get("template") != self.template_id:
+            return None
+
+        partition["priorities"] = parse_priorities(partition.get("priorities", {}))
+        partition["sources"] = [Lifelog.from_dict(source) for source in partition.get("sources", [])]
+        return partition
+
+    def settled_at(self, day: date) -> datetime:
+        """Time after which no more lifelogs are expected for a day"""
+        return datetime.combine(day + timedelta(days=1), time.min) + timedelta(hours=self.settle_hours)
+
+    def stale_days(self, days: List[date]) -> List[date]:
+        """
+        Days whose partition must be checked against fresh lifelogs
+
+        A partition is stale if missing, made with another prompt template, or
+        not final: its lifelogs were fetched before the day was over (plus the
+        settle delay), so some may have been recorded or extended since.
+        Today is therefore always stale.
+
+        Args:
+            days: Days of the period
+
+        Returns:
+            Stale days, oldest first
+        """
+        stale = []
+        for day in days:
+            partition = self.load(day)
+            if partition is None or not partition.get("final"):
+                stale.append(day)
+        return stale
+
+    def unsettled_days(self, days: List[date], now: Optional[datetime] = None) -> List[date]:
+        """
+        Stored days that are over but were computed before they settled
+
+        Refetching their lifelogs once is enough to make them final.
+
+        Args:
+            days: Days to check
+            now: Reference time (defaults to now)
+
+        Returns:
+            Days, oldest first
+        """
+        now = now or datetime.now()
+        unsettled = []
+        for day in days:
+            partition = self.load(day)
+            if partition is not None and not partition.get("final") and now >= self.settled_at(day):
+                unsettled.append(day)
+        return unsettled
+
+    def window_days(self, days: int, now: Optional[datetime] = None) -> int:
+        """
+        Days of lifelogs, ending today, a run over a period needs fetched
+
+        A longer period only needs its stale days; a one-day run also
+        refetches the past days of the week that still have to settle.
+
+        Args:
+            days: Number of days of the period (1 = today only)
+            now: Reference time (defaults to now)
+
+        Returns:
+            Number of days from the oldest one to refresh (0 if none)
+        """
+        now = now or datetime.now()
+        today = now.date()
+        if days > 1:
+            refresh = self.stale_days(period_days(days, today))
+        else:
+            refresh = self.unsettled_days(period_days(7, today)[:-1], now) or [today]
+        return (today - refresh[0]).days + 1 if refresh else 0
+
+    def matches(self, day: date, lifelogs: List[Lifelog]) -> bool:
+        """
+        Tell whether a stored partition was computed from exactly these lifelogs
+
+        Args:
+            day: Calendar day
+            lifelogs: The day's lifelogs, freshly fetched
+
+        Returns:
+            True if the partition exists and no lifelog was added, removed or
+            extended since it was computed
+        """
+        partition = self.load(day)
+        if partition is None or "digests" not in partition:
+            return False
+        return partition["digests"] == {lifelog_id(log): _digest(log) for log in lifelogs}
+
+    def finalize(self, day: date, now: Optional[datetime] = None):
+        """
+        Mark a partition final without recomputing it
+
+        For a day whose lifelogs, fetched after it settled, match the stored ones.
+
+        Args:
+            day: Calendar day
+            now: Time the lifelogs were fetched (defaults to now)
+        """
+        now = now or datetime.now()
+        if now < self.settled_at(day):
+            return
+        target = self._file(day)
+        try:
+            partition = codec.read_json(target)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Can't finalize partition {target}: {e}")
+            return
+        partition["final"] = True
+        partition["checked_at"] = now.isoformat(timespec='seconds')
+        codec.write_json(target, partition)
+
+    def save(
+        self,
+        day: date,
+        priorities: Dict[str, List[Priority]],
+        lifelogs: List[Lifelog],
+        now: Optional[datetime] = None
+    ):
+        """
+        Store a day's priorities, before ranking
+
+        The partition is final if the lifelogs were fetched after the day settled.
+
+        Args:
+            day: Calendar day
+            priorities: Items extracted from the day's lifelogs
+            lifelogs: The day's lifelogs (only id, title, date and a transcript
+                fingerprint are kept)
+            now: Time the lifelogs were fetched (defaults to now)
+        """
+        now = now or datetime.now()
+
+        codec.write_json(self._file(day), {
+            "day": day.isoformat(),
+            "template": self.template_id,
+            "computed_at": now.isoformat(timespec='seconds'),
+            "final": now >= self.settled_at(day),
+            "sources": [Lifelog(log.id, log.title, log.date).to_dict() for log in lifelogs],
+            "digests": {lifelog_id(log): _digest(log) for log in lifelogs},
+            "priorities": priorities_to_dict(priorities)
+        })
+        self._prune(now.date())
+
+    def rollup(self, days: List[date]) -> Tuple[Dict[str, List[Priority]], List[Lifelog], int]:
+        """
+        Merge the stored partitions of several days
+
+        The same item (type and title, case and accents aside) found on
+        several days counts once, as extracted on the most recent day.
+
+        Args:
+            days: Days of the period
+
+        Returns:
+            Tuple (merged priorities, unranked; lifelogs of every day, title and
+            date only, for recency scoring; number of distinct lifelogs)
+        """
+        merged: Dict[str, List[Priority]] = {item_type: [] for item_type in PRIORITY_TYPES}
+        known = {item_type: set() for item_type in PRIORITY_TYPES}
+        sources: Dict[str, Lifelog] = {}
+
+        for day in sorted(days, reverse=True):
+            partition = self.load(day)
+            if partition is None:
+                continue
+            for source in partition["sources"]:
+                # A lifelog spanning midnight may be stored under both days
+                sources.setdefault(lifelog_id(source), source)
+            for item_type in PRIORITY_TYPES:
+                for item in partition["priorities"][item_type]:
+                    key = title_key(item)
+                    if key not in known[item_type]:
+                        known[item_type].add(key)
+                        merged[item_type].append(item)
+
+        return merged, list(sources.values()), len(sources)
+
+    def _prune(self, today: date):
+        """Delete partitions past the retention period"""
+        cutoff = (today - timedelta(days=self.retention_days)).isoformat()
+        for target in self.path.glob("*.json"):
+            if target.stem < cutoff:
+                target.unlink(missing_ok=True)
@@ -0,0 +1,208 @@
+"""
+Priority ranking
+Score extracted priorities and keep the top-k above the confidence threshold
+"""
+
+import heapq
+import re
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.models import PRIORITY_TYPES, Lifelog, Priority
+from src.utils.text import fold_accents
+
+# Relative importance of each priority type
+TYPE_WEIGHTS = {
+    "deadlines": 1.0,
+    "engagements": 0.9,
+    "demandes": 0.8
+}
+
+# Score = weighted sum of normalized signals (each in 0..1)
+SCORE_WEIGHTS = {
+    "confidence": 0.5,
+    "deadline": 0.2,
+    "recency": 0.15,
+    "type": 0.15
+}
+
+DEADLINE_HORIZON_DAYS = 14
+RECENCY_HORIZON_DAYS = 7
+
+ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    """Parse the first ISO date found in a value"""
+    if not value:
+        return None
+    match = ISO_DATE_RE.search(str(value))
+    if not match:
+        return None
+    try:
+        return date.fromisoformat(match.group(0))
+    except ValueError:
+        return None
+
+
+def _source_date(item: Priority, lifelogs: List[Lifelog]) -> Optional[date]:
+    """Date of the lifelog an item comes from (by title, else date in the source)"""
+    source = item.source
+    for log in lifelogs:
+        title = log.title
+        if title and title in source:
+            return _parse_date(log.date)
+    return _parse_date(source)
+
+
+def score_priority(
+    item_type: str,
+    item: Priority,
+    today: date,
+    lifelogs: List[Lifelog]
+) -> float:
+    """
+    Score one priority
+
+    Args:
+        item_type: Priorities key (engagements/demandes/deadlines)
+        item: Priority item
+        today: Reference date
+        lifelogs: Lifelogs of the run, used to date each item's source
+
+    Returns:
+        Score between 0 and 1
+    """
+    confidence = item.confidence
+
+    deadline = 0.0
+    due = _parse_date(item.date)
+    if due:
+        days_left = (due - today).days
+        deadline = 1.0 if days_left <= 0 else max(0.0, 1 - days_left / DEADLINE_HORIZON_DAYS)
+
+    recency = 0.5
+    seen = _source_date(item, lifelogs)
+    if seen:
+        age = max(0, (today - seen).days)
+        recency = max(0.0, 1 - age / RECENCY_HORIZON_DAYS)
+
+    return (
+        SCORE_WEIGHTS["confidence"] * confidence +
+        SCORE_WEIGHTS["deadline"] * deadline +
+        SCORE_WEIGHTS["recency"] * recency +
+        SCORE_WEIGHTS["type"] * TYPE_WEIGHTS.get(item_type, 0.5)
+    )
+
+
+def rank_priorities(
+    priorities: Dict[str, List[Priority]],
+    confidence_threshold: float = 0.0,
+    max_priorities: Optional[int] = None,
+    lifelogs: Optional[List[Lifelog]] = None,
+    now: Optional[datetime] = None
+) -> Tuple[Dict[str, List[Priority]], Dict[str, int]]:
+    """
+    Apply the confidence threshold and keep the top-k priorities
+
+    Args:
+        priorities: Dictionary with keys: engagements, demandes, deadlines
+        confidence_threshold: Minimum confidence to keep an item
+        max_priorities: Maximum number of items kept (None = no limit)
+        lifelogs: Lifelogs of the run, used for source recency
+        now: Reference time (defaults to now)
+
+    Returns:
+        Tuple (ranked priorities by type, best first, each with a `score`;
+        counts of kept and dropped items)
+    """
+    today = (now or datetime.now()).date()
+    lifelogs = lifelogs or []
+
+    candidates = []
+    below_threshold = 0
+    for item_type in PRIORITY_TYPES:
+        for position, item in enumerate(priorities.get(item_type, [])):
+            if item.confidence < confidence_threshold:
+                below_threshold += 1
+                continue
+            score = score_priority(item_type, item, today, lifelogs)
+            candidates.append((score, item_type, position, item))
+
+    if max_priorities is not None and len(candidates) > max_priorities:
+        # Ties keep extraction order
+        kept = heapq.nlargest(max_priorities, candidates, key=lambda c: (c[0], -c[2]))
+    else:
+        kept = sorted(candidates, key=lambda c: (c[0], -c[2]), reverse=True)
+
+    ranked: Dict[str, List[Priority]] = {item_type: [] for item_type in PRIORITY_TYPES}
+    for score, item_type, _, item in kept:
+        ranked[item_type].append(item.with_score(round(score, 3)))
+
+    stats = {
+        "kept": len(kept),
+        "below_threshold": below_threshold,
+        "over_limit": len(candidates) - len(kept)
+    }
+    return ranked, stats
+
+
+def merge_ranked(
+    existing: Dict[str, List[Priority]],
+    incoming: Dict[str, List[Priority]],
+    max_priorities: Optional[int] = None
+) -> Tuple[Dict[str, List[Priority]], Dict[str, List[Priority]], int]:
+    """
+    Merge two ranked priority sets, keeping the top-k by existing score
+
+    Incoming items whose title matches an existing item of the same type
+    (case and accents aside) are treated as already known.
+
+    Args:
+        existing: Previously ranked priorities (each with a `score`)
+        incoming: Newly ranked priorities (each with a `score`)
+        max_priorities: Maximum number of items kept (None = no limit)
+
+    Returns:
+        Tuple (merged priorities best first, incoming items that were added,
+        number of items dropped by the cap)
+    """
+    candidates = []
+    added: Dict[str, List[Priority]] = {item_type: [] for item_type in PRIORITY_TYPES}
+
+    for item_type in PRIORITY_TYPES:
+        known = set()
+        for position, item in enumerate(existing.get(item_type, [])):
+            known.add(title_key(item))
+            candidates.append((item.score or 0.0, item_type, position, item))
+
+        offset = len(candidates)
+        for position, item in enumerate(incoming.get(item_type, [])):
+            key = title_key(item)
+            if key in known:
+                continue
+            known.add(key)
+            added[item_type].append(item)
+            candidates.append((item.score or 0.0, item_type, offset + position, item))
+
+    if max_priorities is not None and len(candidates) > max_priorities:
+        kept = heapq.nlargest(max_priorities, candidates, key=lambda c: (c[0], -c[2]))
+    else:
+        kept = sorted(candidates, key=lambda c: (c[0], -c[2]), reverse=True)
+
+    merged: Dict[str, List[Priority]] = {item_type: [] for item_type in PRIORITY_TYPES}
+    for _, item_type, _, item in kept:
+        merged[item_type].append(item)
+
+    kept_ids = {id(item) for _, _, _, item in kept}
+    added = {
+        item_type: [item for item in items if id(item) in kept_ids]
+        for item_type, items in added.items()
+    }
+
+    return merged, added, len(candidates) - len(kept)
+
+
+def title_key(item: Priority) -> str:
+    """Normalized title used to recognize the same priority across runs"""
+    return " ".join(fold_accents(item.title).split())
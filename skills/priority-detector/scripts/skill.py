@@ -0,0 +1,90 @@
+"""
+Skill runner entry point
+Run priority detection over lifelogs fetched by the skill runner
+"""
+
+from typing import Any, Dict, List, Optional
+
+from src.utils.models import Lifelog
+
+from .analyze import analyze_priorities
+from .delta import LifelogDeltaStore
+from .partitions import DailyPartitionStore
+from .format_output import format_priorities_markdown
+
+
+def _partitions(context: Dict[str, Any]) -> Optional[DailyPartitionStore]:
+    """Daily partition store of the run's configuration, if enabled"""
+    config = context["config"]
+    detector_config = config.get_priority_detector_config()
+    if not detector_config.get('partitions', True):
+        return None
+    return DailyPartitionStore(
+        str(config.get_data_dir() / "partitions"),
+        template_id=context["claude"].prompt_template.id,
+        settle_hours=detector_config.get('partition_settle_hours', 1),
+        retention_days=detector_config.get('partition_retention_days', 35)
+    )
+
+
+def fetch_days(days: int, context: Dict[str, Any]) -> int:
+    """
+    Days of lifelogs the runner should fetch for this skill
+
+    Args:
+        days: Number of days of the period
+        context: Run context
+
+    Returns:
+        With partitions, only the stored days that need refreshing (see
+        DailyPartitionStore.window_days); the whole period otherwise
+    """
+    partitions = _partitions(context)
+    return days if partitions is None else partitions.window_days(days)
+
+
+async def run_skill(lifelogs: List[Lifelog], context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Detect priorities in a shared lifelog dataset
+
+    Args:
+        lifelogs: Lifelogs already fetched and compacted by the runner
+        context: Run context (period, dry_run, claude, notion, resilience,
+            search_index, entity_index, config, window_days)
+
+    Returns:
+        Results from analyze_priorities
+    """
+    config = context["config"]
+    detector_config = config.get_priority_detector_config()
+
+    delta_store = None
+    if detector_config.get('incremental', True):
+        delta_store = LifelogDeltaStore(
+            str(config.get_data_dir() / "lifelog_delta.json"),
+            template_id=context["claude"].prompt_template.id,
+            overlap_segments=detector_config.get('overlap_segments', 3)
+        )
+
+    return await analyze_priorities(
+        limitless_connector=None,
+        claude_connector=context["claude"],
+        notion_connector=context["notion"],
+        period=context.get("period", "today"),
+        dry_run=context.get("dry_run", False),
+        resilience=context.get("resilience"),
+        search_index=context.get("search_index"),
+        context_snippets=config.get_search_config().get('context_snippets', 0),
+        entity_index=context.get("entity_index"),
+        confidence_threshold=detector_config.get('confidence_threshold', 0.0),
+        max_priorities_per_day=detector_config.get('max_priorities_per_day'),
+        lifelogs=lifelogs,
+        delta_store=delta_store,
+        partitions=_partitions(context),
+        window_days=context.get("window_days")
+    )
+
+
+def format_report(results: Dict[str, Any], context: Dict[str, Any]) -> str:
+    """Markdown report for the skill runner"""
+    return format_priorities_markdown(results, context.get("period", "today"))
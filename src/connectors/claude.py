@@ -3,43 +3,94 @@ Claude API Connector
 Analyze lifelogs using Anthropic Claude
 """
 
+import asyncio
 import logging
-import json
-from typing import Dict, List, Any
-from anthropic import Anthropic
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+import anthropic
+from anthropic import AsyncAnthropic
+
+from ..utils.resilience import Resilience
+from ..utils.cassette import Cassette
+from ..utils.result_cache import ResultCache
+from ..utils.jsonstream import ArrayItemExtractor
+from ..utils.prompts import PromptTemplate, load_registry
+from ..utils.models import PRIORITY_TYPES, Lifelog, Priority, parse_priorities
+from ..utils import codec
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Tell whether an Anthropic error is worth retrying"""
+    if isinstance(error, (anthropic.APIConnectionError, anthropic.RateLimitError)):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code >= 500
+    return False
+
+
+def _usage_dict(usage: Any) -> Dict[str, int]:
+    """Token counts from an Anthropic usage object"""
+    if usage is None:
+        return {}
+    return {
+        "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+        "output_tokens": getattr(usage, "output_tokens", 0) or 0
+    }
 
 
 class ClaudeConnector:
     """Wrapper for Anthropic Claude API"""
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-5-20250929"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-sonnet-4-5-20250929",
+        resilience: Optional[Resilience] = None,
+        cassette: Optional[Cassette] = None,
+        client: Optional[AsyncAnthropic] = None,
+        cache: Optional[ResultCache] = None,
+        prompt_template: Optional[PromptTemplate] = None
+    ):
         """
         Initialize Claude connector
 
         Args:
             api_key: Anthropic API key
             model: Claude model to use
+            resilience: Shared retry/circuit-breaker layer
+            cassette: Record/replay store for all requests
+            client: Shared Anthropic client (and its connection pool)
+            cache: Result cache shared with other profiles (keyed by prompt)
+            prompt_template: Analysis prompt (registry default if None)
         """
         self.api_key = api_key
         self.model = model
+        self.resilience = resilience or Resilience()
+        self.cassette = cassette
+        self.cache = cache
+        self.prompt_template = prompt_template or load_registry().get()
+        # errors: analyses that failed or returned no readable JSON
+        self.usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0, "errors": 0}
         self.logger = logging.getLogger("nexus.claude")
 
-        self.client = Anthropic(api_key=api_key)
+        # Retries are owned by the resilience layer
+        self.client = client or AsyncAnthropic(api_key=api_key, max_retries=0)
 
     async def analyze_priorities(
         self,
-        lifelogs: List[Dict[str, Any]],
-        period: str = "today"
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        lifelogs: List[Any],
+        period: str = "today",
+        context: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, List[Priority]]:
         """
         Analyze lifelogs and extract priorities
 
         Args:
-            lifelogs: List of lifelog objects with transcripts
+            lifelogs: Lifelogs (Lifelog or dictionaries) with transcripts
             period: Time period (today/week)
+            context: Relevant past lifelog snippets from the local search index
 
         Returns:
-            Dictionary with engagements, demandes, deadlines
+            Validated Priority items by type: engagements, demandes, deadlines
         """
         try:
             # Prepare transcript text
@@ -50,22 +101,16 @@ class ClaudeConnector:
                 return {"engagements": [], "demandes": [], "deadlines": []}
 
             # Build prompt
-            prompt = self._build_analysis_prompt(transcripts, period)
+            prompt = self._build_analysis_prompt(
+                transcripts, period, self._format_context(context or [])
+            )
 
             self.logger.info(f"Analyzing {len(lifelogs)} lifelogs with Claude")
 
             # Call Claude API
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+            response_text = await self._complete(prompt)
 
             # Parse response
-            response_text = message.content[0].text
             priorities = self._parse_response(response_text)
 
             self.logger.info(
@@ -77,88 +122,299 @@ class ClaudeConnector:
             return priorities
 
         except Exception as e:
+            self.usage["errors"] += 1
             self.logger.error(f"Failed to analyze priorities: {e}")
             return {"engagements": [], "demandes": [], "deadlines": []}
 
-    def _format_lifelogs(self, lifelogs: List[Dict[str, Any]]) -> str:
-        """Format lifelogs for analysis"""
+    async def stream_priorities(
+        self,
+        lifelogs: List[Any],
+        period: str = "today",
+        context: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[Tuple[str, Priority]]:
+        """
+        Analyze lifelogs and yield each priority as soon as Claude emits it
+
+        Args:
+            lifelogs: Lifelogs (Lifelog or dictionaries) with transcripts
+            period: Time period (today/week)
+            context: Relevant past lifelog snippets from the local search index
+
+        Yields:
+            (type, Priority) with type in engagements/demandes/deadlines
+        """
+        transcripts = self._format_lifelogs(lifelogs)
+
+        if not transcripts:
+            self.logger.warning("No transcripts to analyze")
+            return
+
+        prompt = self._build_analysis_prompt(
+            transcripts, period, self._format_context(context or [])
+        )
+
+        self.logger.info(f"Streaming analysis of {len(lifelogs)} lifelogs with Claude")
+
+        extractor = ArrayItemExtractor()
+        emitted = set()
+        counts = dict.fromkeys(PRIORITY_TYPES, 0)
+
+        try:
+            async for chunk in self._stream(prompt):
+                if chunk is None:
+                    # Retried attempt: the document starts over
+                    extractor = ArrayItemExtractor()
+                    continue
+
+                for item_type, raw_item in extractor.feed(chunk):
+                    if item_type not in PRIORITY_TYPES:
+                        continue
+                    item = Priority.from_dict(raw_item)
+                    if item is None:
+                        self.logger.warning(f"Dropped malformed {item_type} item")
+                        continue
+                    fingerprint = (item_type, item.fingerprint())
+                    if fingerprint in emitted:
+                        continue
+                    emitted.add(fingerprint)
+                    counts[item_type] += 1
+                    yield item_type, item
+
+        except Exception as e:
+            self.usage["errors"] += 1
+            self.logger.error(f"Failed to analyze priorities: {e}")
+            return
+
+        self.logger.info(
+            f"Extracted {counts['engagements']} engagements, "
+            f"{counts['demandes']} demandes, "
+            f"{counts['deadlines']} deadlines"
+        )
+
+    async def analyze_lead(
+        self,
+        company: str,
+        research: str,
+        template: PromptTemplate
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Qualify a lead from condensed web research
+
+        Args:
+            company: Company name
+            research: Condensed text extracted from the company's pages
+            template: Lead research prompt (placeholders: company, research)
+
+        Returns:
+            Lead profile dictionary, or None if the analysis failed
+        """
+        try:
+            prompt = template.render(company=company, research=research)
+
+            self.logger.info(f"Qualifying lead {company} with Claude")
+            response_text = await self._complete(prompt, max_tokens=2048)
+
+            start = response_text.find('{')
+            end = response_text.rfind('}') + 1
+            if start < 0 or end <= start:
+                self.usage["errors"] += 1
+                self.logger.error("No JSON found in Claude response")
+                return None
+            return codec.loads(response_text[start:end])
+
+        except Exception as e:
+            self.usage["errors"] += 1
+            self.logger.error(f"Failed to qualify lead {company}: {e}")
+            return None
+
+    async def _stream(self, prompt: str, max_tokens: int = 4096) -> AsyncIterator[Optional[str]]:
+        """
+        Stream a single-turn prompt through the resilience layer
+
+        Cached and replayed responses are served as one chunk. A None chunk
+        means a retry started and the response text restarts from scratch.
+
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens in the response
+
+        Yields:
+            Response text chunks
+        """
+        cache_key = self._cache_key(prompt, max_tokens)
+        replaying = self.cassette is not None and self.cassette.replaying
+        if replaying or (self.cache is not None and cache_key in self.cache):
+            yield await self._complete(prompt, max_tokens)
+            return
+
+        done = object()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def request() -> Dict[str, Any]:
+            await queue.put(None)
+            parts = []
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }]
+            ) as stream:
+                async for text in stream.text_stream:
+                    parts.append(text)
+                    await queue.put(text)
+                message = await stream.get_final_message()
+            return {"text": "".join(parts), "usage": _usage_dict(message.usage)}
+
+        async def run() -> None:
+            try:
+                response = await self.resilience.call(
+                    "claude",
+                    "messages",
+                    request,
+                    retry_on=is_transient_error
+                )
+                self._add_usage(response)
+                if self.cassette:
+                    self.cassette.record(
+                        "claude", "messages", self._request_params(prompt, max_tokens), response
+                    )
+                if self.cache is not None:
+                    self.cache.put(cache_key, response)
+            finally:
+                await queue.put(done)
+
+        task = asyncio.create_task(run())
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is done:
+                    break
+                yield chunk
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+
+    async def _complete(self, prompt: str, max_tokens: int = 4096) -> str:
+        """
+        Send a single-turn prompt through the resilience layer
+
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens in the response
+
+        Returns:
+            Response text
+        """
+        async def request():
+            return await self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }]
+            )
+
+        async def resilient_request() -> Dict[str, Any]:
+            message = await self.resilience.call(
+                "claude",
+                "messages",
+                request,
+                retry_on=is_transient_error
+            )
+            return {"text": message.content[0].text, "usage": _usage_dict(message.usage)}
+
+        async def complete() -> Dict[str, Any]:
+            if self.cassette:
+                return await self.cassette.through(
+                    "claude", "messages", self._request_params(prompt, max_tokens), resilient_request
+                )
+            return await resilient_request()
+
+        cached = False
+        if self.cache is not None:
+            key = self._cache_key(prompt, max_tokens)
+            cached = key in self.cache
+            response = await self.cache.get_or_compute(key, complete)
+        else:
+            response = await complete()
+
+        # Cassettes recorded before usage tracking stored the bare text
+        if isinstance(response, str):
+            response = {"text": response, "usage": {}}
+
+        if not cached:
+            self._add_usage(response)
+        return response["text"]
+
+    def _request_params(self, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Normalized request used as the cassette key"""
+        return {"model": self.model, "max_tokens": max_tokens, "prompt": prompt}
+
+    def _cache_key(self, prompt: str, max_tokens: int) -> str:
+        """Result cache key (includes the prompt template hash)"""
+        return ResultCache.key("claude", self.model, max_tokens, self.prompt_template.hash, prompt)
+
+    def _add_usage(self, response: Dict[str, Any]):
+        """Accumulate token usage of a model response"""
+        usage = response.get("usage") or {}
+        self.usage["calls"] += 1
+        self.usage["input_tokens"] += usage.get("input_tokens", 0)
+        self.usage["output_tokens"] += usage.get("output_tokens", 0)
+
+    def _format_lifelogs(self, lifelogs: List[Any]) -> str:
+        """Format lifelogs (Lifelog or raw dictionaries) for analysis"""
         formatted = []
 
-        for log in lifelogs:
-            date = log.get("date", "Unknown date")
-            title = log.get("title", "Untitled")
-            transcript = log.get("transcript", "")
+        for log in map(Lifelog.from_dict, lifelogs):
+            date = log.date or "Unknown date"
+            title = log.title or "Untitled"
+            transcript = log.transcript
+            header = f"[{log.id}] {title}" if log.id else title
 
-            if transcript:
+            if transcript and log.overlap:
+                # Extended lifelog: only the tail is new
+                formatted.append(f"""
+--- Lifelog: {header} ({date}), suite ---
+(déjà analysé, contexte seulement)
+{log.overlap}
+(nouveau)
+{transcript}
+""")
+            elif transcript:
                 formatted.append(f"""
---- Lifelog: {title} ({date}) ---
+--- Lifelog: {header} ({date}) ---
 {transcript}
 """)
 
         return "\n".join(formatted)
 
-    def _build_analysis_prompt(self, transcripts: str, period: str) -> str:
-        """Build prompt for priority detection"""
-        return f"""Tu es un assistant IA spécialisé dans l'analyse de conversations et notes vocales pour Christian Boulet, fractional CTO.
-
-Ta mission : Analyser les transcripts ci-dessous et identifier les priorités d'action.
-
-Critères de détection :
-
-1. **ENGAGEMENTS PRIS** - Actions que Christian a promis de faire
-   - Phrases comme "je vais...", "je te reviens avec...", "je m'engage à..."
-   - Promesses faites à des clients/prospects
-   - Actions spécifiques mentionnées
-
-2. **DEMANDES REÇUES** - Requêtes nécessitant une action de Christian
-   - Questions directes : "Peux-tu...", "J'aurais besoin de...", "Pourrais-tu..."
-   - Requêtes clients à traiter
-   - Informations demandées
-
-3. **DEADLINES** - Urgences temporelles
-   - Dates explicites mentionnées
-   - "Avant [date]", "Pour [jour]", "D'ici [deadline]"
-   - Échéances importantes
-
-Période analysée : {period}
-
-Transcripts :
-{transcripts}
-
-Retourne un objet JSON structuré comme ceci (et UNIQUEMENT du JSON valide, rien d'autre) :
-
-{{
-  "engagements": [
-    {{
-      "title": "Description courte de l'engagement",
-      "description": "Détails supplémentaires",
-      "confidence": 0.95,
-      "source": "Conversation avec [nom] - [date]"
-    }}
-  ],
-  "demandes": [
-    {{
-      "title": "Description de la demande",
-      "description": "Contexte et détails",
-      "confidence": 0.90,
-      "source": "Conversation avec [nom] - [date]"
-    }}
-  ],
-  "deadlines": [
-    {{
-      "title": "Action avec deadline",
-      "description": "Détails",
-      "date": "YYYY-MM-DD",
-      "confidence": 0.85,
-      "source": "Conversation avec [nom] - [date]"
-    }}
-  ]
-}}
-
-IMPORTANT : Retourne UNIQUEMENT le JSON, pas de texte avant ou après."""
-
-    def _parse_response(self, response: str) -> Dict[str, List[Dict[str, Any]]]:
-        """Parse Claude's JSON response"""
+    def _format_context(self, context: List[Dict[str, Any]]) -> str:
+        """Format past lifelog snippets as background for the prompt"""
+        if not context:
+            return ""
+
+        lines = [
+            "Contexte antérieur (historique, ne pas en extraire de priorités) :"
+        ]
+        for item in context:
+            lines.append(f"- {item.get('title', 'Sans titre')} ({item.get('date', '')}) : {item.get('snippet', '')}")
+
+        return "\n".join(lines) + "\n\n"
+
+    def _build_analysis_prompt(self, transcripts: str, period: str, context: str = "") -> str:
+        """Build prompt for priority detection from the registered template"""
+        return self.prompt_template.render(
+            period=period,
+            transcripts=transcripts,
+            context=context
+        )
+
+    def _parse_response(self, response: str) -> Dict[str, List[Priority]]:
+        """Parse and validate Claude's JSON response"""
         try:
             # Extract JSON from response (in case there's surrounding text)
             start = response.find('{')
@@ -166,15 +422,16 @@ IMPORTANT : Retourne UNIQUEMENT le JSON, pas de texte avant ou après."""
 
             if start >= 0 and end > start:
                 json_str = response[start:end]
-                priorities = json.loads(json_str)
-                return priorities
+                return parse_priorities(codec.loads(json_str))
             else:
+                self.usage["errors"] += 1
                 self.logger.error("No JSON found in Claude response")
                 return {"engagements": [], "demandes": [], "deadlines": []}
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            self.usage["errors"] += 1
             self.logger.error(f"Failed to parse Claude response as JSON: {e}")
-            self.logger.debug(f"Response was: {response}")
+            self.logger.debug("Response was: %s", response)
             return {"engagements": [], "demandes": [], "deadlines": []}
 
     def is_connected(self) -> bool:
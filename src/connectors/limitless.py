@@ -3,25 +3,66 @@ Limitless API Connector
 Fetch lifelogs, conversations, and meeting notes from Limitless
 """
 
+import asyncio
 import httpx
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from contextlib import asynccontextmanager, nullcontext
+from typing import AsyncIterator, Dict, List, Any, Optional
+from datetime import date, datetime, time, timedelta
+
+from ..utils.resilience import Resilience, CircuitOpenError, DeadlineExceededError
+from ..utils.cassette import Cassette, CassetteMissError
+from ..utils.result_cache import ResultCache
+from ..utils.jsonstream import ArrayItemExtractor
+from ..utils.dedup import Deduplicator, conversation_to_lifelog
+from ..utils import codec
+
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Tell whether a Limitless error is worth retrying"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS
+    return isinstance(error, httpx.TransportError)
 
 
 class LimitlessConnector:
     """Wrapper for Limitless API"""
 
-    def __init__(self, api_key: str, endpoint: str = "https://api.limitless.ai/v1"):
+    def __init__(
+        self,
+        api_key: str,
+        endpoint: str = "https://api.limitless.ai/v1",
+        resilience: Optional[Resilience] = None,
+        hedge_after: Optional[float] = None,
+        cassette: Optional[Cassette] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[ResultCache] = None,
+        include_conversations: bool = True
+    ):
         """
         Initialize Limitless connector
 
         Args:
             api_key: Limitless API key
             endpoint: API endpoint URL
+            resilience: Shared retry/circuit-breaker layer
+            hedge_after: Seconds before firing a hedged duplicate GET (None disables)
+            cassette: Record/replay store for all requests
+            http_client: Shared connection pool (a client per request if None)
+            cache: Result cache shared with other connectors/profiles
+            include_conversations: Merge conversations into analysis windows
         """
         self.api_key = api_key
         self.endpoint = endpoint.rstrip('/')
+        self.resilience = resilience or Resilience()
+        self.hedge_after = hedge_after
+        self.cassette = cassette
+        self.http_client = http_client
+        self.cache = cache
+        self.include_conversations = include_conversations
         self.logger = logging.getLogger("nexus.limitless")
 
         self.headers = {
@@ -33,15 +74,17 @@ class LimitlessConnector:
         self,
         date: Optional[str] = None,
         days: int = 1,
-        limit: int = 100
+        limit: int = 100,
+        since: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """
         Fetch lifelogs from Limitless
 
         Args:
             date: Specific date (ISO format YYYY-MM-DD)
-            days: Number of days to look back
+            days: Number of calendar days, today included
             limit: Maximum number of lifelogs
+            since: Exact start of the window (overrides days)
 
         Returns:
             List of lifelog objects with transcripts
@@ -51,33 +94,167 @@ class LimitlessConnector:
                 # Specific date
                 since = datetime.fromisoformat(date)
             else:
-                # Last N days
-                since = datetime.now() - timedelta(days=days)
+                since = self._window_start(days, since)
 
             self.logger.info(f"Fetching lifelogs since {since.isoformat()}")
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.endpoint}/lifelogs",
-                    headers=self.headers,
-                    params={
-                        "since": since.isoformat(),
-                        "limit": limit,
-                        "include_transcripts": True
-                    },
-                    timeout=30.0
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                lifelogs = data.get('lifelogs', [])
-                self.logger.info(f"Retrieved {len(lifelogs)} lifelogs from Limitless")
-                return lifelogs
-
-        except httpx.HTTPError as e:
+            data = await self._get("lifelogs", {
+                "since": since.isoformat(),
+                "limit": limit,
+                "include_transcripts": True
+            })
+            lifelogs = data.get('lifelogs', [])
+            self.logger.info(f"Retrieved {len(lifelogs)} lifelogs from Limitless")
+            return lifelogs
+
+        except (httpx.HTTPError, CircuitOpenError, DeadlineExceededError, CassetteMissError) as e:
             self.logger.error(f"Failed to fetch lifelogs: {e}")
             return []
 
+    async def iter_lifelogs(
+        self,
+        days: int = 1,
+        limit: int = 100,
+        since: Optional[datetime] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield lifelogs one by one while the response body is downloading
+
+        The body is parsed incrementally, so only the lifelog being decoded
+        is held in memory. Replayed and shared-cache fetches need the whole
+        response and fall back to get_lifelogs.
+
+        Args:
+            days: Number of calendar days, today included
+            limit: Maximum number of lifelogs
+            since: Exact start of the window (overrides days)
+
+        Yields:
+            Lifelog objects with transcripts
+
+        Raises:
+            httpx.HTTPError, CircuitOpenError, DeadlineExceededError: If the
+                stream failed after some lifelogs were yielded, so a truncated
+                window is never taken for a complete one (nothing is recorded)
+        """
+        replaying = self.cassette is not None and self.cassette.replaying
+        if replaying or self.cache is not None:
+            for lifelog in await self.get_lifelogs(days=days, limit=limit, since=since):
+                yield lifelog
+            return
+
+        since = self._window_start(days, since)
+        params = {
+            "since": since.isoformat(),
+            "limit": limit,
+            "include_transcripts": True
+        }
+        self.logger.info(f"Streaming lifelogs since {since.isoformat()}")
+
+        # Recording keeps a copy of everything, by definition
+        recorded: Optional[List[Dict[str, Any]]] = [] if self.cassette else None
+        count = 0
+
+        try:
+            async with self._open_stream("lifelogs", params) as response:
+                extractor = ArrayItemExtractor()
+                async for text in response.aiter_text():
+                    for key, lifelog in extractor.feed(text):
+                        if key != "lifelogs":
+                            continue
+                        count += 1
+                        if recorded is not None:
+                            recorded.append(lifelog)
+                        yield lifelog
+
+        except (httpx.HTTPError, CircuitOpenError, DeadlineExceededError) as e:
+            if count:
+                self.logger.error(f"Lifelog stream broke after {count} lifelogs: {e}")
+                raise
+            # Nothing yielded: same outcome as a failed get_lifelogs
+            self.logger.error(f"Failed to stream lifelogs: {e}")
+            return
+
+        if recorded is not None:
+            self.cassette.record("limitless", "lifelogs", params, {"lifelogs": recorded})
+
+        self.logger.info(f"Streamed {count} lifelogs from Limitless")
+
+    async def get_window(
+        self,
+        days: int = 1,
+        since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch lifelogs and conversations concurrently and merge them
+
+        Args:
+            days: Number of calendar days, today included
+            since: Exact start of the window (overrides days)
+
+        Returns:
+            Lifelogs followed by conversations not already covered,
+            deduplicated by id and transcript hash
+        """
+        if not self.include_conversations:
+            return await self.get_lifelogs(days=days, since=since)
+
+        lifelogs, conversations = await asyncio.gather(
+            self.get_lifelogs(days=days, since=since),
+            self.get_conversations(days=days, since=since)
+        )
+
+        dedup = Deduplicator()
+        merged = [
+            record
+            for record in lifelogs + [conversation_to_lifelog(c) for c in conversations]
+            if not dedup.seen(record)
+        ]
+
+        self.logger.info(
+            f"Merged {len(lifelogs)} lifelogs and {len(conversations)} conversations "
+            f"into {len(merged)} records ({dedup.duplicates} duplicates)"
+        )
+        return merged
+
+    async def iter_window(
+        self,
+        days: int = 1,
+        since: Optional[datetime] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream lifelogs while conversations are fetched in the background
+
+        Args:
+            days: Number of calendar days, today included
+            since: Exact start of the window (overrides days)
+
+        Yields:
+            Lifelogs, then conversations not already covered
+        """
+        if not self.include_conversations:
+            async for lifelog in self.iter_lifelogs(days=days, since=since):
+                yield lifelog
+            return
+
+        conversations_task = asyncio.create_task(self.get_conversations(days=days, since=since))
+        dedup = Deduplicator()
+
+        try:
+            async for lifelog in self.iter_lifelogs(days=days, since=since):
+                if not dedup.seen(lifelog):
+                    yield lifelog
+
+            for conversation in await conversations_task:
+                record = conversation_to_lifelog(conversation)
+                if not dedup.seen(record):
+                    yield record
+        finally:
+            if not conversations_task.done():
+                conversations_task.cancel()
+
+        self.logger.info(f"Skipped {dedup.duplicates} duplicate records")
+
     async def search_with_transcripts(
         self,
         date: str,
@@ -95,39 +272,136 @@ class LimitlessConnector:
         """
         return await self.get_lifelogs(date=date, days=1, limit=limit)
 
-    async def get_conversations(self, days: int = 1) -> List[Dict[str, Any]]:
+    async def get_conversations(
+        self,
+        days: int = 1,
+        since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get recent conversations
 
         Args:
-            days: Number of days to look back
+            days: Number of calendar days, today included
+            since: Exact start of the window (overrides days)
 
         Returns:
             List of conversation objects
         """
         try:
-            since = datetime.now() - timedelta(days=days)
+            since = self._window_start(days, since)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.endpoint}/conversations",
-                    headers=self.headers,
-                    params={
-                        "since": since.isoformat()
-                    },
-                    timeout=30.0
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                conversations = data.get('conversations', [])
-                self.logger.info(f"Retrieved {len(conversations)} conversations")
-                return conversations
-
-        except httpx.HTTPError as e:
+            data = await self._get("conversations", {
+                "since": since.isoformat()
+            })
+            conversations = data.get('conversations', [])
+            self.logger.info(f"Retrieved {len(conversations)} conversations")
+            return conversations
+
+        except (httpx.HTTPError, CircuitOpenError, DeadlineExceededError, CassetteMissError) as e:
             self.logger.error(f"Failed to fetch conversations: {e}")
             return []
 
+    @staticmethod
+    def _window_start(days: int, since: Optional[datetime] = None) -> datetime:
+        """
+        Start of a fetch window: local midnight `days - 1` days ago
+
+        Windows line up with calendar days, so a day fetched today and again
+        later in the week covers the same lifelogs (and shares cache keys).
+        """
+        if since is not None:
+            return since
+        return datetime.combine(date.today() - timedelta(days=days - 1), time.min)
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        GET a Limitless endpoint through the resilience layer
+
+        Args:
+            path: Endpoint path relative to the API root
+            params: Query parameters
+
+        Returns:
+            Decoded JSON body
+        """
+        async def send(client: httpx.AsyncClient) -> Dict[str, Any]:
+            response = await client.get(
+                f"{self.endpoint}/{path}",
+                headers=self.headers,
+                params=params,
+                timeout=30.0
+            )
+            response.raise_for_status()
+            return codec.loads(response.content)
+
+        async def request() -> Dict[str, Any]:
+            if self.http_client is not None:
+                return await send(self.http_client)
+            async with httpx.AsyncClient() as client:
+                return await send(client)
+
+        async def resilient_request() -> Dict[str, Any]:
+            return await self.resilience.call(
+                "limitless",
+                path,
+                request,
+                retry_on=is_transient_error,
+                hedge_after=self.hedge_after
+            )
+
+        async def fetch() -> Dict[str, Any]:
+            if self.cassette:
+                return await self.cassette.through("limitless", path, params, resilient_request)
+            return await resilient_request()
+
+        if self.cache is not None:
+            # Profiles sharing a Limitless account fetch each window once
+            key = ResultCache.key("limitless", self.endpoint, self.api_key, path, params)
+            return await self.cache.get_or_compute(key, fetch)
+        return await fetch()
+
+    @asynccontextmanager
+    async def _open_stream(self, path: str, params: Dict[str, Any]) -> AsyncIterator[httpx.Response]:
+        """
+        Open a streamed GET through the resilience layer
+
+        Retries cover connecting and the status line; once the body is
+        flowing, errors propagate to the reader. Streams are never hedged.
+
+        Args:
+            path: Endpoint path relative to the API root
+            params: Query parameters
+
+        Yields:
+            Response whose body has not been read yet
+        """
+        async def send(client: httpx.AsyncClient) -> httpx.Response:
+            request = client.build_request(
+                "GET",
+                f"{self.endpoint}/{path}",
+                headers=self.headers,
+                params=params,
+                timeout=30.0
+            )
+            response = await client.send(request, stream=True)
+            if response.is_error:
+                await response.aclose()
+            response.raise_for_status()
+            return response
+
+        pool = nullcontext(self.http_client) if self.http_client is not None else httpx.AsyncClient()
+        async with pool as client:
+            response = await self.resilience.call(
+                "limitless",
+                path,
+                lambda: send(client),
+                retry_on=is_transient_error
+            )
+            try:
+                yield response
+            finally:
+                await response.aclose()
+
     def is_connected(self) -> bool:
         """Check if connector is configured"""
         return bool(self.api_key)
@@ -4,34 +4,72 @@ Create and manage TODOs in Notion database
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
-from notion_client import Client
+import httpx
+from notion_client import AsyncClient
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+from ..utils.resilience import Resilience
+from ..utils.cassette import Cassette
+from ..utils.models import Priority
+
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Notion "Type" of each priorities key
+TODO_TYPES = {
+    "engagements": "engagement",
+    "demandes": "demande",
+    "deadlines": "deadline"
+}
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Tell whether a Notion error is worth retrying"""
+    if isinstance(error, RequestTimeoutError):
+        return True
+    if isinstance(error, HTTPResponseError):
+        return error.status in RETRYABLE_STATUS
+    # Connection resets and DNS failures reach us unwrapped from notion_client
+    return isinstance(error, httpx.TransportError)
 
 
 class NotionConnector:
     """Wrapper for Notion API"""
 
-    def __init__(self, api_token: str, database_id: str):
+    def __init__(
+        self,
+        api_token: str,
+        database_id: str,
+        resilience: Optional[Resilience] = None,
+        cassette: Optional[Cassette] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Notion connector
 
         Args:
             api_token: Notion integration token
             database_id: Database ID for TODOs
+            resilience: Shared retry/circuit-breaker layer
+            cassette: Record/replay store for all requests
+            http_client: Connection pool (the Notion SDK binds it to this token)
         """
         self.api_token = api_token
         self.database_id = database_id
+        self.resilience = resilience or Resilience()
+        self.cassette = cassette
         self.logger = logging.getLogger("nexus.notion")
 
-        self.client = Client(auth=api_token)
+        self.client = AsyncClient(auth=api_token, client=http_client)
 
-    def create_todo(
+    async def create_todo(
         self,
         title: str,
         todo_type: str,
         description: str = "",
-        date: Optional[datetime] = None,
+        date: Optional[Union[datetime, str]] = None,
         confidence: float = 1.0,
         source: str = ""
     ) -> Optional[Dict[str, Any]]:
@@ -42,7 +80,7 @@ class NotionConnector:
             title: TODO title
             todo_type: Type (engagement, demande, deadline)
             description: Description details
-            date: Associated date
+            date: Associated date (datetime or ISO date string)
             confidence: Confidence score (0-1)
             source: Source of the TODO (e.g., "Conversation with X")
 
@@ -71,7 +109,7 @@ class NotionConnector:
             # Add date if provided
             if date:
                 properties["Date"] = {
-                    "date": {"start": date.isoformat()}
+                    "date": {"start": date if isinstance(date, str) else date.isoformat()}
                 }
 
             # Add confidence score
@@ -86,10 +124,7 @@ class NotionConnector:
                 }
 
             # Create page
-            page = self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties
-            )
+            page = await self._create_page(properties)
 
             self.logger.info(f"Created TODO: {title} (type: {todo_type})")
             return page
@@ -98,67 +133,248 @@ class NotionConnector:
             self.logger.error(f"Failed to create TODO '{title}': {e}")
             return None
 
-    def create_todos_batch(
+    async def create_crm_entry(self, lead: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Create a lead in the CRM database
+
+        The connector must be built with the CRM database id.
+
+        Args:
+            lead: Lead profile (company, sector, size, estimated_revenue,
+                contacts, fit_score, approach_angles, next_actions, sources)
+
+        Returns:
+            Created page object or None if failed
+        """
+        company = lead.get("company", "Sans nom")
+
+        try:
+            properties = {
+                "Nom": {
+                    "title": [{"text": {"content": company}}]
+                },
+                "Statut": {
+                    "select": {"name": "Nouveau lead"}
+                },
+                "Date": {
+                    "date": {"start": datetime.now().date().isoformat()}
+                },
+                **self._lead_properties(lead)
+            }
+
+            page = await self._create_page(properties)
+
+            self.logger.info(f"Created CRM entry: {company}")
+            return page
+
+        except Exception as e:
+            self.logger.error(f"Failed to create CRM entry '{company}': {e}")
+            return None
+
+    async def update_crm_entry(self, page_id: str, lead: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Refresh the research fields of an existing CRM entry
+
+        Status and date are left as they are: the lead may have moved on in
+        the pipeline since it was created.
+
+        Args:
+            page_id: CRM page id
+            lead: Lead profile (same fields as create_crm_entry)
+
+        Returns:
+            Updated page object or None if failed
+        """
+        company = lead.get("company", "Sans nom")
+
+        try:
+            page = await self._update_page(page_id, self._lead_properties(lead))
+
+            self.logger.info(f"Updated CRM entry: {company}")
+            return page
+
+        except Exception as e:
+            self.logger.error(f"Failed to update CRM entry '{company}': {e}")
+            return None
+
+    async def find_crm_entry(self, company: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the CRM entry of a company
+
+        Uses Notion search (available with every SDK version) and keeps the
+        page of this database whose title is exactly the company name.
+
+        Args:
+            company: Company name
+
+        Returns:
+            Page object, or None if missing or the lookup failed
+        """
+        request = {
+            "query": company,
+            "filter": {"property": "object", "value": "page"},
+            "page_size": 20
+        }
+
+        async def resilient_request() -> Dict[str, Any]:
+            return await self.resilience.call(
+                "notion",
+                "search",
+                lambda: self.client.search(**request),
+                retry_on=is_transient_error
+            )
+
+        try:
+            if self.cassette:
+                response = await self.cassette.through("notion", "search", request, resilient_request)
+            else:
+                response = await resilient_request()
+        except Exception as e:
+            self.logger.error(f"Failed to look up CRM entry '{company}': {e}")
+            return None
+
+        database_id = self.database_id.replace("-", "")
+        for page in response.get("results", []):
+            parent = page.get("parent") or {}
+            if (parent.get("database_id") or "").replace("-", "") != database_id:
+                continue
+            if page.get("archived") or page.get("in_trash"):
+                continue
+            title = (page.get("properties") or {}).get("Nom", {}).get("title", [])
+            if "".join(part.get("plain_text", "") for part in title).strip() == company:
+                return page
+        return None
+
+    @staticmethod
+    def _lead_properties(lead: Dict[str, Any]) -> Dict[str, Any]:
+        """CRM properties filled from the research (everything but name, status and date)"""
+        def text(value: Any, limit: int = 2000) -> Dict[str, Any]:
+            if isinstance(value, list):
+                value = "\n".join(
+                    " - ".join(str(v) for v in item.values() if v) if isinstance(item, dict) else str(item)
+                    for item in value
+                )
+            return {"rich_text": [{"text": {"content": str(value or "")[:limit]}}]}
+
+        properties = {
+            "Secteur": text(lead.get("sector")),
+            "Taille": text(lead.get("size")),
+            "CA estimé": text(lead.get("estimated_revenue")),
+            "Contacts": text(lead.get("contacts")),
+            "Angles d'approche": text(lead.get("approach_angles")),
+            "Prochaines actions": text(lead.get("next_actions")),
+            "Sources": text(lead.get("sources"), limit=1000)
+        }
+
+        if lead.get("fit_score") is not None:
+            properties["Score fit"] = {"number": lead["fit_score"]}
+
+        return properties
+
+    async def _create_page(self, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a page in the connector's database through the resilience layer
+
+        Args:
+            properties: Notion page properties
+
+        Returns:
+            Created page object
+        """
+        async def resilient_request() -> Dict[str, Any]:
+            return await self.resilience.call(
+                "notion",
+                "pages",
+                lambda: self.client.pages.create(
+                    parent={"database_id": self.database_id},
+                    properties=properties
+                ),
+                retry_on=is_transient_error
+            )
+
+        if self.cassette:
+            return await self.cassette.through(
+                "notion",
+                "pages",
+                {"database_id": self.database_id, "properties": properties},
+                resilient_request
+            )
+        return await resilient_request()
+
+    async def _update_page(self, page_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update a page's properties through the resilience layer
+
+        Args:
+            page_id: Page id
+            properties: Notion page properties to overwrite
+
+        Returns:
+            Updated page object
+        """
+        async def resilient_request() -> Dict[str, Any]:
+            return await self.resilience.call(
+                "notion",
+                "pages",
+                lambda: self.client.pages.update(page_id=page_id, properties=properties),
+                retry_on=is_transient_error
+            )
+
+        if self.cassette:
+            return await self.cassette.through(
+                "notion",
+                "pages.update",
+                {"page_id": page_id, "properties": properties},
+                resilient_request
+            )
+        return await resilient_request()
+
+    async def create_todos_batch(
         self,
-        priorities: Dict[str, List[Dict[str, Any]]]
+        priorities: Dict[str, List[Priority]],
+        outcomes: Optional[Dict[str, Dict[str, str]]] = None
     ) -> Dict[str, int]:
         """
         Create multiple TODOs from priorities
 
         Args:
-            priorities: Dictionary with keys: engagements, demandes, deadlines
+            priorities: Priority items by type: engagements, demandes, deadlines
+            outcomes: If given, filled with "created" or "failed" by type and title
 
         Returns:
-            Dictionary with counts of created TODOs per type
+            Dictionary with counts of created TODOs per type, their total and
+            the number of failed creations
         """
         stats = {
             "engagements": 0,
             "demandes": 0,
             "deadlines": 0,
-            "total": 0
+            "total": 0,
+            "failed": 0
         }
 
-        # Create engagements
-        for item in priorities.get("engagements", []):
-            result = self.create_todo(
-                title=item.get("title", "Sans titre"),
-                todo_type="engagement",
-                description=item.get("description", ""),
-                confidence=item.get("confidence", 1.0),
-                source=item.get("source", "")
-            )
-            if result:
-                stats["engagements"] += 1
-                stats["total"] += 1
-
-        # Create demandes
-        for item in priorities.get("demandes", []):
-            result = self.create_todo(
-                title=item.get("title", "Sans titre"),
-                todo_type="demande",
-                description=item.get("description", ""),
-                confidence=item.get("confidence", 1.0),
-                source=item.get("source", "")
-            )
-            if result:
-                stats["demandes"] += 1
-                stats["total"] += 1
-
-        # Create deadlines
-        for item in priorities.get("deadlines", []):
-            result = self.create_todo(
-                title=item.get("title", "Sans titre"),
-                todo_type="deadline",
-                description=item.get("description", ""),
-                date=item.get("date"),
-                confidence=item.get("confidence", 1.0),
-                source=item.get("source", "")
-            )
-            if result:
-                stats["deadlines"] += 1
-                stats["total"] += 1
+        for item_type, todo_type in TODO_TYPES.items():
+            for item in priorities.get(item_type, []):
+                result = await self.create_todo(
+                    title=item.title,
+                    todo_type=todo_type,
+                    description=item.description,
+                    # Only deadlines are dated in Notion
+                    date=item.date if item_type == "deadlines" else None,
+                    confidence=item.confidence,
+                    source=item.source
+                )
+                if result:
+                    stats[item_type] += 1
+                    stats["total"] += 1
+                else:
+                    stats["failed"] += 1
+                if outcomes is not None:
+                    outcomes.setdefault(item_type, {})[item.title] = "created" if result else "failed"
 
         self.logger.info(f"Created {stats['total']} TODOs in Notion")
+        if stats["failed"]:
+            self.logger.warning(f"Failed to create {stats['failed']} TODOs in Notion")
         return stats
 
     def get_database_url(self) -> str:
@@ -7,156 +7,1093 @@ Usage:
     nexus priorities today      # Priorités du jour
     nexus priorities week       # Priorités de la semaine
     nexus priorities today --dry-run  # Test sans créer dans Notion
+    nexus priorities today --record runs/today.json.gz  # Enregistre le trafic API
+    nexus priorities today --replay runs/today.json.gz  # Rejoue sans réseau
+    nexus search "proposition ESI" --since 7d          # Recherche locale
+    nexus contact "Marc Veilleux"                      # Engagements ouverts d'un contact
+    nexus contact "Marc Veilleux" --done "devis"       # Clôt un engagement tenu
+    nexus priorities today --all-profiles              # Tous les profils en parallèle
+    nexus priorities today --format ndjson             # Sortie JSON en continu
+    nexus eval --corpus corpus.jsonl --stub stubs.json # Compare les variantes de prompt
+    nexus priorities week --bounded-memory             # Mémoire constante (gros volumes)
+    nexus prewarm today                                # Pré-calcul (cron) pour un matin instantané
+    nexus lead "LMS Systems" --site https://lms.ca     # Recherche de lead vers le CRM
+    nexus run today                                    # Tous les skills, un seul fetch
+    nexus stats --weeks 8                              # Statistiques d'utilisation
+    nexus stats --profile christian                    # Statistiques d'un profil
 """
 
 import asyncio
 import argparse
+import functools
+import json
 import logging
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.utils import Config
-from src.connectors import LimitlessConnector, NotionConnector, ClaudeConnector
-from skills.priority_detector.scripts import analyze_priorities, format_priorities_markdown
+from src.utils import (
+    Config, Resilience, SearchIndex, EntityIndex, SharedResources, PrewarmStore,
+    SkillRunner, RunHistory, open_cassette, load_registry, discover_skills, register_skills,
+    setup_logging, logging_options, run_record
+)
 
+# Skill directories are hyphenated; expose them as skills.<name>
+register_skills(project_root / "skills")
 
-def setup_logging(level: str = "INFO"):
-    """Setup logging configuration"""
-    log_level = getattr(logging, level.upper(), logging.INFO)
+from skills.priority_detector.scripts import (
+    DailyPartitionStore,
+    LifelogDeltaStore,
+    analyze_priorities,
+    merge_results,
+    format_priorities_json,
+    format_priority_record,
+    iter_priorities_markdown,
+    iter_priorities_json,
+    iter_new_priorities_markdown,
+    format_stats_record
+)
 
-    # Create formatters
-    console_format = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S'
+
+def configure_logging(verbose: bool = False):
+    """
+    Start non-blocking logging from the `logging` section of config.yaml
+
+    Args:
+        verbose: Log DEBUG to the console and the file
+    """
+    try:
+        options = logging_options(Config("config/config.yaml").get_logging_config())
+    except FileNotFoundError:
+        options = logging_options({})
+
+    if verbose:
+        options["level"] = "DEBUG"
+    setup_logging(console_level="DEBUG" if verbose else "INFO", **options)
+
+
+def status_printer(output_format: str):
+    """Print progress to stdout for markdown, stderr for machine-readable formats"""
+    if output_format == "markdown":
+        return print
+    return functools.partial(print, file=sys.stderr)
+
+
+def emit(line: str):
+    """Write one machine-readable record to stdout immediately"""
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+def emit_chunks(chunks):
+    """Write a document produced piece by piece, without joining it first"""
+    for chunk in chunks:
+        sys.stdout.write(chunk)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def create_connectors(config: Config, resilience: Resilience, cassette=None, shared=None):
+    """
+    Build the Limitless, Claude and Notion connectors for a configuration
+
+    Args:
+        config: Configuration (or profile configuration)
+        resilience: Retry/circuit-breaker layer for this run
+        cassette: Optional record/replay cassette
+        shared: Optional SharedResources (pools, cache) for multi-profile runs
+
+    Returns:
+        Tuple (limitless, claude, notion)
+    """
+    # Deferred: the Anthropic SDK is slow to import and pre-warmed runs
+    # print their report before any connector exists
+    from src.connectors import LimitlessConnector, NotionConnector, ClaudeConnector
+
+    http_client = shared.http_client if shared else None
+    cache = shared.cache if shared else None
+
+    limitless_config = config.get_limitless_config()
+    limitless = LimitlessConnector(
+        api_key=limitless_config.get('api_key'),
+        endpoint=limitless_config.get('endpoint', 'https://api.limitless.ai/v1'),
+        resilience=resilience,
+        hedge_after=limitless_config.get('hedge_after_seconds'),
+        cassette=cassette,
+        http_client=http_client,
+        cache=cache,
+        include_conversations=limitless_config.get('include_conversations', True)
+    )
+
+    anthropic_config = config.get_anthropic_config()
+    claude = ClaudeConnector(
+        api_key=anthropic_config.get('api_key'),
+        model=anthropic_config.get('model', 'claude-sonnet-4-5-20250929'),
+        resilience=resilience,
+        cassette=cassette,
+        client=shared.anthropic_client(anthropic_config.get('api_key')) if shared else None,
+        cache=cache,
+        prompt_template=load_registry().get(
+            config.get_priority_detector_config().get('prompt_template', 'priority_detection')
+        )
     )
 
-    file_format = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+    notion_config = config.get_notion_config()
+    notion = NotionConnector(
+        api_token=notion_config.get('token'),
+        database_id=notion_config.get('todo_database_id'),
+        resilience=resilience,
+        cassette=cassette,
+        http_client=shared.notion_client(notion_config.get('token')) if shared else None
     )
 
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(console_format)
+    return limitless, claude, notion
+
 
-    # File handler
-    file_handler = logging.FileHandler('nexus.log')
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(file_format)
+def record_run(
+    config: Config,
+    results,
+    command: str,
+    period: str,
+    run_at: datetime,
+    profile: str = None,
+    timings=None
+):
+    """
+    Append a run to the local history (never fails the run)
 
-    # Root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    Args:
+        config: Top-level configuration (profile runs share its history)
+        results: Results from analyze_priorities
+        command: CLI command that ran the analysis
+        period: Time period (today/week)
+        run_at: Start of the run
+        profile: Profile name for multi-profile runs
+        timings: Named step durations in seconds
+    """
+    try:
+        RunHistory(str(config.get_data_dir() / "history")).record(run_record(
+            results,
+            command=command,
+            period=period,
+            elapsed=(datetime.now() - run_at).total_seconds(),
+            profile=profile,
+            run_at=run_at,
+            timings=timings
+        ))
+    except (OSError, ValueError) as e:
+        logging.getLogger("nexus.cli").warning(f"Failed to record run history: {e}")
+
+
+async def run_analysis(
+    config: Config,
+    limitless,
+    claude,
+    notion,
+    resilience: Resilience,
+    period: str,
+    dry_run: bool,
+    on_priority=None,
+    bounded_memory: bool = False,
+    since: datetime = None,
+    incremental: bool = True
+):
+    """
+    Run the priority detector against one configuration's local indexes
+
+    Args:
+        config: Configuration (or profile configuration)
+        limitless: Limitless connector
+        claude: Claude connector
+        notion: Notion connector
+        resilience: Retry/circuit-breaker layer whose stats are reported
+        period: Time period (today/week)
+        dry_run: If True, don't create Notion TODOs
+        on_priority: Streaming callback for each extracted priority
+        bounded_memory: Force bounded-memory mode (else priority_detector.bounded_memory)
+        since: Only analyze lifelogs recorded after this time
+        incremental: Send only transcript segments added since the last run
+            (when priority_detector.incremental is on) and roll longer periods
+            up from stored daily partitions (when priority_detector.partitions is on)
+
+    Returns:
+        Results from analyze_priorities
+    """
+    # Local full-text index over every lifelog fetched so far
+    search_index = SearchIndex(str(config.get_data_dir() / "search.db"))
+    search_config = config.get_search_config()
+    entity_index = EntityIndex(str(config.get_data_dir() / "entities.db"))
+    detector_config = config.get_priority_detector_config()
+
+    delta_store = None
+    if incremental and detector_config.get('incremental', True):
+        delta_store = LifelogDeltaStore(
+            str(config.get_data_dir() / "lifelog_delta.json"),
+            template_id=claude.prompt_template.id,
+            overlap_segments=detector_config.get('overlap_segments', 3)
+        )
+
+    partitions = None
+    if incremental and detector_config.get('partitions', True):
+        partitions = DailyPartitionStore(
+            str(config.get_data_dir() / "partitions"),
+            template_id=claude.prompt_template.id,
+            settle_hours=detector_config.get('partition_settle_hours', 1),
+            retention_days=detector_config.get('partition_retention_days', 35)
+        )
+
+    try:
+        return await analyze_priorities(
+            limitless_connector=limitless,
+            claude_connector=claude,
+            notion_connector=notion,
+            period=period,
+            dry_run=dry_run,
+            resilience=resilience,
+            search_index=search_index,
+            context_snippets=search_config.get('context_snippets', 0),
+            entity_index=entity_index,
+            on_priority=on_priority,
+            confidence_threshold=detector_config.get('confidence_threshold', 0.0),
+            max_priorities_per_day=detector_config.get('max_priorities_per_day'),
+            bounded_memory=bounded_memory or detector_config.get('bounded_memory', False),
+            chunk_chars=detector_config.get('chunk_chars', 40000),
+            since=since,
+            delta_store=delta_store,
+            partitions=partitions
+        )
+    finally:
+        search_index.close()
+        entity_index.close()
 
 
-async def run_priority_detector(period: str, dry_run: bool = False):
+async def run_priority_detector(
+    period: str,
+    dry_run: bool = False,
+    record: str = None,
+    replay: str = None,
+    output_format: str = "markdown",
+    bounded_memory: bool = False,
+    use_prewarm: bool = True
+):
     """
     Run priority detector workflow
 
     Args:
         period: Time period (today/week)
         dry_run: If True, don't create Notion TODOs
+        record: Cassette path to record all connector traffic into
+        replay: Cassette path to serve connector traffic from (no network)
+        output_format: markdown, json, or ndjson (streamed as priorities arrive)
+        bounded_memory: Analyze in chunks with flat memory use (large windows)
+        use_prewarm: Answer from `nexus prewarm` results, then revalidate
     """
     logger = logging.getLogger("nexus.cli")
+    invoked_at = datetime.now()
 
-    print("\n🚀 NEXUS - AI-Powered Priority Assistant")
-    print("=" * 50)
-    print(f"📅 Période : {period}")
-    print(f"🔬 Mode : {'DRY-RUN (test)' if dry_run else 'PRODUCTION'}")
-    print("=" * 50)
-    print()
+    # Machine-readable formats keep stdout for results only
+    info = status_printer(output_format)
+
+    info("\n🚀 NEXUS - AI-Powered Priority Assistant")
+    info("=" * 50)
+    info(f"📅 Période : {period}")
+    info(f"🔬 Mode : {'DRY-RUN (test)' if dry_run else 'PRODUCTION'}")
+    if record:
+        info(f"📼 Enregistrement : {record}")
+    if replay:
+        info(f"📼 Rejeu : {replay}")
+    info("=" * 50)
+    info()
 
     # Load configuration
     try:
         config = Config("config/config.yaml")
         logger.info("Configuration loaded successfully")
     except FileNotFoundError as e:
-        print(f"\n❌ Erreur : {e}")
-        print("\n💡 Conseil : Copiez config/config.example.yaml vers config/config.yaml")
-        print("   et remplissez vos clés API.")
+        info(f"\n❌ Erreur : {e}")
+        info("\n💡 Conseil : Copiez config/config.example.yaml vers config/config.yaml")
+        info("   et remplissez vos clés API.")
         return 1
 
+    # Pre-warmed results answer right away; only newer lifelogs are analyzed
+    store = PrewarmStore(str(config.get_data_dir() / "prewarm"))
+    cached = None
+    if use_prewarm and not (record or replay):
+        cached = store.load(
+            period,
+            max_age_hours=config.get_prewarm_config().get('max_age_hours', 12),
+            dry_run=dry_run
+        )
+    if cached:
+        show_prewarmed(cached, period, output_format, invoked_at)
+
     # Initialize connectors
-    print("🔌 Connexion aux services...")
+    info("🔌 Connexion aux services...")
 
-    try:
-        # Limitless
-        limitless_config = config.get_limitless_config()
-        limitless = LimitlessConnector(
-            api_key=limitless_config.get('api_key'),
-            endpoint=limitless_config.get('endpoint', 'https://api.limitless.ai/v1')
-        )
-        print("  ✅ Limitless")
+    # Shared retry/deadline/circuit-breaker layer for all connectors
+    resilience = Resilience.from_config(config.get_resilience_config())
 
-        # Claude (Anthropic)
-        anthropic_config = config.get_anthropic_config()
-        claude = ClaudeConnector(
-            api_key=anthropic_config.get('api_key'),
-            model=anthropic_config.get('model', 'claude-sonnet-4-5-20250929')
-        )
-        print("  ✅ Claude (Anthropic)")
+    try:
+        cassette = open_cassette(record=record, replay=replay)
+    except FileNotFoundError as e:
+        info(f"\n❌ Erreur : {e}")
+        return 1
 
-        # Notion
-        notion_config = config.get_notion_config()
-        notion = NotionConnector(
-            api_token=notion_config.get('token'),
-            database_id=notion_config.get('todo_database_id')
-        )
-        print("  ✅ Notion")
+    try:
+        limitless, claude, notion = create_connectors(config, resilience, cassette)
+        info("  ✅ Limitless")
+        info("  ✅ Claude (Anthropic)")
+        info("  ✅ Notion")
 
     except Exception as e:
         logger.error(f"Failed to initialize connectors: {e}")
-        print(f"\n❌ Erreur d'initialisation : {e}")
+        info(f"\n❌ Erreur d'initialisation : {e}")
         return 1
 
-    print()
+    info()
 
     # Run priority detection
     start_time = datetime.now()
 
-    print("🔍 Analyse en cours...")
-    print()
+    info("🔍 Analyse en cours...")
+    info()
 
     try:
-        results = await analyze_priorities(
-            limitless_connector=limitless,
-            claude_connector=claude,
-            notion_connector=notion,
-            period=period,
-            dry_run=dry_run
+        on_priority = None
+        if output_format == "ndjson" and not cached:
+            def on_priority(item_type, item):
+                emit(format_priority_record(item_type, item))
+
+        results = await run_analysis(
+            config, limitless, claude, notion, resilience, period, dry_run,
+            on_priority=on_priority,
+            bounded_memory=bounded_memory,
+            since=cached["fetched_until"] if cached else None,
+            # Cassettes hold the full prompts; a delta would not match them
+            incremental=not (record or replay)
         )
+        if not replay:
+            record_run(config, results, "priorities", period, start_time)
 
-        # Format and display results
-        markdown_output = format_priorities_markdown(results, period)
-        print(markdown_output)
+        if cached:
+            results = merge_results(
+                cached["results"],
+                results,
+                period=period,
+                max_priorities_per_day=config.get_priority_detector_config().get('max_priorities_per_day')
+            )
+        if not replay:
+            store.save(period, results, fetched_until=start_time)
 
-        # Display execution time
         elapsed = (datetime.now() - start_time).total_seconds()
-        print()
-        print(f"⏱️  Temps d'exécution : {elapsed:.1f}s")
+
+        # Format and display results
+        if output_format == "ndjson":
+            for item_type, items in results.get("new_priorities", {}).items():
+                for item in items:
+                    emit(format_priority_record(item_type, item))
+            emit(format_stats_record(results, period, elapsed))
+        elif output_format == "json":
+            emit_chunks(iter_priorities_json(results, period, elapsed))
+        else:
+            lines = (
+                iter_new_priorities_markdown(results["new_priorities"], cached["fetched_until"])
+                if cached else iter_priorities_markdown(results, period)
+            )
+            for line in lines:
+                print(line)
+            print()
+            print(f"⏱️  Temps d'exécution : {elapsed:.1f}s")
 
         # Success message
         if results.get("success"):
-            print("\n✨ Analyse terminée avec succès !")
+            info("\n✨ Analyse terminée avec succès !")
             return 0
         else:
-            print(f"\n⚠️  Avertissement : {results.get('message')}")
+            info(f"\n⚠️  Avertissement : {results.get('message')}")
             return 0
 
     except Exception as e:
         logger.error(f"Priority detection failed: {e}", exc_info=True)
-        print(f"\n❌ Erreur lors de l'analyse : {e}")
-        print("\n💡 Consultez nexus.log pour plus de détails")
+        info(f"\n❌ Erreur lors de l'analyse : {e}")
+        info("\n💡 Consultez nexus.log pour plus de détails")
         return 1
 
+    finally:
+        if cassette:
+            cassette.save()
+
+
+def show_prewarmed(entry, period: str, output_format: str, invoked_at: datetime):
+    """
+    Print pre-warmed results before they are revalidated
+
+    Args:
+        entry: Entry loaded from the PrewarmStore
+        period: Time period (today/week)
+        output_format: markdown, json, or ndjson (json waits for the merged document)
+        invoked_at: Start of the command, for the time-to-first-answer
+    """
+    results = entry["results"]
+
+    if output_format == "ndjson":
+        for item_type, items in results.get("priorities", {}).items():
+            for item in items:
+                emit(format_priority_record(item_type, item))
+    elif output_format == "markdown":
+        for line in iter_priorities_markdown(results, period):
+            print(line)
+        print()
+        elapsed_ms = (datetime.now() - invoked_at).total_seconds() * 1000
+        print(
+            f"⚡ Rapport pré-calculé à {entry['fetched_until']:%H:%M} ({elapsed_ms:.0f} ms), "
+            f"vérification des nouveaux lifelogs..."
+        )
+        print()
+        sys.stdout.flush()
+
+
+async def run_prewarm(period: str, dry_run: bool = False, bounded_memory: bool = False):
+    """
+    Run the full pipeline ahead of time (cron) and save the results
+
+    Args:
+        period: Time period (today/week)
+        dry_run: If True, don't create Notion TODOs
+        bounded_memory: Analyze in chunks with flat memory use (large windows)
+    """
+    logger = logging.getLogger("nexus.cli")
+
+    try:
+        config = Config("config/config.yaml")
+    except FileNotFoundError as e:
+        print(f"\n❌ Erreur : {e}")
+        return 1
+
+    start_time = datetime.now()
+    resilience = Resilience.from_config(config.get_resilience_config())
+
+    try:
+        limitless, claude, notion = create_connectors(config, resilience)
+        results = await run_analysis(
+            config, limitless, claude, notion, resilience, period, dry_run,
+            bounded_memory=bounded_memory
+        )
+    except Exception as e:
+        logger.error(f"Prewarm failed: {e}", exc_info=True)
+        print(f"\n❌ Erreur lors du pré-calcul : {e}")
+        return 1
+
+    if not results.get("success"):
+        # A failed analysis must not stand in for the lifelogs it covered
+        record_run(config, results, "prewarm", period, start_time)
+        print(f"⚠️  Pré-calcul {period} non enregistré : {results.get('message')}")
+        return 1
+
+    PrewarmStore(str(config.get_data_dir() / "prewarm")).save(
+        period, results, fetched_until=start_time
+    )
+    record_run(config, results, "prewarm", period, start_time)
+
+    stats = results.get("stats", {})
+    elapsed = (datetime.now() - start_time).total_seconds()
+    print(
+        f"✅ Pré-calcul {period} : {stats.get('priorities_kept', 0)} priorités, "
+        f"{stats.get('lifelogs_analyzed', 0)} lifelogs ({elapsed:.1f}s)"
+    )
+    return 0
+
+
+async def run_all_profiles(
+    period: str,
+    dry_run: bool = False,
+    output_format: str = "markdown",
+    bounded_memory: bool = False
+):
+    """
+    Run the priority detector for every configured profile concurrently
+
+    Profiles share one event loop, HTTP pool and result cache, and are
+    scheduled fairly under the global per-service rate limits.
+
+    Args:
+        period: Time period (today/week)
+        dry_run: If True, don't create Notion TODOs
+        output_format: markdown, json, or ndjson (streamed as priorities arrive)
+        bounded_memory: Analyze in chunks with flat memory use (large windows)
+    """
+    logger = logging.getLogger("nexus.cli")
+    info = status_printer(output_format)
+
+    try:
+        config = Config("config/config.yaml")
+    except FileNotFoundError as e:
+        info(f"\n❌ Erreur : {e}")
+        return 1
+
+    names = config.profile_names()
+    if not names:
+        info("\n❌ Aucun profil défini dans la section `profiles` de config.yaml")
+        return 1
+
+    info("\n🚀 NEXUS - AI-Powered Priority Assistant")
+    info("=" * 50)
+    info(f"📅 Période : {period}")
+    info(f"🔬 Mode : {'DRY-RUN (test)' if dry_run else 'PRODUCTION'}")
+    info(f"👥 Profils : {', '.join(names)}")
+    info("=" * 50)
+    info()
+
+    shared = SharedResources.from_config(config.get_scheduling_config())
+    start_time = datetime.now()
+
+    async def run_profile(name: str):
+        profile_start = datetime.now()
+        try:
+            profile_config = config.for_profile(name)
+            resilience = Resilience.from_config(
+                profile_config.get_resilience_config(),
+                scheduler=shared.scheduler,
+                profile=name
+            )
+            limitless, claude, notion = create_connectors(
+                profile_config, resilience, shared=shared
+            )
+            on_priority = None
+            if output_format == "ndjson":
+                def on_priority(item_type, item):
+                    emit(format_priority_record(item_type, item, profile=name))
+
+            results = await run_analysis(
+                profile_config, limitless, claude, notion, resilience, period, dry_run,
+                on_priority=on_priority,
+                bounded_memory=bounded_memory
+            )
+            # One history for all profiles, split by the record's `profile` field
+            record_run(config, results, "priorities", period, profile_start, profile=name)
+            return name, results, None, profile_start
+        except Exception as e:
+            logger.error(f"Profile {name} failed: {e}", exc_info=True)
+            return name, None, e, profile_start
+
+    exit_code = 0
+    documents = {}
+    try:
+        tasks = [asyncio.create_task(run_profile(name)) for name in names]
+
+        # One report per profile, printed as soon as that profile is done
+        for next_done in asyncio.as_completed(tasks):
+            name, results, error, profile_start = await next_done
+            elapsed = (datetime.now() - profile_start).total_seconds()
+
+            if error is not None:
+                info(f"❌ Profil {name} : erreur lors de l'analyse : {error}")
+                exit_code = 1
+            elif output_format == "ndjson":
+                emit(format_stats_record(results, period, elapsed, profile=name))
+            elif output_format == "json":
+                documents[name] = json.loads(format_priorities_json(results, period, elapsed))
+            else:
+                print(f"# 👤 Profil : {name}")
+                print()
+                for line in iter_priorities_markdown(results, period):
+                    print(line)
+                print()
+                print(f"⏱️  Temps d'exécution : {elapsed:.1f}s")
+                print()
+
+    finally:
+        await shared.aclose()
+
+    if output_format == "json":
+        emit(json.dumps({"profiles": documents}, ensure_ascii=False, indent=2))
+
+    cache_stats = shared.cache.stats()
+    total = (datetime.now() - start_time).total_seconds()
+    info("=" * 50)
+    info(
+        f"⏱️  Temps total : {total:.1f}s pour {len(names)} profils "
+        f"(cache partagé : {cache_stats['hits']} hits)"
+    )
+    return exit_code
+
+
+def parse_since(value: str) -> str:
+    """Turn "7d" or "YYYY-MM-DD" into an ISO date"""
+    if value.endswith('d') and value[:-1].isdigit():
+        return (datetime.now() - timedelta(days=int(value[:-1]))).date().isoformat()
+    return datetime.fromisoformat(value).date().isoformat()
+
+
+def run_search(query: str, since: str = None, limit: int = 10):
+    """
+    Search the local lifelog index
+
+    Args:
+        query: Free-text query
+        since: Only lifelogs on/after this date ("7d" or YYYY-MM-DD)
+        limit: Maximum number of results
+    """
+    try:
+        config = Config("config/config.yaml")
+    except FileNotFoundError as e:
+        print(f"\n❌ Erreur : {e}")
+        return 1
+
+    try:
+        since_date = parse_since(since) if since else None
+    except ValueError:
+        print(f"\n❌ Date invalide : {since} (attendu : YYYY-MM-DD ou 7d)")
+        return 1
+
+    index_path = config.get_data_dir() / "search.db"
+    if not index_path.exists():
+        print("\n⚠️  Index vide : lancez d'abord `nexus priorities today`")
+        return 1
+
+    start_time = datetime.now()
+    index = SearchIndex(str(index_path))
+    try:
+        results = index.search(query, since=since_date, limit=limit)
+    finally:
+        index.close()
+    elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
+
+    print(f"\n🔎 {len(results)} résultat(s) pour « {query} » ({elapsed_ms:.0f} ms)\n")
+    for result in results:
+        print(f"- {result['title'] or 'Sans titre'} ({result['date']}) [score: {result['score']:.2f}]")
+        print(f"  {result['snippet']}")
+        print()
+
+    return 0
+
+
+def run_contact(name: str, done: str = None):
+    """
+    Show open commitments, requests and deadlines for a contact
+
+    Args:
+        name: Person or company name (partial, accents optional)
+        done: Title (partial) of the contact's items to mark done first
+    """
+    try:
+        config = Config("config/config.yaml")
+    except FileNotFoundError as e:
+        print(f"\n❌ Erreur : {e}")
+        return 1
+
+    index_path = config.get_data_dir() / "entities.db"
+    if not index_path.exists():
+        print("\n⚠️  Index vide : lancez d'abord `nexus priorities today`")
+        return 1
+
+    index = EntityIndex(str(index_path))
+    try:
+        if done:
+            closed = index.close_items(name, done)
+            if not closed:
+                print(f"\n🤷 Aucun élément ouvert « {done} » pour « {name} »")
+                return 1
+            for title in closed:
+                print(f"✅ Clos : {title}")
+        contacts = index.lookup(name)
+    finally:
+        index.close()
+
+    if not contacts:
+        print(f"\n🤷 Aucun contact trouvé pour « {name} »")
+        return 0
+
+    sections = [
+        ("engagements", "Engagements pris"),
+        ("demandes", "Demandes reçues"),
+        ("deadlines", "Deadlines")
+    ]
+
+    for contact in contacts:
+        print(f"\n## 👤 {contact['name']}")
+        print()
+
+        priorities = contact["priorities"]
+        for key, label in sections:
+            if not priorities[key]:
+                continue
+            print(f"### {label}")
+            for item in priorities[key]:
+                line = f"- [ ] {item['title']}"
+                if item.get("date"):
+                    line += f" (deadline: {item['date']})"
+                if item.get("source"):
+                    line += f" [{item['source']}]"
+                print(line)
+            print()
+
+        if not any(priorities.values()):
+            print("✅ Aucun engagement ouvert")
+            print()
+
+        lifelogs = contact["lifelogs"]
+        if lifelogs:
+            latest = lifelogs[0]
+            print(
+                f"📊 {len(lifelogs)} lifelog(s), dernier : "
+                f"{latest['title'] or 'Sans titre'} ({latest['date']})"
+            )
+
+    return 0
+
+
+def run_stats(weeks: int = 4, output_format: str = "markdown", profile: str = None):
+    """
+    Show usage statistics from the precomputed run history aggregates
+
+    Args:
+        weeks: Number of weeks shown, current week included
+        output_format: markdown or json
+        profile: Only count the runs of this profile (`--all-profiles` runs)
+    """
+    try:
+        config = Config("config/config.yaml")
+    except FileNotFoundError as e:
+        print(f"\n❌ Erreur : {e}")
+        return 1
+
+    history = RunHistory(str(config.get_data_dir() / "history"))
+    summary = history.summary(weeks=weeks, profile=profile)
+
+    if output_format == "json":
+        emit(json.dumps(summary, ensure_ascii=False))
+        return 0
+
+    if not any(bucket["runs"] for bucket in summary["weeks"] + summary["days"]):
+        if profile is not None:
+            known = ", ".join(history.profiles()) or "aucun"
+            print(f"\n⚠️  Aucun historique pour le profil {profile} (profils connus : {known})")
+        else:
+            print("\n⚠️  Aucun historique : lancez d'abord `nexus priorities today`")
+        return 0
+
+    def table(title: str, buckets):
+        print(f"### {title}")
+        print("| Période | Runs | Lifelogs | Priorités (retenues/détectées) | TODOs | Tokens entrée | Tokens sortie | Durée moy. |")
+        print("|---|---|---|---|---|---|---|---|")
+        for bucket in buckets:
+            if not bucket["runs"]:
+                continue
+            runs = int(bucket["runs"])
+            print(
+                f"| {bucket['key']} | {runs} | {int(bucket['lifelogs_analyzed'])} "
+                f"| {int(bucket['priorities_kept'])}/{int(bucket['priorities_detected'])} "
+                f"| {int(bucket['todos_created'])} | {int(bucket['input_tokens'])} "
+                f"| {int(bucket['output_tokens'])} | {bucket['elapsed_seconds'] / runs:.1f}s |"
+            )
+        print()
+
+    scope = f" - profil {profile}" if profile is not None else ""
+    print(f"\n## 📈 Statistiques d'utilisation{scope} - {weeks} dernières semaines")
+    print()
+    table("Par semaine", summary["weeks"])
+    table("7 derniers jours", summary["days"])
+
+    totals = {
+        key: sum(bucket[key] for bucket in summary["weeks"])
+        for key in (
+            "runs", "failed_runs", "priorities_kept", "todos_failed",
+            "engagements", "demandes", "deadlines"
+        )
+    }
+    print(
+        f"🎯 {int(totals['priorities_kept'])} priorités : {int(totals['engagements'])} engagements, "
+        f"{int(totals['demandes'])} demandes, {int(totals['deadlines'])} deadlines"
+    )
+    if totals["failed_runs"]:
+        print(f"⚠️  {int(totals['failed_runs'])}/{int(totals['runs'])} runs sans résultat ou en échec")
+    if totals["todos_failed"]:
+        print(f"⚠️  {int(totals['todos_failed'])} TODOs non créés dans Notion (échec)")
+
+    return 0
+
+
+async def run_eval(
+    corpus_path: str,
+    variants: str = None,
+    stub: str = None,
+    record: str = None,
+    replay: str = None,
+    min_precision: float = 0.9,
+    min_recall: float = 0.5,
+    output_format: str = "markdown"
+):
+    """
+    Compare prompt variants on a labeled corpus
+
+    Args:
+        corpus_path: JSONL corpus of labeled lifelogs
+        variants: Comma-separated template names (default: all)
+        stub: JSON file of canned responses per variant and sample (no network)
+        record: Cassette path to record Claude traffic into
+        replay: Cassette path to serve Claude traffic from (no network)
+        min_precision: Precision target used for the recommendation
+        min_recall: Recall target used for the recommendation
+        output_format: markdown or json
+    """
+    from src.connectors import ClaudeConnector
+    from anthropic import AsyncAnthropic
+    from skills.priority_detector.scripts.evaluate import (
+        load_corpus,
+        load_stubs,
+        evaluate_prompts,
+        stub_connector_factory,
+        format_evaluation_markdown
+    )
+
+    logger = logging.getLogger("nexus.cli")
+    registry = load_registry()
+
+    try:
+        corpus = load_corpus(corpus_path)
+        names = variants.split(',') if variants else registry.names()
+        templates = [registry.get(name.strip()) for name in names]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"\n❌ Erreur : {e}")
+        return 1
+
+    cassette = None
+    if stub:
+        make_connector = stub_connector_factory(load_stubs(stub), model="stub")
+    else:
+        try:
+            config = Config("config/config.yaml")
+            cassette = open_cassette(record=record, replay=replay)
+        except FileNotFoundError as e:
+            print(f"\n❌ Erreur : {e}")
+            return 1
+
+        anthropic_config = config.get_anthropic_config()
+        resilience = Resilience.from_config(config.get_resilience_config())
+        client = AsyncAnthropic(api_key=anthropic_config.get('api_key'), max_retries=0)
+
+        def make_connector(template, sample):
+            return ClaudeConnector(
+                api_key=anthropic_config.get('api_key'),
+                model=anthropic_config.get('model', 'claude-sonnet-4-5-20250929'),
+                resilience=resilience,
+                cassette=cassette,
+                client=client,
+                prompt_template=template
+            )
+
+    try:
+        report = await evaluate_prompts(
+            corpus, templates, make_connector, min_precision, min_recall
+        )
+    except Exception as e:
+        logger.error(f"Prompt evaluation failed: {e}", exc_info=True)
+        print(f"\n❌ Erreur lors de l'évaluation : {e}")
+        return 1
+    finally:
+        if cassette:
+            cassette.save()
+
+    if output_format == "json":
+        emit(json.dumps(report, ensure_ascii=False))
+    else:
+        print(format_evaluation_markdown(report))
+
+    return 0
+
+
+async def run_lead(company: str, site: str = None, dry_run: bool = False, refresh: bool = False):
+    """
+    Research a lead and add it to the Notion CRM
+
+    Args:
+        company: Company name
+        site: Company website root (enables the {site} sources)
+        dry_run: If True, don't create the CRM entry
+        refresh: Ignore cached pages and analysis
+    """
+    from src.connectors import ClaudeConnector, NotionConnector
+    from src.utils.prompts import PromptRegistry
+    from skills.lead_researcher.scripts import (
+        PageCache,
+        HttpFetcher,
+        research_lead,
+        format_lead_markdown
+    )
+
+    logger = logging.getLogger("nexus.cli")
+
+    print(f"\n🔎 NEXUS - Recherche de lead : {company}")
+    print("=" * 50)
+
+    try:
+        config = Config("config/config.yaml")
+    except FileNotFoundError as e:
+        print(f"\n❌ Erreur : {e}")
+        return 1
+
+    lead_config = config.get_lead_researcher_config()
+    try:
+        template = PromptRegistry(
+            project_root / "skills" / "lead-researcher" / "resources" / "prompt_templates.json"
+        ).get(lead_config.get('prompt_template', 'lead_research'))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"\n❌ Erreur : {e}")
+        return 1
+
+    cache = PageCache(
+        str(config.get_data_dir() / "pages"),
+        ttl_seconds=lead_config.get('cache_ttl_hours', 168) * 3600
+    )
+    cache.evict_expired()
+    if refresh:
+        # Entries this lookup touches are treated as expired and replaced
+        cache.ttl_seconds = 0
+
+    resilience = Resilience.from_config(config.get_resilience_config())
+    anthropic_config = config.get_anthropic_config()
+    notion_config = config.get_notion_config()
+
+    fetcher = HttpFetcher(
+        resilience=resilience,
+        max_concurrency=lead_config.get('max_concurrency', 6),
+        timeout=lead_config.get('fetch_timeout', 10)
+    )
+    claude = ClaudeConnector(
+        api_key=anthropic_config.get('api_key'),
+        model=anthropic_config.get('model', 'claude-sonnet-4-5-20250929'),
+        resilience=resilience
+    )
+    notion = NotionConnector(
+        api_token=notion_config.get('token'),
+        database_id=notion_config.get('crm_database_id'),
+        resilience=resilience
+    )
+
+    try:
+        results = await research_lead(
+            company,
+            fetcher,
+            claude,
+            notion,
+            template,
+            sources=lead_config.get('sources', ["https://fr.wikipedia.org/wiki/{company}"]),
+            site=site,
+            cache=cache,
+            dry_run=dry_run,
+            max_chars=lead_config.get('max_chars', 12000)
+        )
+    except Exception as e:
+        logger.error(f"Lead research failed: {e}", exc_info=True)
+        print(f"\n❌ Erreur lors de la recherche : {e}")
+        return 1
+
+    if not results.get("success"):
+        print(f"\n⚠️  {results.get('message', 'Échec de la recherche')}")
+        return 1
+
+    print()
+    print(format_lead_markdown(results))
+    print()
+
+    return 0
+
+
+async def run_skills(period: str, dry_run: bool = False, skills: str = None, list_only: bool = False):
+    """
+    Run every enabled skill over one shared fetch of lifelogs
+
+    Args:
+        period: Time period (today/week)
+        dry_run: If True, skills don't write to Notion
+        skills: Comma-separated skill ids (default: skills.enabled, else all)
+        list_only: Only list the discovered skills
+    """
+    logger = logging.getLogger("nexus.cli")
+
+    try:
+        config = Config("config/config.yaml")
+    except FileNotFoundError as e:
+        print(f"\n❌ Erreur : {e}")
+        return 1
+
+    available = discover_skills(project_root / "skills")
+
+    if list_only:
+        print("\n🧩 Skills disponibles :")
+        for skill in available:
+            mode = "lifelogs" if hasattr(skill["module"], "run_skill") else "à la demande"
+            print(f"- {skill['id']} ({mode}) : {skill['description']}")
+        return 0
+
+    enabled = skills.split(',') if skills else config.get_skills_config().get('enabled')
+    runner = SkillRunner(available, enabled=[name.strip() for name in enabled] if enabled else None)
+    if not runner.skills:
+        print("\n⚠️  Aucun skill à exécuter")
+        return 1
+
+    print("\n🚀 NEXUS - Skills")
+    print("=" * 50)
+    print(f"📅 Période : {period}")
+    print(f"🔬 Mode : {'DRY-RUN (test)' if dry_run else 'PRODUCTION'}")
+    print(f"🧩 Skills : {', '.join(skill['id'] for skill in runner.skills)}")
+    print("=" * 50)
+
+    resilience = Resilience.from_config(config.get_resilience_config())
+    limitless, claude, notion = create_connectors(config, resilience)
+    search_index = SearchIndex(str(config.get_data_dir() / "search.db"))
+    entity_index = EntityIndex(str(config.get_data_dir() / "entities.db"))
+
+    context = {
+        "config": config,
+        "period": period,
+        "dry_run": dry_run,
+        "claude": claude,
+        "notion": notion,
+        "resilience": resilience,
+        "search_index": search_index,
+        "entity_index": entity_index
+    }
+
+    run_at = datetime.now()
+    try:
+        report = await runner.run(limitless, context, days=1 if period == "today" else 7)
+    except Exception as e:
+        logger.error(f"Skill run failed: {e}", exc_info=True)
+        print(f"\n❌ Erreur lors de l'exécution : {e}")
+        return 1
+    finally:
+        search_index.close()
+        entity_index.close()
+
+    if "priority-detector" in report["results"]:
+        record_run(
+            config, report["results"]["priority-detector"], "run", period, run_at,
+            timings=report["timings"]
+        )
+
+    modules = {skill["id"]: skill["module"] for skill in runner.skills}
+    for skill_id, results in report["results"].items():
+        print(f"\n# 🧩 {skill_id}\n")
+        if not results.get("success"):
+            print(f"⚠️  {results.get('message', 'Échec')}")
+        elif hasattr(modules[skill_id], "format_report"):
+            print(modules[skill_id].format_report(results, context))
+
+    timings = report["timings"]
+    print()
+    print(f"📥 {report['lifelogs']} lifelogs récupérés une seule fois en {timings['fetch']:.2f}s")
+    print("⏱️  Temps par skill : " + ", ".join(
+        f"{skill_id} {timings[skill_id]:.2f}s" for skill_id in report["results"]
+    ))
+
+    return 0 if all(results.get("success") for results in report["results"].values()) else 1
+
 
 def main():
     """Main CLI entry point"""
@@ -168,6 +1105,17 @@ Examples:
   nexus priorities today           # Priorités du jour
   nexus priorities week            # Priorités de la semaine
   nexus priorities today --dry-run # Test sans créer dans Notion
+  nexus priorities today --record cassettes/today.json.gz
+  nexus priorities today --replay cassettes/today.json.gz
+  nexus priorities today --all-profiles
+  nexus priorities today --format ndjson | jq .title
+  nexus search "proposition ESI" --since 7d
+  nexus contact "Marc Veilleux"
+  nexus prewarm today              # À lancer via cron avant le premier café
+  nexus eval --corpus corpus.jsonl --replay cassettes/eval.json.gz
+  nexus lead "LMS Systems" --site https://lms.example --dry-run
+  nexus run today --skills priority-detector --dry-run
+  nexus stats --weeks 8
 
 Documentation: https://github.com/chrisboulet/Nexus
         """
@@ -191,26 +1139,314 @@ Documentation: https://github.com/chrisboulet/Nexus
         action='store_true',
         help='Mode test : ne crée pas les TODOs dans Notion'
     )
+    cassette_group = priorities_parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        '--record',
+        metavar='CASSETTE',
+        help='Enregistre tout le trafic API dans une cassette compressée'
+    )
+    cassette_group.add_argument(
+        '--replay',
+        metavar='CASSETTE',
+        help='Rejoue une cassette enregistrée (aucun appel réseau)'
+    )
+    priorities_parser.add_argument(
+        '--format',
+        choices=['markdown', 'json', 'ndjson'],
+        default='markdown',
+        help='Format de sortie (ndjson : une priorité par ligne dès son extraction)'
+    )
+    priorities_parser.add_argument(
+        '--all-profiles',
+        action='store_true',
+        help='Traite tous les profils de config.yaml en parallèle'
+    )
+    priorities_parser.add_argument(
+        '--bounded-memory',
+        action='store_true',
+        help='Analyse par morceaux à mémoire constante (grandes périodes, backfills)'
+    )
+    priorities_parser.add_argument(
+        '--no-prewarm',
+        action='store_true',
+        help='Ignore les résultats de `nexus prewarm` et refait toute l\'analyse'
+    )
     priorities_parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help='Mode verbeux (plus de logs)'
     )
 
+    # prewarm command
+    prewarm_parser = subparsers.add_parser(
+        'prewarm',
+        help='Pré-calcule les priorités (cron) pour une réponse instantanée ensuite'
+    )
+    prewarm_parser.add_argument(
+        'period',
+        nargs='?',
+        default='today',
+        choices=['today', 'week'],
+        help='Période à pré-calculer (défaut: today)'
+    )
+    prewarm_parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Mode test : ne crée pas les TODOs dans Notion'
+    )
+    prewarm_parser.add_argument(
+        '--bounded-memory',
+        action='store_true',
+        help='Analyse par morceaux à mémoire constante'
+    )
+    prewarm_parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Mode verbeux (plus de logs)'
+    )
+
+    # search command
+    search_parser = subparsers.add_parser(
+        'search',
+        help='Recherche plein texte dans les lifelogs déjà synchronisés'
+    )
+    search_parser.add_argument('query', help='Texte à rechercher')
+    search_parser.add_argument(
+        '--since',
+        help='Depuis une date (YYYY-MM-DD) ou une durée (ex: 7d)'
+    )
+    search_parser.add_argument(
+        '--limit',
+        type=int,
+        default=10,
+        help='Nombre maximum de résultats (défaut: 10)'
+    )
+    search_parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Mode verbeux (plus de logs)'
+    )
+
+    # contact command
+    contact_parser = subparsers.add_parser(
+        'contact',
+        help="Engagements, demandes et deadlines ouverts pour un contact"
+    )
+    contact_parser.add_argument('name', help='Nom de la personne ou de l\'entreprise')
+    contact_parser.add_argument(
+        '--done',
+        metavar='TITRE',
+        help="Marque comme faits les éléments ouverts dont le titre contient TITRE"
+    )
+    contact_parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Mode verbeux (plus de logs)'
+    )
+
+    # lead command
+    lead_parser = subparsers.add_parser(
+        'lead',
+        help='Recherche un lead et crée sa fiche dans le CRM Notion'
+    )
+    lead_parser.add_argument('company', help="Nom de l'entreprise")
+    lead_parser.add_argument(
+        '--site',
+        help="Site web de l'entreprise (ex: https://exemple.com)"
+    )
+    lead_parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Mode test : ne crée pas la fiche dans Notion'
+    )
+    lead_parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ignore le cache (pages et analyse)'
+    )
+    lead_parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Mode verbeux (plus de logs)'
+    )
+
+    # run command
+    run_parser = subparsers.add_parser(
+        'run',
+        help='Exécute tous les skills activés sur un seul fetch des lifelogs'
+    )
+    run_parser.add_argument(
+        'period',
+        nargs='?',
+        choices=['today', 'week'],
+        default='today',
+        help='Période à analyser (défaut: today)'
+    )
+    run_parser.add_argument(
+        '--skills',
+        help='Skills à exécuter, séparés par des virgules (défaut: skills.enabled)'
+    )
+    run_parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Mode test : aucune écriture dans Notion'
+    )
+    run_parser.add_argument(
+        '--list',
+        action='store_true',
+        help='Liste les skills disponibles'
+    )
+    run_parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Mode verbeux (plus de logs)'
+    )
+
+    # stats command
+    stats_parser = subparsers.add_parser(
+        'stats',
+        help="Statistiques d'utilisation (historique local des runs)"
+    )
+    stats_parser.add_argument(
+        '--weeks',
+        type=int,
+        default=4,
+        help='Nombre de semaines affichées (défaut: 4)'
+    )
+    stats_parser.add_argument(
+        '--format',
+        choices=['markdown', 'json'],
+        default='markdown',
+        help='Format de sortie'
+    )
+    stats_parser.add_argument(
+        '--profile',
+        help='Runs de ce profil uniquement (--all-profiles)'
+    )
+    stats_parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Mode verbeux (plus de logs)'
+    )
+
+    # eval command
+    eval_parser = subparsers.add_parser(
+        'eval',
+        help='Compare les variantes de prompt sur un corpus annoté'
+    )
+    eval_parser.add_argument(
+        '--corpus',
+        required=True,
+        help='Corpus JSONL (lifelog + priorités attendues par ligne)'
+    )
+    eval_parser.add_argument(
+        '--variants',
+        help='Templates à comparer, séparés par des virgules (défaut: tous)'
+    )
+    eval_source = eval_parser.add_mutually_exclusive_group()
+    eval_source.add_argument(
+        '--stub',
+        metavar='FILE',
+        help='Réponses pré-enregistrées par variante et par échantillon (aucun appel réseau)'
+    )
+    eval_source.add_argument(
+        '--record',
+        metavar='CASSETTE',
+        help='Enregistre les appels Claude dans une cassette compressée'
+    )
+    eval_source.add_argument(
+        '--replay',
+        metavar='CASSETTE',
+        help='Rejoue une cassette enregistrée (aucun appel réseau)'
+    )
+    eval_parser.add_argument(
+        '--min-precision',
+        type=float,
+        default=0.9,
+        help='Précision visée pour la recommandation (défaut: 0.9)'
+    )
+    eval_parser.add_argument(
+        '--min-recall',
+        type=float,
+        default=0.5,
+        help='Rappel minimal pour la recommandation (défaut: 0.5)'
+    )
+    eval_parser.add_argument(
+        '--format',
+        choices=['markdown', 'json'],
+        default='markdown',
+        help='Format de sortie'
+    )
+    eval_parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Mode verbeux (plus de logs)'
+    )
+
     # Parse arguments
     args = parser.parse_args()
 
     # Setup logging
-    log_level = "DEBUG" if args.verbose else "INFO"
-    setup_logging(log_level)
+    configure_logging(verbose=args.verbose)
 
     # Execute command
-    if args.command == 'priorities':
+    if args.command == 'priorities' and args.all_profiles:
+        if args.record or args.replay:
+            parser.error("--all-profiles ne peut pas être combiné avec --record/--replay")
+        sys.exit(asyncio.run(run_all_profiles(
+            period=args.period,
+            dry_run=args.dry_run,
+            output_format=args.format,
+            bounded_memory=args.bounded_memory
+        )))
+    elif args.command == 'priorities':
         exit_code = asyncio.run(run_priority_detector(
             period=args.period,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            record=args.record,
+            replay=args.replay,
+            output_format=args.format,
+            bounded_memory=args.bounded_memory,
+            use_prewarm=not args.no_prewarm
         ))
         sys.exit(exit_code)
+    elif args.command == 'prewarm':
+        sys.exit(asyncio.run(run_prewarm(
+            period=args.period,
+            dry_run=args.dry_run,
+            bounded_memory=args.bounded_memory
+        )))
+    elif args.command == 'search':
+        sys.exit(run_search(args.query, since=args.since, limit=args.limit))
+    elif args.command == 'contact':
+        sys.exit(run_contact(args.name, done=args.done))
+    elif args.command == 'lead':
+        sys.exit(asyncio.run(run_lead(
+            args.company,
+            site=args.site,
+            dry_run=args.dry_run,
+            refresh=args.refresh
+        )))
+    elif args.command == 'run':
+        sys.exit(asyncio.run(run_skills(
+            period=args.period,
+            dry_run=args.dry_run,
+            skills=args.skills,
+            list_only=args.list
+        )))
+    elif args.command == 'stats':
+        sys.exit(run_stats(weeks=args.weeks, output_format=args.format, profile=args.profile))
+    elif args.command == 'eval':
+        sys.exit(asyncio.run(run_eval(
+            corpus_path=args.corpus,
+            variants=args.variants,
+            stub=args.stub,
+            record=args.record,
+            replay=args.replay,
+            min_precision=args.min_precision,
+            min_recall=args.min_recall,
+            output_format=args.format
+        )))
     else:
         parser.print_help()
         sys.exit(1)
@@ -4,5 +4,34 @@ Configuration management and helpers
 """
 
 from .config import Config
+from .resilience import Resilience, RetryPolicy, RunBudget, CircuitBreaker, CircuitOpenError
+from .cassette import Cassette, CassetteMissError, open_cassette
+from .search_index import SearchIndex
+from .entity_index import EntityIndex
+from .scheduling import FairScheduler
+from .result_cache import ResultCache
+from .shared import SharedResources
+from .prompts import PromptTemplate, PromptRegistry, load_registry
+from .memory import peak_rss_mb
+from .dedup import Deduplicator, conversation_to_lifelog, content_hash
+from .prewarm import PrewarmStore
+from .skills import SkillRunner, discover_skills, register_skills, compact_lifelog
+from .logs import setup_logging, logging_options
+from .run_history import RunHistory, run_record
+from .models import Priority, Lifelog, parse_priorities
 
-__all__ = ['Config']
+__all__ = [
+    'Config',
+    'Resilience', 'RetryPolicy', 'RunBudget', 'CircuitBreaker', 'CircuitOpenError',
+    'Cassette', 'CassetteMissError', 'open_cassette',
+    'SearchIndex', 'EntityIndex',
+    'FairScheduler', 'ResultCache', 'SharedResources',
+    'PromptTemplate', 'PromptRegistry', 'load_registry',
+    'peak_rss_mb',
+    'Deduplicator', 'conversation_to_lifelog', 'content_hash',
+    'PrewarmStore',
+    'SkillRunner', 'discover_skills', 'register_skills', 'compact_lifelog',
+    'setup_logging', 'logging_options',
+    'RunHistory', 'run_record',
+    'Priority', 'Lifelog', 'parse_priorities'
+]
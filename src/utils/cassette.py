@@ -0,0 +1,227 @@
+"""
+Record/replay cassettes for connector traffic
+Capture every connector request/response to a compressed local file and serve it back offline
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from . import codec
+
+
+# Request fields holding a window start, keyed as a day offset from today
+RELATIVE_DATE_KEYS = {"since"}
+
+# Version 2 keys `since` by day offset (version 1 dropped it)
+CASSETTE_VERSION = 2
+
+
+def _day_offset(value: Any, today: date) -> Any:
+    """
+    Express a window start as a day offset from today
+
+    A `today` window recorded on one day and replayed on another starts at a
+    different date but at the same offset, while a week window keeps a
+    distinct key.
+
+    Args:
+        value: ISO date or datetime
+        today: Reference day (recording or replay date)
+
+    Returns:
+        "today-N", or the value unchanged if it is not a date
+    """
+    try:
+        day = datetime.fromisoformat(str(value).replace("Z", "+00:00")).date()
+    except ValueError:
+        return value
+    return f"today{(day - today).days:+d}"
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when no response was recorded for a request"""
+
+
+class Cassette:
+    """Compressed store of connector interactions keyed by normalized request"""
+
+    def __init__(self, path: str, mode: str = "replay"):
+        """
+        Initialize cassette
+
+        Args:
+            path: Cassette file (gzip-compressed JSON)
+            mode: "record" to capture live traffic, "replay" to serve it back
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.logger = logging.getLogger("nexus.cassette")
+
+        self._interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._dirty = False
+
+        if mode == "replay":
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        """True when responses are served from the cassette"""
+        return self.mode == "replay"
+
+    def _load(self):
+        """Load recorded interactions from disk"""
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+
+        with gzip.open(self.path, 'rb') as f:
+            data = codec.loads(f.read())
+
+        if data.get('version') != CASSETTE_VERSION:
+            self.logger.warning(
+                f"Cassette {self.path} has version {data.get('version')}, "
+                f"expected {CASSETTE_VERSION}: requests may not be found, record it again"
+            )
+
+        self._interactions = data.get('interactions', {})
+        count = sum(len(v) for v in self._interactions.values())
+        self.logger.info(f"Loaded {count} recorded interactions from {self.path}")
+
+    @staticmethod
+    def key(
+        service: str,
+        operation: str,
+        request: Dict[str, Any],
+        today: Optional[date] = None
+    ) -> str:
+        """
+        Build the lookup key for a request
+
+        Args:
+            service: Service name (limitless, claude, notion)
+            operation: Endpoint or operation name
+            request: Request parameters (no credentials)
+            today: Day window starts are relative to (defaults to today, i.e.
+                the recording date when recording and the replay date when replaying)
+
+        Returns:
+            Stable hex digest of the normalized request
+        """
+        today = today or date.today()
+        normalized = {
+            k: _day_offset(v, today) if k in RELATIVE_DATE_KEYS else v
+            for k, v in request.items()
+        }
+        payload = json.dumps(
+            [service, operation, normalized],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def through(
+        self,
+        service: str,
+        operation: str,
+        request: Dict[str, Any],
+        func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Serve a request from the cassette or record the live response
+
+        Args:
+            service: Service name
+            operation: Endpoint or operation name
+            request: Request parameters used for the key
+            func: Coroutine factory performing the live request
+
+        Returns:
+            JSON-serializable response
+
+        Raises:
+            CassetteMissError: In replay mode, if the request was never recorded
+        """
+        key = self.key(service, operation, request)
+
+        if self.replaying:
+            entries = self._interactions.get(key)
+            if not entries:
+                raise CassetteMissError(
+                    f"No recorded response for {service}.{operation} ({key[:12]})"
+                )
+            # Same request repeated in one run: serve recordings in order,
+            # then keep serving the last one
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            return entries[min(cursor, len(entries) - 1)]['response']
+
+        response = await func()
+        self.record(service, operation, request, response)
+        return response
+
+    def record(self, service: str, operation: str, request: Dict[str, Any], response: Any):
+        """
+        Store a response captured outside `through` (e.g. a consumed stream)
+
+        Args:
+            service: Service name
+            operation: Endpoint or operation name
+            request: Request parameters used for the key
+            response: JSON-serializable response
+        """
+        if self.replaying:
+            return
+
+        key = self.key(service, operation, request)
+        self._interactions.setdefault(key, []).append({
+            "service": service,
+            "operation": operation,
+            "request": request,
+            "response": response
+        })
+        self._dirty = True
+
+    def save(self):
+        """Write recorded interactions to disk (record mode only)"""
+        if self.replaying or not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            f.write(codec.dumps({"version": CASSETTE_VERSION, "interactions": self._interactions}))
+
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+        count = sum(len(v) for v in self._interactions.values())
+        self.logger.info(f"Recorded {count} interactions to {self.path}")
+
+
+def open_cassette(record: Optional[str] = None, replay: Optional[str] = None) -> Optional[Cassette]:
+    """
+    Build a cassette from CLI options
+
+    Args:
+        record: Path to record into
+        replay: Path to replay from
+
+    Returns:
+        Cassette, or None for live traffic
+    """
+    if record:
+        return Cassette(record, mode="record")
+    if replay:
+        return Cassette(replay, mode="replay")
+    return None
@@ -0,0 +1,95 @@
+"""
+JSON codec
+Fast encoding and decoding with orjson when installed, the standard library otherwise
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional, see requirements.txt
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode models through their dictionary form and anything else as text"""
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    return str(value)
+
+
+if orjson is not None:
+    # Datetimes go through _default so they read the same as with json (str())
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def dumps(value: Any, sort_keys: bool = False) -> str:
+    """
+    Encode a value as compact single-line JSON
+
+    Args:
+        value: Value to encode; models are encoded with to_dict()
+        sort_keys: Sort object keys (for stable digests)
+
+    Returns:
+        JSON text (non-ASCII characters kept as is)
+    """
+    if orjson is not None:
+        options = _OPTIONS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(value, default=_default, option=options).decode('utf-8')
+    return json.dumps(
+        value, ensure_ascii=False, default=_default, sort_keys=sort_keys, separators=(',', ':')
+    )
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode JSON text
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Decode a JSON file
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If it is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def write_json(path: Union[str, Path], value: Any):
+    """
+    Encode a value to a JSON file atomically
+
+    The file is written next to its target then renamed, so readers never
+    see a partial file.
+
+    Args:
+        path: Target file (parent directories are created)
+        value: Value to encode
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(dumps(value))
+    os.replace(tmp_path, path)
@@ -6,7 +6,18 @@ Handles loading and accessing YAML configuration
 import yaml
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge `override` into a copy of `base`"""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
 
 
 class Config:
@@ -20,6 +31,7 @@ class Config:
             config_path: Path to YAML config file
         """
         self.config_path = Path(config_path)
+        self.profile: Optional[str] = None
         self._config: Dict[str, Any] = {}
         self._load()
 
@@ -59,6 +71,50 @@ class Config:
 
         return value
 
+    def profile_names(self) -> List[str]:
+        """Get names of the profiles defined under `profiles`"""
+        return list(self._config.get('profiles') or {})
+
+    def for_profile(self, name: str) -> "Config":
+        """
+        Get the configuration of a named profile
+
+        A profile is either inline overrides of the top-level sections, or
+        `config: path/to/other.yaml` pointing to that person's own config file.
+        Either way it is merged over the top-level sections, and gets its own
+        data directory unless it sets `storage.data_dir`.
+
+        Args:
+            name: Profile name
+
+        Returns:
+            Config for that profile
+        """
+        profiles = self._config.get('profiles') or {}
+        if name not in profiles:
+            raise KeyError(f"Unknown profile: {name}")
+
+        override = dict(profiles[name] or {})
+        if 'config' in override:
+            profile_path = Path(override.pop('config'))
+            if not profile_path.exists():
+                raise FileNotFoundError(f"Configuration file not found: {profile_path}")
+            with open(profile_path, 'r') as f:
+                override = _deep_merge(yaml.safe_load(f) or {}, override)
+
+        base = {k: v for k, v in self._config.items() if k != 'profiles'}
+        data = _deep_merge(base, override)
+
+        if not (override.get('storage') or {}).get('data_dir'):
+            data.setdefault('storage', {})
+            data['storage'] = {**data['storage'], 'data_dir': str(self.get_data_dir() / name)}
+
+        profile_config = Config.__new__(Config)
+        profile_config.config_path = self.config_path
+        profile_config.profile = name
+        profile_config._config = data
+        return profile_config
+
     def get_limitless_config(self) -> Dict[str, Any]:
         """Get Limitless API configuration"""
         return self._config.get('limitless', {})
@@ -75,6 +131,38 @@ class Config:
         """Get Priority Detector configuration"""
         return self._config.get('priority_detector', {})
 
+    def get_skills_config(self) -> Dict[str, Any]:
+        """Get skill runner configuration"""
+        return self._config.get('skills', {})
+
+    def get_lead_researcher_config(self) -> Dict[str, Any]:
+        """Get Lead Researcher configuration"""
+        return self._config.get('lead_researcher', {})
+
+    def get_resilience_config(self) -> Dict[str, Any]:
+        """Get retry/circuit-breaker configuration"""
+        return self._config.get('resilience', {})
+
+    def get_storage_config(self) -> Dict[str, Any]:
+        """Get local storage configuration"""
+        return self._config.get('storage', {})
+
+    def get_data_dir(self) -> Path:
+        """Get directory for local indexes and stores"""
+        return Path(self.get_storage_config().get('data_dir', '.nexus'))
+
+    def get_search_config(self) -> Dict[str, Any]:
+        """Get local search index configuration"""
+        return self._config.get('search', {})
+
+    def get_scheduling_config(self) -> Dict[str, Any]:
+        """Get multi-profile scheduling configuration"""
+        return self._config.get('scheduling', {})
+
+    def get_prewarm_config(self) -> Dict[str, Any]:
+        """Get pre-warmed results configuration"""
+        return self._config.get('prewarm', {})
+
     def get_logging_config(self) -> Dict[str, Any]:
         """Get logging configuration"""
         return self._config.get('logging', {})
@@ -0,0 +1,81 @@
+"""
+Lifelog deduplication
+Normalize Limitless conversations and drop records already seen by id or content
+"""
+
+import hashlib
+import re
+from typing import Any, Dict
+
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def conversation_to_lifelog(conversation: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Give a Limitless conversation the shape of a lifelog
+
+    Args:
+        conversation: Conversation object from the Limitless API
+
+    Returns:
+        Dictionary with id, title, date and transcript
+    """
+    transcript = conversation.get("transcript") or conversation.get("contents") or ""
+    if isinstance(transcript, list):
+        # Speaker segments
+        transcript = "\n".join(
+            f"{segment.get('speakerName') or segment.get('speaker') or 'Inconnu'}: "
+            f"{segment.get('content') or segment.get('text') or ''}"
+            for segment in transcript
+            if isinstance(segment, dict)
+        )
+
+    return {
+        **conversation,
+        "id": conversation.get("id"),
+        "title": conversation.get("title") or conversation.get("summary") or "Conversation",
+        "date": (
+            conversation.get("date") or conversation.get("startTime")
+            or conversation.get("start_time") or ""
+        ),
+        "transcript": transcript
+    }
+
+
+def content_hash(lifelog: Dict[str, Any]) -> str:
+    """Hash of the transcript with case and whitespace normalized"""
+    text = WHITESPACE_RE.sub(" ", lifelog.get("transcript") or "").strip().casefold()
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class Deduplicator:
+    """Remember ids and content hashes of the records seen in one run"""
+
+    def __init__(self):
+        self._ids = set()
+        self._hashes = set()
+        self.duplicates = 0
+
+    def seen(self, lifelog: Dict[str, Any]) -> bool:
+        """
+        Check a record and remember it
+
+        Args:
+            lifelog: Lifelog (or normalized conversation)
+
+        Returns:
+            True if a record with the same id or transcript was already seen
+        """
+        record_id = lifelog.get("id")
+        digest = content_hash(lifelog) if lifelog.get("transcript") else None
+
+        if (record_id and record_id in self._ids) or (digest and digest in self._hashes):
+            self.duplicates += 1
+            return True
+
+        if record_id:
+            self._ids.add(record_id)
+        if digest:
+            self._hashes.add(digest)
+        return False
@@ -0,0 +1,311 @@
+"""
+Per-contact entity index
+Maps people and companies to the lifelogs and priorities that mention them
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+
+from .models import PRIORITY_TYPES, Priority
+from .search_index import lifelog_id
+from .text import fold_accents
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entity_lifelogs (
+    entity_key TEXT NOT NULL,
+    lifelog_id TEXT NOT NULL,
+    date TEXT,
+    title TEXT,
+    PRIMARY KEY (entity_key, lifelog_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS entity_items (
+    entity_key TEXT NOT NULL,
+    item_hash TEXT NOT NULL,
+    type TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT,
+    date TEXT,
+    confidence REAL,
+    source TEXT,
+    status TEXT NOT NULL DEFAULT 'open',
+    first_seen TEXT NOT NULL,
+    PRIMARY KEY (entity_key, item_hash)
+) WITHOUT ROWID;
+"""
+
+# "Conversation avec Marc Veilleux - 2024-10-23", "Appel avec ESI (Marc)"
+WITH_RE = re.compile(r"\bavec\s+([^-–(\[,;:]+)", re.IGNORECASE)
+# "Guy Tremblay : partager ...", "FLB : documenter ..."
+LEAD_RE = re.compile(r"^\s*([A-ZÀ-Ý][\w'’-]*(?:\s+[A-ZÀ-Ý][\w'’-]*){0,3})\s*:")
+# "(ESI)" after a name
+PAREN_RE = re.compile(r"\(([A-ZÀ-Ý][\w&.' -]{1,40})\)")
+# Two to four consecutive capitalized words ("Marc Veilleux", "Boulet Stratégies TI")
+PROPER_RE = re.compile(r"\b([A-ZÀ-Ý][\w'’-]+(?:\s+(?:[A-ZÀ-Ý][\w'’-]+)){1,3})\b")
+# Acronyms used as company names ("ESI", "FLB")
+ACRONYM_RE = re.compile(r"\b([A-Z]{2,6})\b")
+
+# Capitalized words that are not entities
+NON_ENTITIES = {
+    "conversation", "demande", "demande client", "client", "note", "note vocale",
+    "reunion", "appel", "je", "tu", "il", "elle", "on", "nous", "vous", "ils",
+    "le", "la", "les", "un", "une", "ok", "oui", "non", "todo", "cto", "ia", "ai",
+    "cv", "pdf", "api", "crm", "rh", "ti", "it", "fractional cto"
+}
+LEADING_NOISE = {"conversation", "appel", "reunion", "note", "demande", "client", "avec", "pour"}
+
+
+def entity_key(name: str) -> str:
+    """Normalized lookup key for an entity name"""
+    return " ".join(fold_accents(name).split())
+
+
+def _like_escape(text: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (with ESCAPE '\\')"""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def extract_entities(text: str) -> Set[str]:
+    """
+    Extract people and company names from free text
+
+    Args:
+        text: Source string, title or transcript
+
+    Returns:
+        Set of display names
+    """
+    if not text:
+        return set()
+
+    candidates = []
+    candidates.extend(WITH_RE.findall(text))
+    candidates.extend(LEAD_RE.findall(text))
+    candidates.extend(PAREN_RE.findall(text))
+    candidates.extend(PROPER_RE.findall(text))
+    candidates.extend(ACRONYM_RE.findall(text))
+
+    names = set()
+    for candidate in candidates:
+        words = candidate.strip(" .'’").split()
+        while words and entity_key(words[0]) in LEADING_NOISE:
+            words = words[1:]
+        name = " ".join(words)
+        key = entity_key(name)
+        if len(key) < 2 or key in NON_ENTITIES or re.fullmatch(r"[\d\s/-]+", key):
+            continue
+        names.add(name)
+
+    return names
+
+
+class EntityIndex:
+    """SQLite-backed index from contacts to lifelogs and open priorities"""
+
+    def __init__(self, path: str):
+        """
+        Initialize entity index
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.logger = logging.getLogger("nexus.entities")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the underlying database"""
+        self.db.close()
+
+    def _upsert_entity(self, name: str) -> str:
+        """Register an entity and return its key"""
+        key = entity_key(name)
+        self.db.execute(
+            "INSERT OR IGNORE INTO entities (key, name) VALUES (?, ?)", (key, name)
+        )
+        return key
+
+    def add_lifelogs(self, lifelogs: Iterable[Dict[str, Any]]) -> int:
+        """
+        Link entities mentioned in lifelogs to those lifelogs
+
+        Args:
+            lifelogs: Lifelog objects with transcripts
+
+        Returns:
+            Number of entity/lifelog links recorded
+        """
+        links = 0
+
+        with self.db:
+            for log in lifelogs:
+                doc_id = lifelog_id(log)
+                title = log.get("title", "")
+                names = extract_entities(title) | extract_entities(log.get("transcript", ""))
+
+                for name in names:
+                    key = self._upsert_entity(name)
+                    cursor = self.db.execute(
+                        "INSERT OR IGNORE INTO entity_lifelogs (entity_key, lifelog_id, date, title) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, doc_id, log.get("date", ""), title)
+                    )
+                    links += cursor.rowcount
+
+        return links
+
+    def add_priorities(self, priorities: Dict[str, List[Priority]]) -> int:
+        """
+        Link entities mentioned in extracted priorities to those items
+
+        Args:
+            priorities: Dictionary with keys: engagements, demandes, deadlines
+
+        Returns:
+            Number of new entity/item links recorded
+        """
+        links = 0
+        now = datetime.now().isoformat(timespec='seconds')
+
+        with self.db:
+            for item_type in PRIORITY_TYPES:
+                for item in priorities.get(item_type, []):
+                    title = item.title
+                    source = item.source
+                    names = extract_entities(source) | extract_entities(title)
+                    if not names:
+                        continue
+
+                    item_hash = hashlib.sha1(
+                        f"{item_type}|{entity_key(title)}".encode('utf-8')
+                    ).hexdigest()
+
+                    for name in names:
+                        key = self._upsert_entity(name)
+                        cursor = self.db.execute(
+                            "INSERT OR IGNORE INTO entity_items "
+                            "(entity_key, item_hash, type, title, description, date, "
+                            "confidence, source, first_seen) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (key, item_hash, item_type, title, item.description,
+                             item.date, item.confidence, source, now)
+                        )
+                        links += cursor.rowcount
+
+        if links:
+            self.logger.info(f"Linked {links} priorities to contacts")
+        return links
+
+    def _matching_entities(self, name: str) -> List[Any]:
+        """Entities whose key is the name or has a word starting with it, exact match first"""
+        key = entity_key(name)
+        pattern = _like_escape(key)
+        return self.db.execute(
+            "SELECT key, name FROM entities "
+            "WHERE key = ? OR key LIKE ? ESCAPE '\\' OR key LIKE ? ESCAPE '\\' "
+            "ORDER BY key = ? DESC, key",
+            (key, f"{pattern}%", f"% {pattern}%", key)
+        ).fetchall()
+
+    def close_items(self, name: str, title: str) -> List[str]:
+        """
+        Mark a contact's open items done, so they are no longer listed
+
+        An item extracted again later stays done.
+
+        Args:
+            name: Full or partial contact name, as for lookup()
+            title: Full or partial item title (accents and case ignored)
+
+        Returns:
+            Titles of the items closed
+        """
+        wanted = entity_key(title)
+        closed = []
+
+        with self.db:
+            for ent_key, _ in self._matching_entities(name):
+                rows = self.db.execute(
+                    "SELECT item_hash, title FROM entity_items "
+                    "WHERE entity_key = ? AND status = 'open'",
+                    (ent_key,)
+                ).fetchall()
+                for item_hash, item_title in rows:
+                    if wanted not in entity_key(item_title):
+                        continue
+                    # The same item is linked to every contact it names
+                    self.db.execute(
+                        "UPDATE entity_items SET status = 'done' WHERE item_hash = ?",
+                        (item_hash,)
+                    )
+                    if item_title not in closed:
+                        closed.append(item_title)
+
+        if closed:
+            self.logger.info(f"Closed {len(closed)} items for {name}")
+        return closed
+
+    def lookup(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Find contacts matching a name and their open priorities
+
+        Items stay open until closed with close_items().
+
+        Args:
+            name: Full or partial name (accents and case ignored)
+
+        Returns:
+            One entry per matching entity with lifelogs and open items by type
+        """
+        rows = self._matching_entities(name)
+
+        results = []
+        for ent_key, display_name in rows:
+            items = {"engagements": [], "demandes": [], "deadlines": []}
+            for row in self.db.execute(
+                "SELECT type, title, description, date, confidence, source, first_seen "
+                "FROM entity_items WHERE entity_key = ? AND status = 'open' "
+                "ORDER BY date IS NULL, date, first_seen",
+                (ent_key,)
+            ):
+                item_type, title, description, date, confidence, source, first_seen = row
+                items[item_type].append({
+                    "title": title,
+                    "description": description,
+                    "date": date,
+                    "confidence": confidence,
+                    "source": source,
+                    "first_seen": first_seen
+                })
+
+            lifelogs = [
+                {"id": lid, "date": date, "title": title}
+                for lid, date, title in self.db.execute(
+                    "SELECT lifelog_id, date, title FROM entity_lifelogs "
+                    "WHERE entity_key = ? ORDER BY date DESC",
+                    (ent_key,)
+                )
+            ]
+
+            if not lifelogs and not any(items.values()):
+                continue
+
+            results.append({
+                "name": display_name,
+                "priorities": items,
+                "lifelogs": lifelogs
+            })
+
+        return results
@@ -0,0 +1,101 @@
+"""
+Incremental JSON extraction
+Emit the objects of `{"key": [{...}, ...], ...}` documents as soon as each one is complete
+"""
+
+from typing import Iterator, Optional, Tuple
+
+from . import codec
+
+
+class ArrayItemExtractor:
+    """
+    Streaming parser for a top-level object of arrays of objects
+
+    Feed text chunks as they arrive; every completed item of any top-level
+    array is returned with the key of the array it belongs to. Text before
+    the opening brace (model preamble) is ignored.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._key: Optional[str] = None
+        self._key_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> Iterator[Tuple[str, dict]]:
+        """
+        Consume a chunk of text
+
+        Args:
+            chunk: Next piece of the document
+
+        Yields:
+            (array key, item) for each item completed by this chunk
+        """
+        self._buffer += chunk
+
+        while self._pos < len(self._buffer):
+            char = self._buffer[self._pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._key_start is not None:
+                        self._key = codec.loads(self._buffer[self._key_start:self._pos + 1])
+                        self._key_start = None
+
+            elif not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._key_start = self._pos
+
+            elif char in "{[":
+                self._depth += 1
+                if char == "{" and self._depth == 3:
+                    self._item_start = self._pos
+
+            elif char in "}]":
+                self._depth -= 1
+                if char == "}" and self._depth == 2 and self._item_start is not None:
+                    raw = self._buffer[self._item_start:self._pos + 1]
+                    self._item_start = None
+                    try:
+                        item = codec.loads(raw)
+                    except ValueError:
+                        item = None
+                    if isinstance(item, dict) and self._key is not None:
+                        yield self._key, item
+
+            self._pos += 1
+
+        self._compact()
+
+    def _compact(self):
+        """Drop text that no pending key or item still refers to"""
+        keep_from = self._pos
+        for start in (self._key_start, self._item_start):
+            if start is not None:
+                keep_from = min(keep_from, start)
+
+        if keep_from:
+            self._buffer = self._buffer[keep_from:]
+            self._pos -= keep_from
+            if self._key_start is not None:
+                self._key_start -= keep_from
+            if self._item_start is not None:
+                self._item_start -= keep_from
@@ -0,0 +1,159 @@
+"""
+Non-blocking logging
+Log records are queued by the caller and written by a background thread,
+to rotating compressed files, as text or JSON lines
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+CONSOLE_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+FILE_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class CappedQueueHandler(logging.handlers.QueueHandler):
+    """Queue records for the listener thread, truncating oversized messages"""
+
+    def __init__(self, log_queue: queue.SimpleQueue, max_payload_chars: int = 2000):
+        """
+        Initialize handler
+
+        Args:
+            log_queue: Queue drained by the QueueListener
+            max_payload_chars: Longest message kept; the rest is replaced by a
+                marker (0 = no limit)
+        """
+        super().__init__(log_queue)
+        self.max_payload_chars = max_payload_chars
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args and render the traceback here: the record crosses threads
+        message = record.getMessage()
+        if self.max_payload_chars and len(message) > self.max_payload_chars:
+            message = (
+                f"{message[:self.max_payload_chars]}… "
+                f"[{len(message) - self.max_payload_chars} caractères tronqués]"
+            )
+
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _gzip_rotator(source: str, dest: str):
+    """Compress a rotated log file"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def setup_logging(
+    level: str = "INFO",
+    file: Optional[str] = "nexus.log",
+    console_level: Optional[str] = None,
+    json_lines: bool = False,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    max_payload_chars: int = 2000
+) -> logging.handlers.QueueListener:
+    """
+    Route every log record through a queue to a background writer
+
+    Args:
+        level: File log level
+        file: Log file path (None = console only)
+        console_level: Console log level (defaults to `level`)
+        json_lines: Write the file as JSON lines instead of text
+        max_bytes: Size at which the file is rotated (0 = never)
+        backup_count: Rotated files kept, gzip-compressed
+        max_payload_chars: Longest message logged (0 = no limit)
+
+    Returns:
+        The started listener (stopped and flushed automatically at exit)
+    """
+    file_level = getattr(logging, level.upper(), logging.INFO)
+    console_level = getattr(logging, (console_level or level).upper(), logging.INFO)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT, datefmt='%H:%M:%S'))
+    handlers = [console_handler]
+
+    if file:
+        file_handler = logging.handlers.RotatingFileHandler(
+            file,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding='utf-8',
+            delay=True
+        )
+        file_handler.namer = lambda name: name + ".gz"
+        file_handler.rotator = _gzip_rotator
+        file_handler.setLevel(file_level)
+        file_handler.setFormatter(
+            JsonLinesFormatter() if json_lines
+            else logging.Formatter(FILE_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
+        )
+        handlers.append(file_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    # Records no handler would write are dropped before they are built
+    root_logger.setLevel(min(handler.level for handler in handlers))
+    root_logger.addHandler(CappedQueueHandler(log_queue, max_payload_chars=max_payload_chars))
+
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def logging_options(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map the `logging` section of config.yaml to setup_logging arguments
+
+    Args:
+        config: Logging configuration
+
+    Returns:
+        Keyword arguments for setup_logging
+    """
+    return {
+        "level": config.get('level', 'INFO'),
+        "file": config.get('file', 'nexus.log'),
+        "json_lines": config.get('format', 'text') == 'json',
+        "max_bytes": int(config.get('max_size_mb', 10) * 1024 * 1024),
+        "backup_count": config.get('backup_count', 5),
+        "max_payload_chars": config.get('max_payload_chars', 2000)
+    }
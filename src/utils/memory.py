@@ -0,0 +1,29 @@
+"""
+Process memory metrics
+Peak resident set size for run stats
+"""
+
+import sys
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident set size of the current process
+
+    Returns:
+        Peak RSS in MiB, or None where the platform doesn't expose it
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes on Linux
+    if sys.platform == "darwin":
+        peak /= 1024
+    return round(peak / 1024, 1)
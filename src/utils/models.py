@@ -0,0 +1,222 @@
+"""
+Data model
+Compact typed records for priorities and lifelogs passed through the pipeline
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+PRIORITY_TYPES = ("engagements", "demandes", "deadlines")
+
+logger = logging.getLogger("nexus.models")
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def local_day(value: Any) -> Optional[date]:
+    """Local calendar day of an ISO timestamp (aware ones are converted to local time)"""
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is not None:
+        moment = moment.astimezone()
+    return moment.date()
+
+
+class Priority:
+    """One engagement, demande or deadline extracted from lifelogs"""
+
+    __slots__ = ("title", "description", "date", "confidence", "source", "lifelog_id", "score")
+
+    def __init__(
+        self,
+        title: str,
+        description: str = "",
+        date: Optional[str] = None,
+        confidence: float = 1.0,
+        source: str = "",
+        lifelog_id: Optional[str] = None,
+        score: Optional[float] = None
+    ):
+        self.title = title
+        self.description = description
+        self.date = date
+        self.confidence = confidence
+        self.source = source
+        self.lifelog_id = lifelog_id
+        self.score = score
+
+    @classmethod
+    def from_dict(cls, data: Any) -> Optional["Priority"]:
+        """
+        Validate one item of a model response or stored record
+
+        Args:
+            data: Decoded JSON object
+
+        Returns:
+            Priority, or None if the item has no title or is not an object
+        """
+        if isinstance(data, cls):
+            return data
+        if not isinstance(data, Mapping):
+            return None
+
+        title = _text(data.get("title"))
+        if not title:
+            return None
+
+        try:
+            confidence = float(data.get("confidence", 1.0))
+        except (TypeError, ValueError):
+            confidence = 1.0
+        confidence = min(1.0, max(0.0, confidence))
+
+        score = data.get("score")
+        lifelog_id = data.get("lifelog_id")
+        return cls(
+            title=title,
+            description=_text(data.get("description")),
+            date=_text(data.get("date")) or None,
+            confidence=confidence,
+            source=_text(data.get("source")),
+            lifelog_id=str(lifelog_id) if lifelog_id not in (None, "") else None,
+            score=float(score) if isinstance(score, (int, float)) else None
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON form; unset date, lifelog id and score are left out"""
+        data: Dict[str, Any] = {"title": self.title, "description": self.description}
+        if self.date:
+            data["date"] = self.date
+        data["confidence"] = self.confidence
+        data["source"] = self.source
+        if self.lifelog_id:
+            data["lifelog_id"] = self.lifelog_id
+        if self.score is not None:
+            data["score"] = self.score
+        return data
+
+    def with_score(self, score: float) -> "Priority":
+        """Copy of this priority with a ranking score"""
+        return Priority(
+            self.title, self.description, self.date, self.confidence,
+            self.source, self.lifelog_id, score
+        )
+
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """Field values, to recognize the same item emitted twice"""
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Priority({self.title!r}, confidence={self.confidence}, date={self.date!r})"
+
+
+def parse_priorities(data: Any) -> Dict[str, List[Priority]]:
+    """
+    Validate a priorities document once, where it enters the pipeline
+
+    Unknown keys and malformed items are dropped.
+
+    Args:
+        data: Decoded JSON object with engagements, demandes and deadlines lists
+
+    Returns:
+        Priorities by type (every type present)
+    """
+    priorities: Dict[str, List[Priority]] = {item_type: [] for item_type in PRIORITY_TYPES}
+    if not isinstance(data, Mapping):
+        logger.warning(f"Ignoring priorities document of type {type(data).__name__}")
+        return priorities
+
+    dropped = 0
+    for item_type in PRIORITY_TYPES:
+        items = data.get(item_type) or []
+        for item in items if isinstance(items, list) else []:
+            priority = Priority.from_dict(item)
+            if priority is None:
+                dropped += 1
+            else:
+                priorities[item_type].append(priority)
+
+    if dropped:
+        logger.warning(f"Dropped {dropped} malformed priorities")
+    return priorities
+
+
+def priorities_to_dict(priorities: Mapping[str, List[Priority]]) -> Dict[str, List[Dict[str, Any]]]:
+    """JSON form of priorities by type"""
+    return {
+        item_type: [item.to_dict() for item in items]
+        for item_type, items in priorities.items()
+    }
+
+
+class Lifelog:
+    """The fields of a lifelog the analysis reads"""
+
+    __slots__ = ("id", "title", "date", "transcript", "overlap")
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        title: str = "",
+        date: str = "",
+        transcript: str = "",
+        overlap: Optional[str] = None
+    ):
+        self.id = id
+        self.title = title
+        self.date = date
+        self.transcript = transcript
+        # Already-analyzed segments resent as context (delta analysis only)
+        self.overlap = overlap
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "Lifelog":
+        """
+        Build from a Limitless lifelog, a normalized conversation or a stored record
+
+        Args:
+            data: Lifelog dictionary (extra fields are ignored) or Lifelog
+
+        Returns:
+            Lifelog
+        """
+        if isinstance(data, cls):
+            return data
+        lifelog_id = data.get("id")
+        return cls(
+            id=str(lifelog_id) if lifelog_id not in (None, "") else None,
+            title=data.get("title") or "",
+            date=str(data.get("date") or ""),
+            transcript=data.get("transcript") or "",
+            overlap=data.get("overlap")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON form; empty fields are left out"""
+        return {field: getattr(self, field) for field in self.__slots__ if getattr(self, field)}
+
+    def with_transcript(self, transcript: str, overlap: Optional[str] = None) -> "Lifelog":
+        """Copy of this lifelog with another transcript (e.g. only its new segments)"""
+        return Lifelog(self.id, self.title, self.date, transcript, overlap)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """
+        Dictionary-style read, for helpers that also take raw Limitless payloads
+
+        Empty fields read as missing, like keys absent from a compacted lifelog.
+        """
+        value = getattr(self, field, None) if field in self.__slots__ else None
+        return value if value else default
+
+    def __repr__(self) -> str:
+        return f"Lifelog({self.id!r}, {self.title!r}, {len(self.transcript)} chars)"
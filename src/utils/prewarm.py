@@ -0,0 +1,94 @@
+"""
+Pre-warmed results store
+Save a run's results ahead of time so the next interactive run can answer instantly
+"""
+
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import codec
+from .models import parse_priorities
+
+
+class PrewarmStore:
+    """One JSON file of saved results per period"""
+
+    def __init__(self, path: str):
+        """
+        Initialize store
+
+        Args:
+            path: Directory holding one file per period
+        """
+        self.path = Path(path)
+        self.logger = logging.getLogger("nexus.prewarm")
+
+    def _file(self, period: str) -> Path:
+        return self.path / f"{period}.json"
+
+    def save(self, period: str, results: Dict[str, Any], fetched_until: datetime):
+        """
+        Save results for a period
+
+        Args:
+            period: Time period (today/week)
+            results: Results from analyze_priorities
+            fetched_until: Time the Limitless fetch started; later runs
+                only need lifelogs recorded after it
+        """
+        entry = {
+            "period": period,
+            "saved_at": datetime.now().isoformat(),
+            "fetched_until": fetched_until.isoformat(),
+            "results": {k: v for k, v in results.items() if k != "new_priorities"}
+        }
+
+        target = self._file(period)
+        codec.write_json(target, entry)
+
+        self.logger.info(f"Saved {period} results to {target}")
+
+    def load(
+        self,
+        period: str,
+        max_age_hours: float = 12,
+        dry_run: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load saved results if they can stand in for a fresh run
+
+        Args:
+            period: Time period (today/week)
+            max_age_hours: Older entries are ignored
+            dry_run: Whether the current run is a dry run; results saved by a
+                dry run never created TODOs, so a production run ignores them
+
+        Returns:
+            Entry with `results` (priorities as Priority items) and
+            `fetched_until` (datetime), or None
+        """
+        target = self._file(period)
+        if not target.exists():
+            return None
+
+        try:
+            entry = codec.read_json(target)
+            fetched_until = datetime.fromisoformat(entry["fetched_until"])
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Ignoring unreadable pre-warmed results {target}: {e}")
+            return None
+
+        now = datetime.now()
+        if now - fetched_until > timedelta(hours=max_age_hours):
+            return None
+        # "today" results from yesterday describe another day
+        if period == "today" and fetched_until.date() != now.date():
+            return None
+        if entry["results"].get("dry_run") and not dry_run:
+            return None
+
+        entry["fetched_until"] = fetched_until
+        entry["results"]["priorities"] = parse_priorities(entry["results"].get("priorities", {}))
+        return entry
@@ -0,0 +1,96 @@
+"""
+Prompt template registry
+Load and version prompt_templates.json once, with a content hash per template
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+DEFAULT_TEMPLATES_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "skills" / "priority-detector" / "resources" / "prompt_templates.json"
+)
+
+DEFAULT_TEMPLATE = "priority_detection"
+
+
+class PromptTemplate:
+    """A named, versioned prompt template"""
+
+    def __init__(self, name: str, version: str, template: str, description: str = ""):
+        """
+        Initialize prompt template
+
+        Args:
+            name: Template name (key in the registry file)
+            version: Declared template version
+            template: str.format template text
+            description: Human-readable description
+        """
+        self.name = name
+        self.version = version
+        self.template = template
+        self.description = description
+        self.hash = hashlib.sha256(template.encode('utf-8')).hexdigest()[:16]
+
+    @property
+    def id(self) -> str:
+        """Identifier combining name, version and content hash"""
+        return f"{self.name}@{self.version}#{self.hash}"
+
+    def render(self, **values: Any) -> str:
+        """Fill in the template placeholders"""
+        return self.template.format(**values)
+
+
+class PromptRegistry:
+    """Prompt templates loaded from a JSON registry file"""
+
+    def __init__(self, path: Path = DEFAULT_TEMPLATES_PATH):
+        """
+        Initialize registry
+
+        Args:
+            path: JSON file mapping template names to {version, template, ...}
+        """
+        self.path = Path(path)
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data: Dict[str, Any] = json.load(f)
+
+        # Entries without a "template" field (e.g. examples) are not prompts
+        self._templates = {
+            name: PromptTemplate(
+                name=name,
+                version=entry.get('version', '0'),
+                template=entry['template'],
+                description=entry.get('description', '')
+            )
+            for name, entry in data.items()
+            if isinstance(entry, dict) and 'template' in entry
+        }
+
+    def names(self) -> List[str]:
+        """Names of the available templates"""
+        return list(self._templates)
+
+    def get(self, name: str = DEFAULT_TEMPLATE) -> PromptTemplate:
+        """
+        Get a template by name
+
+        Raises:
+            KeyError: If the template does not exist
+        """
+        if name not in self._templates:
+            raise KeyError(f"Unknown prompt template: {name} (available: {', '.join(self.names())})")
+        return self._templates[name]
+
+
+@lru_cache(maxsize=None)
+def load_registry(path: str = str(DEFAULT_TEMPLATES_PATH)) -> PromptRegistry:
+    """Load a registry file once per process"""
+    return PromptRegistry(Path(path))
@@ -0,0 +1,444 @@
+"""
+Resilience layer for NEXUS connectors
+Retry with backoff, per-endpoint deadlines, hedged requests and circuit breaking
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from .scheduling import FairScheduler
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited because a service is down"""
+
+    def __init__(self, service: str, retry_in: float):
+        super().__init__(f"Circuit open for {service} (retry in {retry_in:.0f}s)")
+        self.service = service
+        self.retry_in = retry_in
+
+
+class DeadlineExceededError(Exception):
+    """Raised when an endpoint runs out of its share of the run budget"""
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0
+    ):
+        """
+        Initialize retry policy
+
+        Args:
+            max_attempts: Total attempts per call (1 disables retries)
+            base_delay: Delay before the first retry, in seconds
+            max_delay: Upper bound for a single backoff delay
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (1-based)"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Per-service circuit breaker (closed -> open -> half-open)"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures before opening the circuit
+            reset_timeout: Seconds to wait before letting a probe call through
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open"""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def check(self, service: str) -> bool:
+        """
+        Raise CircuitOpenError if calls to the service must fail fast
+
+        Once the reset timeout has passed, a single probe call is let through;
+        other calls keep failing fast until it succeeds or fails.
+
+        Args:
+            service: Service name, for the error message
+
+        Returns:
+            True if the caller is the half-open probe and must call end_probe()
+        """
+        state = self.state
+        if state == "closed":
+            return False
+        if state == "half_open" and not self.probing:
+            self.probing = True
+            return True
+        retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+        raise CircuitOpenError(service, retry_in)
+
+    def end_probe(self):
+        """Let another probe through if the current one ended without a verdict"""
+        self.probing = False
+
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self):
+        """Count a failed call and open the circuit past the threshold"""
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self.probing = False
+
+
+class RunBudget:
+    """Overall wall-clock budget for one run, with a cap per endpoint"""
+
+    def __init__(
+        self,
+        seconds: float,
+        shares: Optional[Dict[str, float]] = None,
+        exempt: Iterable[str] = ()
+    ):
+        """
+        Initialize run budget
+
+        Args:
+            seconds: Total budget for the run
+            shares: Cap on a single call to each endpoint, as a fraction of the
+                budget; caps are independent, so they may add up to more than 1
+            exempt: Endpoints without deadline (writes that must not be dropped
+                because earlier calls used up the budget)
+        """
+        self.seconds = seconds
+        self.shares = shares or {}
+        self.exempt = set(exempt)
+        self.started = time.monotonic()
+
+    def remaining(self) -> float:
+        """Seconds left in the whole run"""
+        return max(0.0, self.seconds - (time.monotonic() - self.started))
+
+    def deadline_for(self, endpoint: str) -> Optional[float]:
+        """Absolute monotonic deadline for a call to `endpoint` starting now (None if exempt)"""
+        if endpoint in self.exempt:
+            return None
+        share = self.shares.get(endpoint, 1.0)
+        allowance = min(self.seconds * share, self.remaining())
+        return time.monotonic() + allowance
+
+
+class Resilience:
+    """Shared retry/deadline/hedging/circuit-breaker layer for all connectors"""
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        budget: Optional[RunBudget] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        scheduler: Optional[FairScheduler] = None,
+        profile: str = "default"
+    ):
+        """
+        Initialize resilience layer
+
+        Args:
+            policy: Retry policy applied to every call
+            budget: Run budget used to derive per-endpoint deadlines
+            failure_threshold: Consecutive failures before a circuit opens
+            reset_timeout: Seconds before an open circuit lets a probe through
+            scheduler: Global rate limiter shared between profiles
+            profile: Profile name used for fair scheduling
+        """
+        self.policy = policy or RetryPolicy()
+        self.budget = budget
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.scheduler = scheduler
+        self.profile = profile
+        self.logger = logging.getLogger("nexus.resilience")
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        scheduler: Optional[FairScheduler] = None,
+        profile: str = "default"
+    ) -> "Resilience":
+        """
+        Build a resilience layer from the `resilience` config section
+
+        Args:
+            config: Resilience configuration dictionary
+            scheduler: Global rate limiter shared between profiles
+            profile: Profile name used for fair scheduling
+
+        Returns:
+            Configured Resilience instance
+        """
+        policy = RetryPolicy(
+            max_attempts=config.get('max_attempts', 3),
+            base_delay=config.get('base_delay', 0.5),
+            max_delay=config.get('max_delay', 8.0)
+        )
+
+        budget = None
+        if config.get('run_budget_seconds'):
+            budget = RunBudget(
+                seconds=config['run_budget_seconds'],
+                shares=config.get('endpoint_shares', {}),
+                exempt=config.get('budget_exempt', ["pages"])
+            )
+
+        return cls(
+            policy=policy,
+            budget=budget,
+            failure_threshold=config.get('failure_threshold', 5),
+            reset_timeout=config.get('reset_timeout', 30.0),
+            scheduler=scheduler,
+            profile=profile
+        )
+
+    def breaker(self, service: str) -> CircuitBreaker:
+        """Get (or create) the circuit breaker for a service"""
+        if service not in self._breakers:
+            self._breakers[service] = CircuitBreaker(
+                failure_threshold=self.failure_threshold,
+                reset_timeout=self.reset_timeout
+            )
+        return self._breakers[service]
+
+    async def call(
+        self,
+        service: str,
+        endpoint: str,
+        func: Callable[[], Awaitable[Any]],
+        retry_on: Callable[[Exception], bool],
+        hedge_after: Optional[float] = None
+    ) -> Any:
+        """
+        Run an async call with retries, deadline, optional hedging and circuit breaking
+
+        Args:
+            service: Service name (limitless, claude, notion)
+            endpoint: Endpoint name used for deadline shares and stats
+            func: Zero-argument coroutine factory performing the request
+            retry_on: Predicate telling whether an exception is transient
+            hedge_after: If set, fire a duplicate request after this many
+                seconds without an answer (idempotent calls only)
+
+        Returns:
+            Result of `func`
+
+        Raises:
+            CircuitOpenError: If the service circuit is open
+            DeadlineExceededError: If the endpoint deadline is exhausted
+            Exception: The last error once retries are exhausted
+        """
+        breaker = self.breaker(service)
+        stats = self._endpoint_stats(f"{service}.{endpoint}")
+
+        try:
+            probe = breaker.check(service)
+        except CircuitOpenError:
+            stats["short_circuited"] += 1
+            raise
+
+        deadline = self.budget.deadline_for(endpoint) if self.budget else None
+        attempt = 0
+
+        try:
+            while True:
+                attempt += 1
+                stats["attempts"] += 1
+                started = time.monotonic()
+
+                try:
+                    timeout = None
+                    if deadline is not None:
+                        timeout = deadline - started
+                        if timeout <= 0:
+                            raise DeadlineExceededError(
+                                f"{service}.{endpoint} exceeded its run budget"
+                            )
+
+                    # The timeout also bounds the wait for a scheduler slot
+                    request = self._in_slot(service, func)
+                    if hedge_after is not None:
+                        result = await self._hedged(request, hedge_after, timeout, stats)
+                    else:
+                        result = await asyncio.wait_for(request(), timeout)
+
+                    breaker.record_success()
+                    return result
+
+                except DeadlineExceededError:
+                    stats["failures"] += 1
+                    breaker.record_failure()
+                    raise
+
+                except Exception as e:
+                    elapsed = time.monotonic() - started
+                    stats["wasted_seconds"] += elapsed
+                    transient = isinstance(e, asyncio.TimeoutError) or retry_on(e)
+
+                    if not transient:
+                        stats["failures"] += 1
+                        raise
+
+                    breaker.record_failure()
+                    delay = self.policy.backoff(attempt)
+                    out_of_time = (
+                        deadline is not None and time.monotonic() + delay >= deadline
+                    )
+
+                    if attempt >= self.policy.max_attempts or out_of_time:
+                        stats["failures"] += 1
+                        raise
+
+                    try:
+                        probe = breaker.check(service)
+                    except CircuitOpenError:
+                        stats["short_circuited"] += 1
+                        raise
+
+                    self.logger.warning(
+                        f"{service}.{endpoint} attempt {attempt} failed ({e!r}), "
+                        f"retrying in {delay:.2f}s"
+                    )
+                    stats["retries"] += 1
+                    stats["wasted_seconds"] += delay
+                    await asyncio.sleep(delay)
+
+        finally:
+            if probe:
+                breaker.end_probe()
+
+    def _in_slot(
+        self,
+        service: str,
+        func: Callable[[], Awaitable[Any]]
+    ) -> Callable[[], Awaitable[Any]]:
+        """Wrap a request so each run of it holds its own scheduler slot"""
+        if self.scheduler is None:
+            return func
+
+        async def request() -> Any:
+            async with self.scheduler.slot(service, self.profile):
+                return await func()
+
+        return request
+
+    async def _hedged(
+        self,
+        func: Callable[[], Awaitable[Any]],
+        hedge_after: float,
+        timeout: Optional[float],
+        stats: Dict[str, float]
+    ) -> Any:
+        """Race the primary request against a delayed duplicate (each in its own slot)"""
+        primary = asyncio.ensure_future(func())
+        tasks = [primary]
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done and (timeout is None or timeout > hedge_after):
+                stats["hedges"] += 1
+                tasks.append(asyncio.ensure_future(func()))
+
+            remaining = None if timeout is None else max(0.0, timeout - hedge_after)
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise asyncio.TimeoutError()
+
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            stats["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+
+            raise error
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _endpoint_stats(self, key: str) -> Dict[str, float]:
+        """Get (or create) the counters for an endpoint"""
+        if key not in self._stats:
+            self._stats[key] = {
+                "attempts": 0,
+                "retries": 0,
+                "failures": 0,
+                "short_circuited": 0,
+                "hedges": 0,
+                "hedge_wins": 0,
+                "wasted_seconds": 0.0
+            }
+        return self._stats[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize retries and wasted time for the run stats
+
+        Returns:
+            Totals plus a per-endpoint breakdown
+        """
+        endpoints = {
+            key: {**values, "wasted_seconds": round(values["wasted_seconds"], 2)}
+            for key, values in self._stats.items()
+        }
+
+        return {
+            "retries": sum(s["retries"] for s in self._stats.values()),
+            "failures": sum(s["failures"] for s in self._stats.values()),
+            "hedges": sum(s["hedges"] for s in self._stats.values()),
+            "wasted_seconds": round(
+                sum(s["wasted_seconds"] for s in self._stats.values()), 2
+            ),
+            "open_circuits": [
+                name for name, b in self._breakers.items() if b.state == "open"
+            ],
+            "endpoints": endpoints
+        }
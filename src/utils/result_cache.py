@@ -0,0 +1,90 @@
+"""
+In-process result cache shared between connectors
+Deduplicates identical requests, including ones still in flight
+"""
+
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict
+
+
+class ResultCache:
+    """Bounded LRU cache with single-flight deduplication"""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize result cache
+
+        Args:
+            max_entries: Maximum number of cached results
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Build a cache key from JSON-serializable parts"""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def get_or_compute(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached result for `key`, computing it at most once
+
+        Args:
+            key: Cache key
+            factory: Coroutine factory producing the result on a miss
+
+        Returns:
+            Cached or freshly computed result
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        if key in self._inflight:
+            self.hits += 1
+            return await asyncio.shield(self._inflight[key])
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so waiter-less failures don't warn
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def put(self, key: str, value: Any):
+        """Store a result produced outside `get_or_compute` (e.g. a consumed stream)"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters"""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
@@ -0,0 +1,250 @@
+"""
+Run history
+Append-only log of every run plus daily and weekly aggregates maintained as runs are recorded
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import codec
+from .models import PRIORITY_TYPES
+
+# Counters summed into every daily and weekly bucket
+COUNTERS = (
+    "runs",
+    "failed_runs",
+    "dry_runs",
+    "lifelogs_analyzed",
+    "priorities_detected",
+    "priorities_kept",
+    "filtered_low_confidence",
+    "filtered_over_limit",
+    "todos_created",
+    "todos_failed",
+    "todos_skipped",
+    "engagements",
+    "demandes",
+    "deadlines",
+    "claude_calls",
+    "input_tokens",
+    "output_tokens",
+    "elapsed_seconds"
+)
+
+
+def week_key(day: date) -> str:
+    """ISO week of a date (e.g. 2024-W43)"""
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def run_record(
+    results: Dict[str, Any],
+    command: str,
+    period: str,
+    elapsed: float,
+    profile: Optional[str] = None,
+    run_at: Optional[datetime] = None,
+    timings: Optional[Dict[str, float]] = None
+) -> Dict[str, Any]:
+    """
+    Build the history record of one priority detection run
+
+    Args:
+        results: Results from analyze_priorities
+        command: CLI command that ran the analysis (priorities, prewarm, run...)
+        period: Time period (today/week)
+        elapsed: Run duration in seconds
+        profile: Profile name for multi-profile runs
+        run_at: Start of the run (defaults to now)
+        timings: Named step durations in seconds (e.g. from the skill runner)
+
+    Returns:
+        Dictionary with run metadata, stats (token usage included), timings
+        and per-item outcomes: created, failed or skipped (TODO already
+        created by an earlier run) in Notion, detected if nothing was sent
+    """
+    stats = results.get("stats", {})
+    dry_run = bool(results.get("dry_run", stats.get("dry_run", False)))
+    outcomes = {} if dry_run else results.get("outcomes") or {}
+
+    items = [
+        {
+            "type": item_type,
+            "title": item.title,
+            "confidence": item.confidence,
+            "score": item.score,
+            "outcome": outcomes.get(item_type, {}).get(item.title, "detected")
+        }
+        for item_type in PRIORITY_TYPES
+        for item in results.get("priorities", {}).get(item_type, [])
+    ]
+
+    return {
+        "run_at": (run_at or datetime.now()).isoformat(timespec='seconds'),
+        "command": command,
+        "period": period,
+        "profile": profile,
+        "success": bool(results.get("success")),
+        "dry_run": dry_run,
+        "elapsed_seconds": round(elapsed, 3),
+        "stats": stats,
+        "timings": timings or {},
+        "items": items
+    }
+
+
+class RunHistory:
+    """Append-only run log with incrementally maintained aggregates"""
+
+    def __init__(self, path: str):
+        """
+        Initialize history
+
+        Args:
+            path: Directory holding runs.jsonl and aggregates.json
+        """
+        self.path = Path(path)
+        self.runs_file = self.path / "runs.jsonl"
+        self.aggregates_file = self.path / "aggregates.json"
+        self.logger = logging.getLogger("nexus.history")
+
+    def record(self, record: Dict[str, Any]):
+        """
+        Append a run and fold it into its day and week
+
+        Args:
+            record: Record from run_record
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        # Loaded first: a rebuild from the log must not see this run yet
+        aggregates = self.aggregates()
+
+        with open(self.runs_file, 'a', encoding='utf-8') as f:
+            f.write(codec.dumps(record) + "\n")
+
+        self._fold(aggregates, record)
+        self._save_aggregates(aggregates)
+
+    def aggregates(self) -> Dict[str, Any]:
+        """
+        Daily and weekly aggregates
+
+        Rebuilt from the run log if missing or unreadable.
+
+        Returns:
+            Dictionary with `daily` (by YYYY-MM-DD) and `weekly` (by ISO week)
+            counters of all runs, and the same for each profile's runs under
+            `profiles`
+        """
+        try:
+            return codec.read_json(self.aggregates_file)
+        except FileNotFoundError:
+            if self.runs_file.exists():
+                return self.rebuild()
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Rebuilding unreadable aggregates {self.aggregates_file}: {e}")
+            return self.rebuild()
+        return {"daily": {}, "weekly": {}, "profiles": {}}
+
+    def rebuild(self) -> Dict[str, Any]:
+        """
+        Recompute aggregates from the whole run log
+
+        Returns:
+            Fresh aggregates (also saved)
+        """
+        aggregates: Dict[str, Any] = {"daily": {}, "weekly": {}, "profiles": {}}
+        if self.runs_file.exists():
+            with open(self.runs_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self._fold(aggregates, codec.loads(line))
+                    except ValueError:
+                        # A run interrupted mid-write leaves a partial last line
+                        continue
+            self._save_aggregates(aggregates)
+        return aggregates
+
+    def profiles(self) -> List[str]:
+        """Names of the profiles with recorded runs"""
+        return sorted(self.aggregates().get("profiles", {}))
+
+    def summary(
+        self,
+        weeks: int = 4,
+        today: Optional[date] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Aggregates of the last weeks and days
+
+        Args:
+            weeks: Number of ISO weeks, current week included
+            today: Reference date (defaults to today)
+            profile: Only count this profile's runs (all runs if None)
+
+        Returns:
+            Dictionary with `weeks` and `days` (last 7 days), oldest first,
+            each entry holding its key and counters
+        """
+        today = today or date.today()
+        aggregates = self.aggregates()
+        if profile is not None:
+            aggregates = aggregates.get("profiles", {}).get(profile, {"daily": {}, "weekly": {}})
+
+        def bucket(kind: str, key: str) -> Dict[str, Any]:
+            return {"key": key, **{name: 0 for name in COUNTERS}, **aggregates[kind].get(key, {})}
+
+        week_keys: List[str] = []
+        for offset in range(weeks):
+            key = week_key(today - timedelta(weeks=offset))
+            if key not in week_keys:
+                week_keys.append(key)
+
+        return {
+            "weeks": [bucket("weekly", key) for key in reversed(week_keys)],
+            "days": [
+                bucket("daily", (today - timedelta(days=offset)).isoformat())
+                for offset in reversed(range(7))
+            ]
+        }
+
+    @staticmethod
+    def _fold(aggregates: Dict[str, Any], record: Dict[str, Any]):
+        """Add one run to its daily and weekly buckets, overall and for its profile"""
+        day = datetime.fromisoformat(record["run_at"]).date()
+        stats = record.get("stats", {})
+        tokens = stats.get("tokens", {})
+
+        increments = {
+            "runs": 1,
+            "failed_runs": 0 if record.get("success") else 1,
+            "dry_runs": 1 if record.get("dry_run") else 0,
+            "claude_calls": tokens.get("calls", 0),
+            "input_tokens": tokens.get("input_tokens", 0),
+            "output_tokens": tokens.get("output_tokens", 0),
+            "elapsed_seconds": record.get("elapsed_seconds", 0)
+        }
+        for name in COUNTERS:
+            if name not in increments:
+                increments[name] = stats.get(name, 0) or 0
+
+        targets = [aggregates]
+        if record.get("profile"):
+            targets.append(aggregates.setdefault("profiles", {}).setdefault(
+                record["profile"], {"daily": {}, "weekly": {}}
+            ))
+
+        for target in targets:
+            for kind, key in (("daily", day.isoformat()), ("weekly", week_key(day))):
+                bucket = target[kind].setdefault(key, {})
+                for name, value in increments.items():
+                    bucket[name] = round(bucket.get(name, 0) + value, 3)
+
+    def _save_aggregates(self, aggregates: Dict[str, Any]):
+        """Write aggregates atomically"""
+        codec.write_json(self.aggregates_file, aggregates)
@@ -0,0 +1,107 @@
+"""
+Fair scheduling of API calls across profiles
+Global per-service concurrency limits with round-robin hand-off between profiles
+"""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional
+
+
+class _ServiceQueue:
+    """Waiters for one service, grouped by profile"""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self.in_use = 0
+        self.waiters: Dict[str, Deque[asyncio.Future]] = {}
+        self.rotation: Deque[str] = deque()
+
+
+class FairScheduler:
+    """Global per-service concurrency limits shared fairly between profiles"""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default_limit: int = 4):
+        """
+        Initialize scheduler
+
+        Args:
+            limits: Maximum concurrent calls per service (limitless, claude, notion)
+            default_limit: Limit for services not listed in `limits`
+        """
+        self.limits = limits or {}
+        self.default_limit = default_limit
+        self._queues: Dict[str, _ServiceQueue] = {}
+
+    def _queue(self, service: str) -> _ServiceQueue:
+        """Get (or create) the queue for a service"""
+        if service not in self._queues:
+            self._queues[service] = _ServiceQueue(
+                self.limits.get(service, self.default_limit)
+            )
+        return self._queues[service]
+
+    @asynccontextmanager
+    async def slot(self, service: str, profile: str = "default"):
+        """
+        Hold one of the service's concurrency slots
+
+        When slots are exhausted, waiting profiles are served round-robin so a
+        profile with many queued calls cannot starve the others.
+
+        Args:
+            service: Service name
+            profile: Profile issuing the call
+        """
+        queue = self._queue(service)
+
+        if queue.in_use < queue.capacity and not queue.rotation:
+            queue.in_use += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            if profile not in queue.waiters:
+                queue.waiters[profile] = deque()
+                queue.rotation.append(profile)
+            queue.waiters[profile].append(future)
+            try:
+                # The releasing task hands its slot over, so in_use is unchanged
+                await future
+            except asyncio.CancelledError:
+                if not future.done() or future.cancelled():
+                    self._forget(queue, profile, future)
+                else:
+                    self._release(queue)
+                raise
+
+        try:
+            yield
+        finally:
+            self._release(queue)
+
+    def _forget(self, queue: _ServiceQueue, profile: str, future: asyncio.Future):
+        """Drop a cancelled waiter"""
+        waiters = queue.waiters.get(profile)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del queue.waiters[profile]
+                queue.rotation.remove(profile)
+
+    def _release(self, queue: _ServiceQueue):
+        """Hand the slot to the next profile in rotation, or free it"""
+        while queue.rotation:
+            profile = queue.rotation.popleft()
+            waiters = queue.waiters[profile]
+            future = waiters.popleft()
+
+            if waiters:
+                queue.rotation.append(profile)
+            else:
+                del queue.waiters[profile]
+
+            if not future.done():
+                future.set_result(None)
+                return
+
+        queue.in_use -= 1
@@ -0,0 +1,240 @@
+"""
+Local full-text search index over synced lifelogs
+BM25-ranked inverted index stored in SQLite, built incrementally
+"""
+
+import hashlib
+import logging
+import math
+import re
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .text import tokenize
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id TEXT PRIMARY KEY,
+    date TEXT,
+    title TEXT,
+    length INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+CREATE INDEX IF NOT EXISTS docs_date ON docs (date);
+"""
+
+WORD_RE = re.compile(r"\S+")
+
+
+def lifelog_id(lifelog: Dict[str, Any]) -> str:
+    """Stable identifier for a lifelog (API id, or hash of title and date)"""
+    if lifelog.get("id"):
+        return str(lifelog.get("id"))
+    seed = f"{lifelog.get('title', '')}|{lifelog.get('date', '')}"
+    return hashlib.sha1(seed.encode('utf-8')).hexdigest()
+
+
+class SearchIndex:
+    """BM25 inverted index over lifelog transcripts"""
+
+    def __init__(self, path: str, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize search index
+
+        Args:
+            path: SQLite database file
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.path = Path(path)
+        self.k1 = k1
+        self.b = b
+        self.logger = logging.getLogger("nexus.search")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the underlying database"""
+        self.db.close()
+
+    def add_lifelogs(self, lifelogs: Iterable[Dict[str, Any]]) -> int:
+        """
+        Index new or changed lifelogs (unchanged ones are skipped)
+
+        Args:
+            lifelogs: Lifelog objects with transcripts
+
+        Returns:
+            Number of lifelogs (re)indexed
+        """
+        indexed = 0
+
+        with self.db:
+            for log in lifelogs:
+                text = log.get("transcript", "")
+                if not text:
+                    continue
+
+                doc_id = lifelog_id(log)
+                title = log.get("title", "")
+                content_hash = hashlib.sha1(f"{title}\n{text}".encode('utf-8')).hexdigest()
+
+                row = self.db.execute(
+                    "SELECT content_hash FROM docs WHERE id = ?", (doc_id,)
+                ).fetchone()
+                if row and row[0] == content_hash:
+                    continue
+
+                terms = Counter(tokenize(f"{title}\n{text}"))
+
+                self.db.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+                self.db.execute(
+                    "INSERT OR REPLACE INTO docs (id, date, title, length, content_hash, text) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (doc_id, log.get("date", ""), title,
+                     sum(terms.values()), content_hash, text)
+                )
+                self.db.executemany(
+                    "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                    [(term, doc_id, tf) for term, tf in terms.items()]
+                )
+                indexed += 1
+
+        if indexed:
+            self.logger.info(f"Indexed {indexed} lifelogs into {self.path}")
+        return indexed
+
+    def search(
+        self,
+        query: str,
+        since: Optional[str] = None,
+        limit: int = 10,
+        exclude: Iterable[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank indexed lifelogs against a query
+
+        Args:
+            query: Free-text query (French, accents optional)
+            since: Only return lifelogs dated on/after this ISO date
+            limit: Maximum number of results
+            exclude: Lifelog ids to leave out
+
+        Returns:
+            Ranked results with id, date, title, score and snippet
+        """
+        return self._search_terms(tokenize(query), since, limit, set(exclude))
+
+    def related_context(
+        self,
+        lifelogs: List[Dict[str, Any]],
+        limit: int = 3,
+        max_terms: int = 12
+    ) -> List[Dict[str, Any]]:
+        """
+        Find past lifelogs relevant to the ones being analyzed
+
+        Args:
+            lifelogs: Lifelogs of the current run
+            limit: Maximum number of past lifelogs to return
+            max_terms: Number of salient terms used as the query
+
+        Returns:
+            Ranked results (current lifelogs excluded)
+        """
+        counts: Counter = Counter()
+        for log in lifelogs:
+            counts.update(tokenize(f"{log.get('title', '')}\n{log.get('transcript', '')}"))
+
+        terms = [term for term, _ in counts.most_common(max_terms)]
+        exclude = {lifelog_id(log) for log in lifelogs}
+        return self._search_terms(terms, None, limit, exclude)
+
+    def _search_terms(
+        self,
+        terms: List[str],
+        since: Optional[str],
+        limit: int,
+        exclude: set
+    ) -> List[Dict[str, Any]]:
+        """BM25 scoring over already-tokenized query terms"""
+        if not terms:
+            return []
+
+        total_docs, avg_length = self.db.execute(
+            "SELECT COUNT(*), AVG(length) FROM docs"
+        ).fetchone()
+        if not total_docs:
+            return []
+
+        scores: Dict[str, float] = {}
+        for term in set(terms):
+            df = self.db.execute(
+                "SELECT COUNT(*) FROM postings WHERE term = ?", (term,)
+            ).fetchone()[0]
+            if not df:
+                continue
+
+            idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            rows = self.db.execute(
+                "SELECT p.doc_id, p.tf, d.length FROM postings p "
+                "JOIN docs d ON d.id = p.doc_id "
+                "WHERE p.term = ? AND d.date >= ?",
+                (term, since or "")
+            )
+            for doc_id, tf, length in rows:
+                if doc_id in exclude:
+                    continue
+                norm = tf + self.k1 * (1 - self.b + self.b * length / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / norm
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+        results = []
+        query_terms = set(terms)
+        for doc_id, score in ranked:
+            date, title, text = self.db.execute(
+                "SELECT date, title, text FROM docs WHERE id = ?", (doc_id,)
+            ).fetchone()
+            results.append({
+                "id": doc_id,
+                "date": date,
+                "title": title,
+                "score": round(score, 3),
+                "snippet": self._snippet(text, query_terms)
+            })
+
+        return results
+
+    @staticmethod
+    def _snippet(text: str, query_terms: set, width: int = 30) -> str:
+        """Pick the window of `width` words containing the most query terms"""
+        words = WORD_RE.findall(text)
+        if len(words) <= width:
+            return " ".join(words)
+
+        hits = [1 if query_terms.intersection(tokenize(word)) else 0 for word in words]
+        current = sum(hits[:width])
+        best_start, best = 0, current
+        for start in range(1, len(words) - width + 1):
+            current += hits[start + width - 1] - hits[start - 1]
+            if current > best:
+                best_start, best = start, current
+
+        snippet = " ".join(words[best_start:best_start + width])
+        prefix = "… " if best_start > 0 else ""
+        suffix = " …" if best_start + width < len(words) else ""
+        return f"{prefix}{snippet}{suffix}"
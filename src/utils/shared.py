@@ -0,0 +1,91 @@
+"""
+Resources shared between concurrently running profiles
+One HTTP pool, one result cache and one set of global rate limits per process
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import httpx
+
+from .result_cache import ResultCache
+from .scheduling import FairScheduler
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+
+class SharedResources:
+    """HTTP pools, result cache and fair rate limits for multi-profile runs"""
+
+    def __init__(
+        self,
+        scheduler: Optional[FairScheduler] = None,
+        cache: Optional[ResultCache] = None,
+        max_connections: int = 20
+    ):
+        """
+        Initialize shared resources
+
+        Args:
+            scheduler: Global per-service rate limits
+            cache: Result cache shared by all profiles
+            max_connections: Size of the shared HTTP connection pool
+        """
+        self.scheduler = scheduler or FairScheduler()
+        self.cache = cache or ResultCache()
+        limits = httpx.Limits(max_connections=max_connections)
+        self.http_client = httpx.AsyncClient(limits=limits, timeout=60.0)
+        self._notion_clients: Dict[str, httpx.AsyncClient] = {}
+        self._anthropic_clients: Dict[str, "AsyncAnthropic"] = {}
+        self._limits = limits
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SharedResources":
+        """
+        Build shared resources from the `scheduling` config section
+
+        Args:
+            config: Scheduling configuration dictionary
+
+        Returns:
+            Configured SharedResources instance
+        """
+        return cls(
+            scheduler=FairScheduler(limits=config.get('limits', {})),
+            cache=ResultCache(max_entries=config.get('cache_entries', 256)),
+            max_connections=config.get('max_connections', 20)
+        )
+
+    def notion_client(self, token: str) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client for a Notion token
+
+        The Notion SDK stores auth headers on its HTTP client, so the pool is
+        shared per token rather than globally.
+        """
+        if token not in self._notion_clients:
+            self._notion_clients[token] = httpx.AsyncClient(limits=self._limits)
+        return self._notion_clients[token]
+
+    def anthropic_client(self, api_key: str) -> "AsyncAnthropic":
+        """
+        Get the shared Anthropic client for an API key
+
+        The Anthropic SDK manages its own connection pool, so profiles using
+        the same key share one client.
+        """
+        if api_key not in self._anthropic_clients:
+            # The SDK takes over a second to import; only pay for it when used
+            from anthropic import AsyncAnthropic
+
+            # Retries are owned by the resilience layer
+            self._anthropic_clients[api_key] = AsyncAnthropic(api_key=api_key, max_retries=0)
+        return self._anthropic_clients[api_key]
+
+    async def aclose(self):
+        """Close every pooled HTTP client"""
+        await self.http_client.aclose()
+        for client in self._notion_clients.values():
+            await client.aclose()
+        for client in self._anthropic_clients.values():
+            await client.close()
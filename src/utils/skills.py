@@ -0,0 +1,236 @@
+"""
+Skill discovery and execution
+Load skills from their directories and run them over one shared lifelog dataset
+"""
+
+import asyncio
+import importlib
+import logging
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from .models import Lifelog, local_day
+
+
+SKILLS_ROOT = Path(__file__).parent.parent.parent / "skills"
+
+
+def skill_module_name(directory: str) -> str:
+    """Importable package name of a skill directory (priority-detector -> priority_detector)"""
+    return directory.replace("-", "_")
+
+
+def register_skills(root: Path = SKILLS_ROOT) -> Dict[str, Path]:
+    """
+    Make every skill importable as `skills.<name>`
+
+    Skill directories use hyphens, which Python can't import, so each one is
+    registered under its underscore name with the directory as its package
+    path; `skills.<name>.scripts` then imports normally and lazily.
+
+    Args:
+        root: Directory holding one sub-directory per skill
+
+    Returns:
+        Skill directory by directory name
+    """
+    try:
+        parent = importlib.import_module("skills")
+    except ImportError:
+        parent = ModuleType("skills")
+        parent.__path__ = [str(root)]
+        sys.modules["skills"] = parent
+
+    found = {}
+    for skill_dir in sorted(root.iterdir()) if root.is_dir() else []:
+        if not (skill_dir / "SKILL.md").exists():
+            continue
+
+        found[skill_dir.name] = skill_dir
+        name = skill_module_name(skill_dir.name)
+        alias = f"skills.{name}"
+        if alias not in sys.modules:
+            package = ModuleType(alias)
+            package.__path__ = [str(skill_dir)]
+            sys.modules[alias] = package
+            setattr(parent, name, package)
+
+    return found
+
+
+def read_skill_manifest(skill_dir: Path) -> Dict[str, Any]:
+    """
+    Read the front matter of a skill's SKILL.md
+
+    Args:
+        skill_dir: Skill directory
+
+    Returns:
+        Front matter fields (name, description, version...), empty if absent
+    """
+    text = (skill_dir / "SKILL.md").read_text(encoding='utf-8')
+    if not text.startswith("---"):
+        return {}
+
+    front_matter = text.split("---", 2)[1]
+    try:
+        return yaml.safe_load(front_matter) or {}
+    except yaml.YAMLError:
+        return {}
+
+
+def discover_skills(root: Path = SKILLS_ROOT) -> List[Dict[str, Any]]:
+    """
+    List the skills under a directory
+
+    Args:
+        root: Directory holding one sub-directory per skill
+
+    Returns:
+        One dictionary per skill: id (directory name), name, description,
+        path and module (its scripts package)
+    """
+    skills = []
+    for directory, skill_dir in register_skills(root).items():
+        manifest = read_skill_manifest(skill_dir)
+        skills.append({
+            "id": directory,
+            "name": manifest.get("name", directory),
+            "description": manifest.get("description", ""),
+            "path": skill_dir,
+            "module": importlib.import_module(f"skills.{skill_module_name(directory)}.scripts")
+        })
+    return skills
+
+
+def compact_lifelog(lifelog: Dict[str, Any]) -> Lifelog:
+    """
+    Keep only what skills read
+
+    Raw Limitless payloads carry much more than id, title, date and transcript.
+    The transcript is kept as is, so skills fingerprint, index and prompt the
+    same text as a standalone command would.
+
+    Args:
+        lifelog: Lifelog or normalized conversation
+
+    Returns:
+        Lifelog
+    """
+    return Lifelog.from_dict(lifelog)
+
+
+class SkillRunner:
+    """Fetch lifelogs once and fan them out to every enabled skill"""
+
+    def __init__(
+        self,
+        skills: List[Dict[str, Any]],
+        enabled: Optional[List[str]] = None
+    ):
+        """
+        Initialize runner
+
+        Args:
+            skills: Skills from discover_skills
+            enabled: Skill ids to run (default: every skill with a `run_skill` entry point)
+        """
+        self.logger = logging.getLogger("nexus.skills")
+        self.skills = [
+            skill for skill in skills
+            if hasattr(skill["module"], "run_skill")
+            and (enabled is None or skill["id"] in enabled)
+        ]
+
+        if enabled is not None:
+            missing = set(enabled) - {skill["id"] for skill in self.skills}
+            if missing:
+                self.logger.warning(
+                    f"Skipping skills without a lifelog entry point or not found: {', '.join(sorted(missing))}"
+                )
+
+    async def run(
+        self,
+        limitless_connector,
+        context: Dict[str, Any],
+        days: int = 1,
+        since=None
+    ) -> Dict[str, Any]:
+        """
+        Run every skill over the same window of lifelogs
+
+        A skill exposing `fetch_days(days, context)` says how many days, ending
+        today, it needs (e.g. only the days its stored results don't cover);
+        the others need the whole period. The longest window is fetched once
+        and each skill gets its own days, with their number as
+        `context["window_days"]`.
+
+        Args:
+            limitless_connector: Limitless API connector
+            context: Passed to each skill's `run_skill(lifelogs, context)`
+                (period, dry_run, connectors, indexes...)
+            days: Number of days of the period
+            since: Only fetch lifelogs recorded after this time
+
+        Returns:
+            Dictionary with results by skill id, lifelog count and timings
+            (fetch, compact, then one entry per skill)
+        """
+        timings: Dict[str, float] = {}
+
+        windows = {
+            skill["id"]: (
+                skill["module"].fetch_days(days, context)
+                if since is None and hasattr(skill["module"], "fetch_days") else days
+            )
+            for skill in self.skills
+        }
+        window = max(windows.values(), default=0)
+
+        # At most one Limitless round-trip, whatever the number of skills
+        started = time.perf_counter()
+        lifelogs = await limitless_connector.get_window(days=window, since=since) if window else []
+        timings["fetch"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        lifelogs = [compact_lifelog(lifelog) for lifelog in lifelogs]
+        timings["compact"] = time.perf_counter() - started
+
+        self.logger.info(f"Running {len(self.skills)} skills over {len(lifelogs)} lifelogs")
+
+        async def run_one(skill: Dict[str, Any]) -> Dict[str, Any]:
+            started = time.perf_counter()
+            skill_window = windows[skill["id"]]
+            skill_lifelogs = lifelogs
+            if skill_window < window:
+                first = date.today() - timedelta(days=skill_window - 1)
+                skill_lifelogs = [
+                    log for log in lifelogs
+                    if skill_window and (local_day(log.date) or first) >= first
+                ]
+            try:
+                return await skill["module"].run_skill(
+                    skill_lifelogs, {**context, "window_days": skill_window}
+                )
+            except Exception as e:
+                self.logger.error(f"Skill {skill['id']} failed: {e}", exc_info=True)
+                return {"success": False, "message": str(e)}
+            finally:
+                timings[skill["id"]] = time.perf_counter() - started
+
+        results = await asyncio.gather(*(run_one(skill) for skill in self.skills))
+
+        for skill_id, seconds in timings.items():
+            self.logger.info(f"{skill_id}: {seconds:.2f}s")
+
+        return {
+            "results": {skill["id"]: result for skill, result in zip(self.skills, results)},
+            "lifelogs": len(lifelogs),
+            "timings": {key: round(seconds, 3) for key, seconds in timings.items()}
+        }
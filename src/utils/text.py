@@ -0,0 +1,75 @@
+"""
+French text normalization helpers
+Accent folding, tokenization and light stemming for local indexes
+"""
+
+import re
+import unicodedata
+from typing import List
+
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    "a", "ai", "au", "aux", "avec", "c", "ce", "ces", "cet", "cette", "d", "dans",
+    "de", "des", "du", "elle", "en", "est", "et", "eu", "il", "ils", "j", "je",
+    "l", "la", "le", "les", "leur", "lui", "m", "ma", "mais", "me", "mes", "moi",
+    "mon", "n", "ne", "nos", "notre", "nous", "on", "ou", "par", "pas", "pour",
+    "qu", "que", "qui", "s", "sa", "se", "ses", "son", "sur", "t", "ta", "te",
+    "tes", "toi", "ton", "tu", "un", "une", "vos", "votre", "vous", "y", "ca",
+    "etre", "avoir", "fait", "plus", "tres", "bien", "oui", "non", "the", "and"
+}
+
+# Longest suffixes first; each is stripped only if a stem of 3+ chars remains
+SUFFIXES = (
+    "issements", "issement", "atrices", "atrice", "ateurs", "ateur", "ations",
+    "ation", "ements", "ement", "ances", "ance", "ences", "ence", "ments", "ment",
+    "ites", "ite", "ives", "ive", "ifs", "if", "euses", "euse", "eux", "istes",
+    "iste", "ables", "able", "eurs", "eur", "ees", "ee", "er", "ez", "es", "e"
+)
+
+
+def fold_accents(text: str) -> str:
+    """Lowercase and strip diacritics ("Échéance" -> "echeance")"""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def stem(word: str) -> str:
+    """
+    Light French stemmer (plural and common derivational suffixes)
+
+    Args:
+        word: Accent-folded lowercase word
+
+    Returns:
+        Stem
+    """
+    if len(word) <= 4 or word.isdigit():
+        return word
+
+    if word.endswith(("s", "x")) and not word.endswith(("ss", "us")):
+        word = word[:-1]
+
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into folded, stemmed, stopword-free terms
+
+    Args:
+        text: Raw text
+
+    Returns:
+        List of index terms (in order, with repetitions)
+    """
+    return [
+        stem(token)
+        for token in TOKEN_RE.findall(fold_accents(text))
+        if token not in STOPWORDS
+    ]
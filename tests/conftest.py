@@ -0,0 +1,11 @@
+"""Shared test setup: import the project and its skills as the CLI does"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import register_skills  # noqa: E402
+
+register_skills(project_root / "skills")
@@ -0,0 +1,131 @@
+"""Tests for record/replay cassettes"""
+
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from src.connectors.limitless import LimitlessConnector
+from src.utils.cassette import Cassette, CassetteMissError
+from src.utils.resilience import Resilience, RetryPolicy
+
+
+def since(day: str) -> dict:
+    return {"since": f"{day}T00:00:00", "limit": 50, "include_transcripts": True}
+
+
+def test_key_ignores_parameter_order():
+    assert Cassette.key("limitless", "lifelogs", {"a": 1, "b": 2}) == \
+        Cassette.key("limitless", "lifelogs", {"b": 2, "a": 1})
+
+
+def test_key_depends_on_service_operation_and_params():
+    base = Cassette.key("limitless", "lifelogs", {"limit": 50})
+    assert base != Cassette.key("limitless", "conversations", {"limit": 50})
+    assert base != Cassette.key("claude", "lifelogs", {"limit": 50})
+    assert base != Cassette.key("limitless", "lifelogs", {"limit": 10})
+
+
+def test_today_and_week_windows_get_distinct_keys():
+    today = date(2026, 10, 19)
+    assert Cassette.key("limitless", "lifelogs", since("2026-10-19"), today) != \
+        Cassette.key("limitless", "lifelogs", since("2026-10-13"), today)
+
+
+def test_window_key_is_relative_to_the_current_day():
+    recorded = Cassette.key("limitless", "lifelogs", since("2026-10-13"), date(2026, 10, 19))
+    replayed = Cassette.key("limitless", "lifelogs", since("2026-10-20"), date(2026, 10, 26))
+    assert recorded == replayed
+
+
+def test_non_date_since_is_kept_as_is():
+    assert Cassette.key("limitless", "lifelogs", {"since": "cursor-1"}) != \
+        Cassette.key("limitless", "lifelogs", {"since": "cursor-2"})
+
+
+def test_record_then_replay(tmp_path):
+    path = tmp_path / "today.json.gz"
+    recorder = Cassette(str(path), mode="record")
+    responses = iter([{"lifelogs": [1]}, {"lifelogs": [2]}])
+
+    async def live():
+        return next(responses)
+
+    async def record():
+        request = since(date.today().isoformat())
+        await recorder.through("limitless", "lifelogs", request, live)
+        await recorder.through("limitless", "lifelogs", request, live)
+
+    asyncio.run(record())
+    recorder.save()
+
+    player = Cassette(str(path), mode="replay")
+
+    async def offline():
+        raise AssertionError("replay must not reach the network")
+
+    async def replay():
+        request = since(date.today().isoformat())
+        return [
+            await player.through("limitless", "lifelogs", request, offline)
+            for _ in range(3)
+        ]
+
+    # Repeated requests are served in order, then the last one again
+    assert asyncio.run(replay()) == [{"lifelogs": [1]}, {"lifelogs": [2]}, {"lifelogs": [2]}]
+
+
+def test_replay_miss_raises(tmp_path):
+    path = tmp_path / "empty.json.gz"
+    recorder = Cassette(str(path), mode="record")
+    recorder.record("claude", "messages", {"prompt": "a"}, {"text": "b"})
+    recorder.save()
+
+    player = Cassette(str(path), mode="replay")
+
+    async def live():
+        return {}
+
+    with pytest.raises(CassetteMissError):
+        asyncio.run(player.through("claude", "messages", {"prompt": "other"}, live))
+
+
+def test_replay_of_missing_file_fails(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Cassette(str(tmp_path / "missing.json.gz"), mode="replay")
+
+
+class BrokenBody(httpx.AsyncByteStream):
+    """Response body cut off after its first lifelog"""
+
+    async def __aiter__(self):
+        yield b'{"lifelogs": [{"id": "a", "transcript": "un"}, {"id": "b", "tra'
+        raise httpx.ReadError("connection reset")
+
+
+def broken_stream_connector(cassette):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, stream=BrokenBody())
+    ))
+    return LimitlessConnector(
+        "key", resilience=Resilience(policy=RetryPolicy(max_attempts=1)),
+        cassette=cassette, http_client=client, include_conversations=False
+    )
+
+
+def test_truncated_stream_raises_and_is_not_recorded(tmp_path):
+    cassette = Cassette(str(tmp_path / "run.json.gz"), mode="record")
+    connector = broken_stream_connector(cassette)
+    received = []
+
+    async def consume():
+        async for lifelog in connector.iter_window(days=1):
+            received.append(lifelog["id"])
+
+    with pytest.raises(httpx.ReadError):
+        asyncio.run(consume())
+
+    assert received == ["a"]
+    cassette.save()
+    assert not (tmp_path / "run.json.gz").exists()
@@ -0,0 +1,90 @@
+"""Tests for the JSON codec and the typed models it encodes"""
+
+from datetime import datetime
+
+import pytest
+
+from src.utils import codec
+from src.utils.models import Lifelog, Priority, parse_priorities, priorities_to_dict
+
+
+def test_round_trip_keeps_unicode_and_nesting():
+    value = {"titre": "Réunion à Québec", "items": [1, 2.5, None, True], "nested": {"é": ["ü"]}}
+    text = codec.dumps(value)
+
+    assert "\n" not in text
+    assert "Québec" in text
+    assert codec.loads(text) == value
+    assert codec.loads(text.encode("utf-8")) == value
+
+
+def test_sort_keys_gives_stable_text():
+    assert codec.dumps({"b": 1, "a": 2}, sort_keys=True) == codec.dumps({"a": 2, "b": 1}, sort_keys=True)
+
+
+def test_models_and_datetimes_are_encoded():
+    moment = datetime(2026, 10, 19, 9, 30)
+    decoded = codec.loads(codec.dumps({"item": Priority("Devis", confidence=0.8), "at": moment}))
+
+    assert decoded["item"] == {"title": "Devis", "description": "", "confidence": 0.8, "source": ""}
+    assert decoded["at"] == str(moment)
+
+
+def test_invalid_json_raises_value_error():
+    with pytest.raises(ValueError):
+        codec.loads("{not json")
+
+
+def test_write_json_is_atomic_and_readable(tmp_path):
+    target = tmp_path / "nested" / "state.json"
+    codec.write_json(target, {"a": [1, 2]})
+
+    assert codec.read_json(target) == {"a": [1, 2]}
+    assert not (tmp_path / "nested" / "state.json.tmp").exists()
+
+
+def test_priorities_round_trip():
+    priorities = {
+        "engagements": [Priority("Envoyer le devis", "à Paul", "2026-10-20", 0.9, "Réunion", "log-1", 0.75)],
+        "demandes": [Priority("Relire")],
+        "deadlines": []
+    }
+
+    restored = parse_priorities(codec.loads(codec.dumps(priorities_to_dict(priorities))))
+
+    assert [item.fingerprint() for item in restored["engagements"]] == \
+        [item.fingerprint() for item in priorities["engagements"]]
+    assert restored["demandes"][0].fingerprint() == priorities["demandes"][0].fingerprint()
+    assert restored["deadlines"] == []
+
+
+def test_malformed_priorities_are_dropped():
+    restored = parse_priorities({
+        "engagements": [{"title": "  "}, "texte", {"title": "Valide", "confidence": "élevée"}],
+        "demandes": "pas une liste",
+        "inconnu": [{"title": "Ignoré"}]
+    })
+
+    assert [item.title for item in restored["engagements"]] == ["Valide"]
+    assert restored["engagements"][0].confidence == 1.0
+    assert restored["demandes"] == []
+    assert "inconnu" not in restored
+
+
+def test_lifelog_round_trip_drops_empty_fields():
+    lifelog = Lifelog("log-1", "Réunion", "2026-10-19T10:00:00", "Bonjour")
+    data = codec.loads(codec.dumps(lifelog))
+
+    assert data == {"id": "log-1", "title": "Réunion", "date": "2026-10-19T10:00:00", "transcript": "Bonjour"}
+    assert Lifelog.from_dict(data).transcript == "Bonjour"
+
+
+def test_standard_library_fallback_matches(monkeypatch):
+    value = {"item": Priority("Devis"), "texte": "é", "n": [1, 2]}
+    fast = codec.loads(codec.dumps(value, sort_keys=True))
+
+    monkeypatch.setattr(codec, "orjson", None)
+    text = codec.dumps(value, sort_keys=True)
+
+    assert codec.loads(text) == fast
+    assert "é" in text
@@ -0,0 +1,231 @@
+"""Tests for append-aware delta analysis"""
+
+import asyncio
+
+from skills.priority_detector.scripts.analyze import analyze_priorities
+from skills.priority_detector.scripts.delta import LifelogDeltaStore
+from src.utils.models import PRIORITY_TYPES, Lifelog, Priority
+
+
+def lifelog(log_id, lines, title=None):
+    return Lifelog(log_id, title or f"Lifelog {log_id}", "2026-10-19T10:00:00", "\n".join(lines))
+
+
+def items(**by_type):
+    return {item_type: list(by_type.get(item_type, [])) for item_type in PRIORITY_TYPES}
+
+
+def titles(priorities):
+    return sorted(item.title for values in priorities.values() for item in values)
+
+
+def test_new_lifelog_is_sent_in_full(tmp_path):
+    store = LifelogDeltaStore(str(tmp_path / "delta.json"))
+    log = lifelog("a", ["un", "deux"])
+
+    assert store.plan([log]) == [log]
+    assert store.stats["new"] == 1
+
+
+def test_appended_lifelog_sends_only_new_segments(tmp_path):
+    path = str(tmp_path / "delta.json")
+    store = LifelogDeltaStore(path, overlap_segments=1)
+    first = lifelog("a", ["un", "deux"])
+    store.record(store.plan([first]), [first], items(engagements=[Priority("Envoyer le devis", lifelog_id="a")]))
+    store.save()
+
+    store = LifelogDeltaStore(path, overlap_segments=1)
+    extended = lifelog("a", ["un", "deux", "trois"])
+    pending = store.plan([extended])
+
+    assert len(pending) == 1
+    assert pending[0].transcript == "trois"
+    assert pending[0].overlap == "deux"
+    assert store.stats["appended"] == 1
+
+    store.record(pending, [extended], items(demandes=[Priority("Relire le rapport", lifelog_id="a")]))
+    # Items of the earlier segments are kept alongside the new ones
+    assert titles(store.priorities([extended])) == ["Envoyer le devis", "Relire le rapport"]
+
+
+def test_unchanged_lifelog_reuses_stored_items(tmp_path):
+    path = str(tmp_path / "delta.json")
+    store = LifelogDeltaStore(path)
+    log = lifelog("a", ["un"])
+    store.record(store.plan([log]), [log], items(deadlines=[Priority("Rapport", lifelog_id="a")]))
+    store.save()
+
+    store = LifelogDeltaStore(path)
+    assert store.plan([log]) == []
+    assert store.stats["unchanged"] == 1
+    assert titles(store.priorities([log])) == ["Rapport"]
+
+
+def test_edited_lifelog_replaces_its_items(tmp_path):
+    store = LifelogDeltaStore(str(tmp_path / "delta.json"))
+    store.record([lifelog("a", ["un"])], [lifelog("a", ["un"])], items(engagements=[Priority("Ancien", lifelog_id="a")]))
+
+    edited = lifelog("a", ["autre chose"])
+    assert store.plan([edited]) == [edited]
+    store.record([edited], [edited], items(engagements=[Priority("Nouveau", lifelog_id="a")]))
+
+    assert titles(store.priorities([edited])) == ["Nouveau"]
+
+
+def test_item_is_attributed_through_its_source_title(tmp_path):
+    store = LifelogDeltaStore(str(tmp_path / "delta.json"))
+    a, b = lifelog("a", ["un"], "Réunion client"), lifelog("b", ["deux"], "Point équipe")
+    store.record([a, b], [a, b], items(engagements=[Priority("Devis", source="Réunion client")]))
+
+    assert titles(store.priorities([a])) == ["Devis"]
+    assert titles(store.priorities([b])) == []
+
+
+def test_unattributed_items_stay_with_their_lifelogs(tmp_path):
+    path = str(tmp_path / "delta.json")
+    store = LifelogDeltaStore(path)
+    day1 = [lifelog("a", ["un"]), lifelog("b", ["deux"])]
+    store.record(day1, day1, items(demandes=[Priority("Sans source")]))
+    store.save()
+
+    store = LifelogDeltaStore(path)
+    day2 = [lifelog("c", ["trois"])]
+    store.record(store.plan(day2), day2, items())
+
+    assert titles(store.priorities(day2)) == []
+    assert titles(store.priorities(day1[:1])) == []
+    assert titles(store.priorities(day1 + day2)) == ["Sans source"]
+
+
+def test_unattributed_items_of_lifelogs_without_id_are_not_stored(tmp_path):
+    store = LifelogDeltaStore(str(tmp_path / "delta.json"))
+    anonymous = [Lifelog(None, "Sans id", "", "un"), lifelog("a", ["deux"])]
+
+    unstored = store.record(anonymous, anonymous, items(demandes=[Priority("Sans source")]))
+
+    assert titles(unstored) == ["Sans source"]
+    assert titles(store.priorities([lifelog("a", ["deux"])])) == []
+
+
+def test_unattributed_items_are_forgotten_with_their_lifelogs(tmp_path):
+    path = str(tmp_path / "delta.json")
+    store = LifelogDeltaStore(path, max_age_days=8)
+    logs = [lifelog("a", ["un"]), lifelog("b", ["deux"])]
+    store.record(logs, logs, items(demandes=[Priority("Sans source")]))
+    store._lifelogs["a"]["seen_at"] = "2000-01-01T00:00:00"
+    store.save()
+
+    store = LifelogDeltaStore(path)
+    assert not any(entry.get("scope") for entry in store._lifelogs.values())
+
+
+def test_created_items_are_skipped(tmp_path):
+    path = str(tmp_path / "delta.json")
+    store = LifelogDeltaStore(path)
+    logs = [lifelog("a", ["un"]), lifelog("b", ["deux"])]
+    attributed = Priority("Envoyer le devis", lifelog_id="a")
+    unattributed = Priority("Sans source")
+    store.record(logs, logs, items(engagements=[attributed], demandes=[unattributed]))
+    store.mark_created(items(engagements=[attributed], demandes=[unattributed]))
+    store.save()
+
+    store = LifelogDeltaStore(path)
+    pending, skipped = store.split_created(items(
+        engagements=[Priority("envoyer le DEVIS")],
+        demandes=[Priority("Sans source"), Priority("Autre")]
+    ))
+
+    assert skipped == 2
+    assert titles(pending) == ["Autre"]
+    # The marker went with the scoped entry, not a shared bucket
+    assert "_unattributed" not in store._lifelogs
+
+
+def test_template_change_discards_state(tmp_path):
+    path = str(tmp_path / "delta.json")
+    store = LifelogDeltaStore(path, template_id="v1")
+    log = lifelog("a", ["un"])
+    store.record([log], [log], items(engagements=[Priority("A", lifelog_id="a")]))
+    store.save()
+
+    assert LifelogDeltaStore(path, template_id="v2").plan([log]) == [log]
+
+
+class StreamingClaude:
+    """Claude connector stand-in streaming canned items per lifelog id"""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0, "errors": 0}
+        self.sent = []
+
+    async def stream_priorities(self, lifelogs, period="today", context=None):
+        self.usage["calls"] += 1
+        self.sent.append([log.id for log in lifelogs])
+        for log in lifelogs:
+            for item_type, title in self.answers.get(log.id, []):
+                yield item_type, Priority(title, lifelog_id=log.id)
+
+
+def test_second_streaming_run_emits_stored_items(tmp_path):
+    path = str(tmp_path / "delta.json")
+    claude = StreamingClaude({"a": [("engagements", "Envoyer le devis")]})
+    logs = [lifelog("a", ["un"])]
+
+    def run():
+        streamed = []
+        asyncio.run(analyze_priorities(
+            None, claude, None,
+            dry_run=True,
+            lifelogs=logs,
+            delta_store=LifelogDeltaStore(path),
+            on_priority=lambda item_type, item: streamed.append((item_type, item.title))
+        ))
+        return streamed
+
+    assert run() == [("engagements", "Envoyer le devis")]
+    # Nothing new to send, but the stored item is still streamed, once
+    assert run() == [("engagements", "Envoyer le devis")]
+    assert claude.usage["calls"] == 1
+
+
+class FlakyClaude:
+    """Claude connector stand-in that fails like ClaudeConnector (logged, no items) until fixed"""
+
+    def __init__(self, failing=True):
+        self.failing = failing
+        self.usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0, "errors": 0}
+
+    async def analyze_priorities(self, lifelogs, period="today", context=None):
+        if self.failing:
+            self.usage["errors"] += 1
+            return items()
+        self.usage["calls"] += 1
+        return items(engagements=[Priority(f"Suivi {log.id}", lifelog_id=log.id) for log in lifelogs])
+
+
+def test_failed_analysis_is_not_recorded(tmp_path):
+    path = str(tmp_path / "delta.json")
+    first = lifelog("a", ["un"])
+    store = LifelogDeltaStore(path)
+    store.record(store.plan([first]), [first], items(engagements=[Priority("Envoyer le devis", lifelog_id="a")]))
+    store.save()
+    edited = lifelog("a", ["un bis"])
+    claude = FlakyClaude()
+
+    def run():
+        return asyncio.run(analyze_priorities(
+            None, claude, None, dry_run=True, lifelogs=[edited], delta_store=LifelogDeltaStore(path)
+        ))
+
+    failed = run()
+    assert failed["success"] is False
+    assert failed["stats"]["tokens"]["errors"] == 1
+    # The items stored before the edit are kept until an analysis succeeds
+    assert titles(LifelogDeltaStore(path).priorities([first])) == ["Envoyer le devis"]
+
+    claude.failing = False
+    fixed = run()
+    assert fixed["success"] is True
+    assert fixed["stats"]["delta"]["new"] == 1
+    assert titles(fixed["priorities"]) == ["Suivi a"]
@@ -0,0 +1,82 @@
+"""Tests for the per-contact entity index"""
+
+from src.utils.entity_index import EntityIndex, extract_entities
+from src.utils.models import PRIORITY_TYPES, Lifelog, Priority
+
+
+def items(**by_type):
+    return {item_type: list(by_type.get(item_type, [])) for item_type in PRIORITY_TYPES}
+
+
+def open_titles(contact):
+    return sorted(item["title"] for values in contact["priorities"].values() for item in values)
+
+
+def make_index(tmp_path):
+    index = EntityIndex(str(tmp_path / "entities.db"))
+    index.add_lifelogs([
+        Lifelog("a", "Conversation avec Marc Veilleux - 2026-10-19", "2026-10-19T10:00:00", "Devis pour ESI")
+    ])
+    index.add_priorities(items(
+        engagements=[Priority("Envoyer le devis à Marc Veilleux", source="Conversation avec Marc Veilleux")],
+        deadlines=[Priority("Rapport ESI", date="2026-10-24", source="Appel avec ESI")]
+    ))
+    return index
+
+
+def test_extract_entities_skips_noise():
+    names = extract_entities("Conversation avec Marc Veilleux - suivi CRM")
+
+    assert "Marc Veilleux" in names
+    assert "CRM" not in names
+
+
+def test_lookup_by_partial_name_ignores_accents_and_case(tmp_path):
+    index = make_index(tmp_path)
+    try:
+        contacts = index.lookup("veilleux")
+    finally:
+        index.close()
+
+    assert [contact["name"] for contact in contacts] == ["Marc Veilleux"]
+    assert open_titles(contacts[0]) == ["Envoyer le devis à Marc Veilleux"]
+    assert [log["id"] for log in contacts[0]["lifelogs"]] == ["a"]
+
+
+def test_indexing_twice_adds_nothing(tmp_path):
+    index = make_index(tmp_path)
+    try:
+        assert index.add_lifelogs([Lifelog("a", "Conversation avec Marc Veilleux", "2026-10-19T10:00:00")]) == 0
+        assert index.add_priorities(items(
+            engagements=[Priority("Envoyer le devis à Marc Veilleux", source="Conversation avec Marc Veilleux")]
+        )) == 0
+    finally:
+        index.close()
+
+
+def test_like_wildcards_match_literally(tmp_path):
+    index = make_index(tmp_path)
+    try:
+        assert index.lookup("%") == []
+        assert index.lookup("M_rc") == []
+        assert index.lookup("Marc") != []
+    finally:
+        index.close()
+
+
+def test_closed_items_are_no_longer_listed(tmp_path):
+    index = make_index(tmp_path)
+    try:
+        assert index.close_items("Marc", "DEVIS") == ["Envoyer le devis à Marc Veilleux"]
+        assert index.close_items("Marc", "devis") == []
+        # Extracted again by a later run, the item stays done
+        index.add_priorities(items(
+            engagements=[Priority("Envoyer le devis à Marc Veilleux", source="Conversation avec Marc Veilleux")]
+        ))
+        contacts = index.lookup("Marc Veilleux")
+        esi = index.lookup("ESI")
+    finally:
+        index.close()
+
+    assert open_titles(contacts[0]) == []
+    assert open_titles(esi[0]) == ["Rapport ESI"]
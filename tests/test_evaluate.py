@@ -0,0 +1,139 @@
+"""Tests for prompt variant evaluation and recommendation"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from skills.priority_detector.scripts.evaluate import (
+    StubClient, count_matches, evaluate_prompts, evaluate_variant
+)
+from src.connectors import ClaudeConnector
+from src.utils.prompts import PromptTemplate
+from src.utils.resilience import Resilience, RetryPolicy
+
+
+CORPUS = [
+    {
+        "id": "s1",
+        "title": "Réunion client",
+        "date": "2026-10-19T10:00:00",
+        "transcript": "Je t'envoie le devis demain.",
+        "expected": {"engagements": ["Envoyer le devis"], "demandes": [], "deadlines": []}
+    },
+    {
+        "id": "s2",
+        "title": "Point équipe",
+        "date": "2026-10-19T14:00:00",
+        "transcript": "Peux-tu relire le rapport ?",
+        "expected": {"engagements": [], "demandes": ["Relire le rapport"], "deadlines": []}
+    }
+]
+
+ANSWERS = {
+    "s1": {"engagements": [{"title": "Envoyer le devis"}]},
+    "s2": {"demandes": [{"title": "Relire le rapport"}]}
+}
+
+
+def template(name: str) -> PromptTemplate:
+    return PromptTemplate(name=name, version="1.0.0", template="{period}\n{context}\n{transcripts}")
+
+
+class FailingClient:
+    """Anthropic stand-in whose every call fails"""
+
+    def __init__(self):
+        self.messages = SimpleNamespace(create=self._create)
+
+    async def _create(self, **kwargs):
+        raise RuntimeError("overloaded")
+
+
+def factory(responses):
+    """Connector factory answering `responses[variant]` (a dict of texts, or None to fail)"""
+    def make_connector(prompt: PromptTemplate, sample):
+        answers = responses[prompt.name]
+        client = FailingClient() if answers is None else StubClient(answers.get(sample["id"], "{}"))
+        return ClaudeConnector(
+            api_key="stub",
+            model="stub",
+            client=client,
+            resilience=Resilience(policy=RetryPolicy(max_attempts=1)),
+            prompt_template=prompt
+        )
+    return make_connector
+
+
+def texts(answers):
+    return {sample_id: json.dumps(answer) for sample_id, answer in answers.items()}
+
+
+def test_count_matches_pairs_each_expected_title_once():
+    assert count_matches(["Envoyer le devis", "Envoyer devis"], ["Envoyer le devis"]) == 1
+    assert count_matches(["Appeler Paul"], ["Envoyer le devis"]) == 0
+
+
+def test_perfect_variant_scores_full_marks():
+    metrics = asyncio.run(evaluate_variant(template("good"), CORPUS, factory({"good": texts(ANSWERS)})))
+
+    assert metrics["precision"] == 1.0
+    assert metrics["recall"] == 1.0
+    assert metrics["errors"] == 0
+    assert metrics["input_tokens"] > 0
+
+
+def test_failed_calls_are_counted_as_errors():
+    metrics = asyncio.run(evaluate_variant(template("broken"), CORPUS, factory({"broken": None})))
+
+    assert metrics["errors"] == len(CORPUS)
+    assert metrics["predicted"] == 0
+    assert metrics["input_tokens"] == 0
+
+
+def test_unreadable_response_is_an_error():
+    metrics = asyncio.run(evaluate_variant(
+        template("chatty"), CORPUS, factory({"chatty": {"s1": "Je ne sais pas.", "s2": "{}"}})
+    ))
+    assert metrics["errors"] == 1
+
+
+def test_failing_variant_is_never_recommended():
+    report = asyncio.run(evaluate_prompts(
+        CORPUS,
+        [template("broken"), template("good")],
+        factory({"broken": None, "good": texts(ANSWERS)})
+    ))
+
+    broken, good = report["variants"]
+    assert broken["passed"] is False
+    assert good["passed"] is True
+    assert report["recommended"] == "good"
+
+
+def test_silent_variant_fails_the_target():
+    report = asyncio.run(evaluate_prompts(
+        CORPUS, [template("silent")], factory({"silent": {}})
+    ))
+
+    silent = report["variants"][0]
+    assert silent["errors"] == 0
+    assert silent["precision"] == 1.0
+    assert silent["passed"] is False
+    assert report["recommended"] is None
+
+
+def test_cheapest_variant_needs_minimum_recall():
+    # Precise but misses half the items
+    partial = texts({"s1": ANSWERS["s1"]})
+    report = asyncio.run(evaluate_prompts(
+        CORPUS,
+        [template("partial"), template("good")],
+        factory({"partial": partial, "good": texts(ANSWERS)}),
+        min_precision=0.9,
+        min_recall=0.8
+    ))
+
+    partial_metrics, _ = report["variants"]
+    assert partial_metrics["precision"] == 1.0
+    assert partial_metrics["recall"] == 0.5
+    assert report["recommended"] == "good"
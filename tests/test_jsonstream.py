@@ -0,0 +1,66 @@
+"""Tests for incremental JSON array item extraction"""
+
+import json
+
+from src.utils.jsonstream import ArrayItemExtractor
+
+
+DOCUMENT = {
+    "engagements": [
+        {"title": "Envoyer le devis", "description": "avec {accolades} et [crochets]", "confidence": 0.9},
+        {"title": "Rappeler \"Paul\"", "description": "échappement \\ et unicode é"}
+    ],
+    "demandes": [],
+    "deadlines": [{"title": "Rapport", "date": "2026-10-20", "meta": {"nested": [1, {"x": 2}]}}]
+}
+
+EXPECTED = [
+    (key, item) for key in ("engagements", "demandes", "deadlines") for item in DOCUMENT[key]
+]
+
+
+def extract(chunks):
+    extractor = ArrayItemExtractor()
+    items = []
+    for chunk in chunks:
+        items.extend(extractor.feed(chunk))
+    return items
+
+
+def test_whole_document():
+    assert extract([json.dumps(DOCUMENT, ensure_ascii=False)]) == EXPECTED
+
+
+def test_every_split_point():
+    text = json.dumps(DOCUMENT, ensure_ascii=False)
+    for cut in range(1, len(text)):
+        assert extract([text[:cut], text[cut:]]) == EXPECTED, f"split at {cut}"
+
+
+def test_one_character_at_a_time():
+    text = json.dumps(DOCUMENT, ensure_ascii=False, indent=2)
+    assert extract(list(text)) == EXPECTED
+
+
+def test_items_are_emitted_as_soon_as_complete():
+    extractor = ArrayItemExtractor()
+    assert list(extractor.feed('{"engagements": [{"title": "A"}, {"title": ')) == \
+        [("engagements", {"title": "A"})]
+    assert list(extractor.feed('"B"}')) == [("engagements", {"title": "B"})]
+    assert list(extractor.feed("]}")) == []
+
+
+def test_preamble_and_code_fence_are_ignored():
+    text = 'Voici les priorités :\n```json\n{"demandes": [{"title": "Relire"}]}\n```'
+    assert extract([text[:15], text[15:]]) == [("demandes", {"title": "Relire"})]
+
+
+def test_malformed_item_is_skipped():
+    text = '{"engagements": [{"title": "A",}, {"title": "B"}]}'
+    assert extract([text]) == [("engagements", {"title": "B"})]
+
+
+def test_buffer_is_compacted():
+    extractor = ArrayItemExtractor()
+    list(extractor.feed('{"engagements": [' + ", ".join('{"title": "x"}' for _ in range(100))))
+    assert len(extractor._buffer) < 20
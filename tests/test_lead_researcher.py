@@ -0,0 +1,177 @@
+"""End-to-end lead research over the fixture site served locally"""
+
+import asyncio
+import functools
+import json
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from skills.lead_researcher.scripts.cache import PageCache
+from skills.lead_researcher.scripts.fetch import HttpFetcher
+from skills.lead_researcher.scripts.research import research_lead
+from src.connectors import ClaudeConnector
+from src.utils.prompts import PromptRegistry
+
+
+SKILL_DIR = Path(__file__).resolve().parent.parent / "skills" / "lead-researcher"
+FIXTURES = SKILL_DIR / "resources" / "fixtures" / "lms-systems"
+
+SOURCES = ["{site}/", "{site}/a-propos", "{site}/contact", "{site}/about"]
+
+LEAD = {
+    "company": "LMS Systems",
+    "sector": "Logiciels manufacturiers",
+    "size": "45 employés",
+    "contacts": [{"name": "Julie Tremblay", "role": "Présidente"}],
+    "fit_score": 8,
+    "approach_angles": ["CTO fractionnel"],
+    "next_actions": ["Appeler Julie Tremblay"]
+}
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    handler = functools.partial(QuietHandler, directory=str(FIXTURES))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class RecordingClient:
+    """Anthropic stand-in answering LEAD and keeping the prompts it received"""
+
+    def __init__(self):
+        self.messages = SimpleNamespace(create=self._create)
+        self.prompts = []
+
+    async def _create(self, model, max_tokens, messages):
+        self.prompts.append(messages[0]["content"])
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps(LEAD, ensure_ascii=False))],
+            usage=SimpleNamespace(input_tokens=900, output_tokens=120)
+        )
+
+
+class FakeCrm:
+    """Notion CRM stand-in keeping pages in memory"""
+
+    def __init__(self):
+        self.pages = {}
+        self.created = 0
+        self.updated = 0
+
+    async def find_crm_entry(self, company):
+        return next((page for page in self.pages.values() if page["company"] == company), None)
+
+    async def create_crm_entry(self, lead):
+        self.created += 1
+        page = {"id": f"page-{self.created}", "company": lead["company"], "lead": lead}
+        self.pages[page["id"]] = page
+        return page
+
+    async def update_crm_entry(self, page_id, lead):
+        self.updated += 1
+        self.pages[page_id]["lead"] = lead
+        return self.pages[page_id]
+
+
+def research(site, cache, crm, dry_run=False):
+    client = RecordingClient()
+    claude = ClaudeConnector(api_key="stub", model="stub", client=client)
+    template = PromptRegistry(SKILL_DIR / "resources" / "prompt_templates.json").get("lead_research")
+    results = asyncio.run(research_lead(
+        "LMS Systems",
+        HttpFetcher(),
+        claude,
+        crm,
+        template,
+        sources=SOURCES,
+        site=site,
+        cache=cache,
+        dry_run=dry_run
+    ))
+    return results, client
+
+
+def test_research_condenses_fixture_pages(site, tmp_path):
+    results, client = research(site, PageCache(str(tmp_path)), FakeCrm(), dry_run=True)
+
+    assert results["success"]
+    assert results["stats"]["pages_requested"] == 4
+    # /about is not part of the fixture site
+    assert results["stats"]["pages_fetched"] == 3
+    assert sorted(results["lead"]["sources"]) == sorted(
+        f"{site}{path}" for path in ("/", "/a-propos", "/contact")
+    )
+    assert results["lead"]["fit_score"] == 8
+    assert results["crm_created"] is False
+
+    prompt = client.prompts[0]
+    assert "45 employés" in prompt
+    assert "Julie Tremblay" in prompt
+    assert "<title>" not in prompt
+
+
+def test_second_lookup_is_served_from_cache(site, tmp_path):
+    cache = PageCache(str(tmp_path))
+    crm = FakeCrm()
+    research(site, cache, crm)
+
+    results, client = research(site, cache, crm)
+
+    assert results["stats"]["analysis_cached"] is True
+    assert results["stats"]["cache_hits"] >= 3
+    assert client.prompts == []
+    assert crm.created == 1
+
+
+def test_refresh_updates_existing_crm_entry(site, tmp_path):
+    crm = FakeCrm()
+    research(site, PageCache(str(tmp_path)), crm)
+
+    # --refresh: every cached entry reads as expired
+    results, client = research(site, PageCache(str(tmp_path), ttl_seconds=0), crm)
+
+    assert len(client.prompts) == 1
+    assert crm.created == 1
+    assert crm.updated == 1
+    assert results["crm_updated"] is True
+    assert len(crm.pages) == 1
+
+
+def test_notion_lookup_matches_title_in_crm_database():
+    from src.connectors import NotionConnector
+
+    def page(page_id, title, database_id="crm-db", archived=False):
+        return {
+            "id": page_id,
+            "archived": archived,
+            "parent": {"type": "database_id", "database_id": database_id},
+            "properties": {"Nom": {"title": [{"plain_text": title}]}}
+        }
+
+    async def search(**request):
+        return {"results": [
+            page("other-db", "LMS Systems", database_id="todo-db"),
+            page("archived", "LMS Systems", archived=True),
+            page("prefix", "LMS Systems Inc"),
+            page("match", "LMS Systems")
+        ]}
+
+    notion = NotionConnector(api_token="stub", database_id="crm-db")
+    notion.client = SimpleNamespace(search=search)
+
+    assert asyncio.run(notion.find_crm_entry("LMS Systems"))["id"] == "match"
+    assert asyncio.run(notion.find_crm_entry("Autre")) is None
@@ -0,0 +1,267 @@
+"""Tests for daily partitions and their rollup"""
+
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+from skills.priority_detector.scripts.analyze import analyze_priorities
+from skills.priority_detector.scripts.partitions import DailyPartitionStore, group_by_day, period_days
+from src.utils.models import PRIORITY_TYPES, Lifelog, Priority
+
+TODAY = date.today()
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+def at(day, hour):
+    return datetime.combine(day, time(hour))
+
+
+def lifelog(log_id, day, transcript="un"):
+    return Lifelog(log_id, f"Lifelog {log_id}", at(day, 10).isoformat(), transcript)
+
+
+def items(**by_type):
+    return {item_type: list(by_type.get(item_type, [])) for item_type in PRIORITY_TYPES}
+
+
+def titles(priorities):
+    return sorted(item.title for values in priorities.values() for item in values)
+
+
+def test_partition_saved_during_its_day_is_not_final(tmp_path):
+    store = DailyPartitionStore(str(tmp_path))
+    day = date(2026, 10, 18)
+    store.save(day, items(), [lifelog("a", day)], now=at(day, 18))
+
+    assert store.load(day)["final"] is False
+    assert store.stale_days([day]) == [day]
+
+
+def test_partition_saved_after_settling_is_final(tmp_path):
+    store = DailyPartitionStore(str(tmp_path), settle_hours=1)
+    day = date(2026, 10, 18)
+    store.save(day, items(), [lifelog("a", day)], now=at(day + timedelta(days=1), 2))
+
+    assert store.load(day)["final"] is True
+    assert store.stale_days([day]) == []
+
+
+def test_unchanged_day_is_finalized_once_settled(tmp_path):
+    store = DailyPartitionStore(str(tmp_path), settle_hours=1)
+    day = date(2026, 10, 18)
+    logs = [lifelog("a", day)]
+    store.save(day, items(engagements=[Priority("Envoyer le devis")]), logs, now=at(day, 18))
+
+    # Before midnight plus the settle delay, the day may still change
+    assert store.unsettled_days([day], now=at(day + timedelta(days=1), 0)) == []
+    store.finalize(day, now=at(day + timedelta(days=1), 0))
+    assert store.load(day)["final"] is False
+
+    assert store.unsettled_days([day], now=at(day + timedelta(days=1), 8)) == [day]
+    assert store.matches(day, logs)
+    store.finalize(day, now=at(day + timedelta(days=1), 8))
+    partition = store.load(day)
+    assert partition["final"] is True
+    assert titles(partition["priorities"]) == ["Envoyer le devis"]
+
+
+def test_matches_detects_added_and_extended_lifelogs(tmp_path):
+    store = DailyPartitionStore(str(tmp_path))
+    day = date(2026, 10, 18)
+    store.save(day, items(), [lifelog("a", day)], now=at(day, 18))
+
+    assert not store.matches(day, [lifelog("a", day, "un\ndeux")])
+    assert not store.matches(day, [lifelog("a", day), lifelog("b", day)])
+    assert not store.matches(date(2026, 10, 17), [])
+
+
+def test_other_template_makes_partition_stale(tmp_path):
+    day = date(2026, 10, 18)
+    DailyPartitionStore(str(tmp_path), template_id="v1").save(
+        day, items(), [], now=at(day + timedelta(days=2), 8)
+    )
+
+    assert DailyPartitionStore(str(tmp_path), template_id="v1").stale_days([day]) == []
+    assert DailyPartitionStore(str(tmp_path), template_id="v2").stale_days([day]) == [day]
+
+
+def test_old_partitions_are_pruned(tmp_path):
+    store = DailyPartitionStore(str(tmp_path), retention_days=7)
+    old, recent = date(2026, 10, 1), date(2026, 10, 18)
+    store.save(old, items(), [], now=at(old, 18))
+    store.save(recent, items(), [], now=at(recent, 18))
+
+    assert store.load(old) is None
+    assert store.load(recent) is not None
+
+
+def test_rollup_keeps_most_recent_copy_of_an_item(tmp_path):
+    store = DailyPartitionStore(str(tmp_path))
+    first, second = date(2026, 10, 17), date(2026, 10, 18)
+    spanning = lifelog("a", first)
+    store.save(first, items(
+        engagements=[Priority("Envoyer le devis", "lundi")],
+        deadlines=[Priority("Envoyer le devis")]
+    ), [spanning], now=at(first, 18))
+    store.save(second, items(
+        engagements=[Priority("envoyer le DÉVIS", "mardi")]
+    ), [spanning, lifelog("b", second)], now=at(second, 18))
+
+    merged, sources, covered = store.rollup([first, second])
+
+    assert [item.description for item in merged["engagements"]] == ["mardi"]
+    # Same title under another type is another item
+    assert titles(items(deadlines=merged["deadlines"])) == ["Envoyer le devis"]
+    assert sorted(source.id for source in sources) == ["a", "b"]
+    assert covered == 2
+
+
+def test_group_by_day_clamps_to_the_window():
+    first, last = date(2026, 10, 17), date(2026, 10, 18)
+    early = lifelog("early", date(2026, 10, 16))
+    undated = Lifelog("undated", "Sans date")
+    grouped = group_by_day([early, lifelog("a", first), undated], first, last)
+
+    assert [log.id for log in grouped[first]] == ["early", "a"]
+    assert [log.id for log in grouped[last]] == ["undated"]
+
+
+class FakeLimitless:
+    """Limitless connector stand-in serving lifelogs from midnight of a window"""
+
+    def __init__(self, lifelogs):
+        self.lifelogs = lifelogs
+        self.windows = []
+
+    async def get_window(self, days=1, since=None):
+        self.windows.append(days)
+        first = period_days(days)[0].isoformat()
+        return [log for log in self.lifelogs if log.date >= first]
+
+
+class FakeClaude:
+    """Claude connector stand-in answering one engagement per lifelog"""
+
+    def __init__(self, failing=False):
+        self.failing = failing
+        self.usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0, "errors": 0}
+        self.sent = []
+
+    async def analyze_priorities(self, lifelogs, period="today", context=None):
+        if self.failing:
+            # Like ClaudeConnector: the error is counted and no items returned
+            self.usage["errors"] += 1
+            return items()
+        self.usage["calls"] += 1
+        self.sent.append(sorted(log.id for log in lifelogs))
+        return items(engagements=[Priority(f"Suivi {log.id}", lifelog_id=log.id) for log in lifelogs])
+
+
+def run(limitless, claude, store, period):
+    return asyncio.run(analyze_priorities(limitless, claude, None, period=period, dry_run=True, partitions=store))
+
+
+def test_daily_runs_settle_previous_day_for_the_week(tmp_path):
+    store = DailyPartitionStore(str(tmp_path), settle_hours=0)
+    claude = FakeClaude()
+    # Yesterday's daily run, before the day was over
+    store.save(YESTERDAY, items(engagements=[Priority("Suivi a", lifelog_id="a")]),
+               [lifelog("a", YESTERDAY)], now=at(YESTERDAY, 18))
+    limitless = FakeLimitless([lifelog("a", YESTERDAY), lifelog("b", TODAY)])
+
+    result = run(limitless, claude, store, "today")
+
+    # Yesterday was refetched with today and kept as is, without a new call
+    assert limitless.windows == [2]
+    assert claude.sent == [["b"]]
+    assert store.load(YESTERDAY)["final"] is True
+    assert titles(result["priorities"]) == ["Suivi b"]
+    assert result["stats"]["partitions"]["settled"] == 1
+
+    week = run(limitless, claude, store, "week")
+
+    # Both stored days are reused (today is unchanged since the daily run) and
+    # the five days without runs or lifelogs are stored empty, with no call
+    assert claude.sent == [["b"]]
+    assert week["stats"]["partitions"] == {"reused": 2, "computed": 5, "failed": 0}
+    assert run(limitless, claude, store, "week")["stats"]["partitions"] == {
+        "reused": 7, "computed": 0, "failed": 0
+    }
+    assert titles(week["priorities"]) == ["Suivi a", "Suivi b"]
+
+
+def test_changed_past_day_is_recomputed_when_settled(tmp_path):
+    store = DailyPartitionStore(str(tmp_path), settle_hours=0)
+    claude = FakeClaude()
+    store.save(YESTERDAY, items(engagements=[Priority("Suivi a", lifelog_id="a")]),
+               [lifelog("a", YESTERDAY)], now=at(YESTERDAY, 18))
+    late = [lifelog("a", YESTERDAY), lifelog("late", YESTERDAY), lifelog("b", TODAY)]
+
+    run(FakeLimitless(late), claude, store, "today")
+
+    assert sorted(claude.sent) == [["a", "late"], ["b"]]
+    partition = store.load(YESTERDAY)
+    assert partition["final"] is True
+    assert titles(partition["priorities"]) == ["Suivi a", "Suivi late"]
+
+
+def test_failed_analysis_leaves_days_to_recompute(tmp_path):
+    store = DailyPartitionStore(str(tmp_path), settle_hours=0)
+    claude = FakeClaude(failing=True)
+    store.save(YESTERDAY, items(engagements=[Priority("Suivi a", lifelog_id="a")]),
+               [lifelog("a", YESTERDAY)], now=at(YESTERDAY, 18))
+    limitless = FakeLimitless([lifelog("a", YESTERDAY), lifelog("late", YESTERDAY), lifelog("b", TODAY)])
+
+    result = run(limitless, claude, store, "today")
+
+    assert result["success"] is False
+    assert result["stats"]["partitions"]["failed"] == 2
+    # Yesterday keeps its previous items and is still to settle; today is not stored
+    assert store.unsettled_days([YESTERDAY]) == [YESTERDAY]
+    assert titles(store.load(YESTERDAY)["priorities"]) == ["Suivi a"]
+    assert store.load(TODAY) is None
+
+    week = run(limitless, claude, store, "week")
+    assert week["success"] is False
+    assert store.stale_days([YESTERDAY, TODAY]) == [YESTERDAY, TODAY]
+
+    claude.failing = False
+    week = run(limitless, claude, store, "week")
+    assert week["success"] is True
+    assert week["stats"]["partitions"]["failed"] == 0
+    assert titles(week["priorities"]) == ["Suivi a", "Suivi b", "Suivi late"]
+    assert store.stale_days([YESTERDAY]) == []
+
+
+def test_window_days_plans_the_shared_fetch(tmp_path):
+    store = DailyPartitionStore(str(tmp_path), settle_hours=0)
+    now = at(TODAY, 9)
+    assert store.window_days(1, now) == 1
+    assert store.window_days(7, now) == 7
+
+    store.save(YESTERDAY, items(), [lifelog("a", YESTERDAY)], now=at(YESTERDAY, 18))
+    # Yesterday still has to settle, and today is never final
+    assert store.window_days(1, now) == 2
+    store.finalize(YESTERDAY, now)
+    for offset in range(2, 7):
+        day = TODAY - timedelta(days=offset)
+        store.save(day, items(), [], now=now)
+    assert store.window_days(1, now) == 1
+    assert store.window_days(7, now) == 1
+
+
+def test_given_lifelogs_only_refresh_the_days_they_cover(tmp_path):
+    store = DailyPartitionStore(str(tmp_path), settle_hours=0)
+    claude = FakeClaude()
+    store.save(YESTERDAY, items(engagements=[Priority("Suivi a", lifelog_id="a")]),
+               [lifelog("a", YESTERDAY)], now=at(TODAY, 1))
+
+    # Fetched by the skill runner for today only, as planned by window_days
+    result = asyncio.run(analyze_priorities(
+        None, claude, None, period="week", dry_run=True, partitions=store,
+        lifelogs=[lifelog("b", TODAY)], window_days=1
+    ))
+
+    assert claude.sent == [["b"]]
+    assert titles(result["priorities"]) == ["Suivi a", "Suivi b"]
+    # The five days without partitions are left for a run that fetches them
+    assert store.stale_days(period_days(7)[:-2]) == period_days(7)[:-2]
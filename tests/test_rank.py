@@ -0,0 +1,91 @@
+"""Tests for priority scoring, threshold and top-k"""
+
+from datetime import datetime
+
+from skills.priority_detector.scripts.rank import merge_ranked, rank_priorities
+from src.utils.models import Priority
+
+
+NOW = datetime(2026, 10, 19, 12, 0)
+
+
+def titles(ranked):
+    return {item_type: [item.title for item in items] for item_type, items in ranked.items()}
+
+
+def test_threshold_drops_low_confidence_items():
+    ranked, stats = rank_priorities(
+        {"engagements": [Priority("A", confidence=0.9), Priority("B", confidence=0.3)]},
+        confidence_threshold=0.5,
+        now=NOW
+    )
+    assert titles(ranked)["engagements"] == ["A"]
+    assert stats == {"kept": 1, "below_threshold": 1, "over_limit": 0}
+
+
+def test_top_k_keeps_best_scores_across_types():
+    priorities = {
+        "engagements": [Priority("low", confidence=0.2), Priority("high", confidence=1.0)],
+        "demandes": [Priority("mid", confidence=0.6)],
+        "deadlines": [Priority("due today", confidence=0.6, date="2026-10-19")]
+    }
+    ranked, stats = rank_priorities(priorities, max_priorities=2, now=NOW)
+
+    assert titles(ranked) == {"engagements": ["high"], "demandes": [], "deadlines": ["due today"]}
+    assert stats["kept"] == 2
+    assert stats["over_limit"] == 2
+    assert all(item.score is not None for items in ranked.values() for item in items)
+
+
+def test_items_are_sorted_best_first():
+    ranked, _ = rank_priorities(
+        {"engagements": [Priority("B", confidence=0.4), Priority("A", confidence=0.8)]},
+        now=NOW
+    )
+    assert titles(ranked)["engagements"] == ["A", "B"]
+    first, second = ranked["engagements"]
+    assert first.score > second.score
+
+
+def test_ties_keep_extraction_order_with_and_without_cap():
+    items = [Priority(f"item {i}", confidence=0.7) for i in range(5)]
+
+    uncapped, _ = rank_priorities({"demandes": items}, now=NOW)
+    capped, _ = rank_priorities({"demandes": items}, max_priorities=3, now=NOW)
+
+    assert titles(uncapped)["demandes"] == [f"item {i}" for i in range(5)]
+    assert titles(capped)["demandes"] == ["item 0", "item 1", "item 2"]
+
+
+def test_close_deadline_outranks_distant_one():
+    ranked, _ = rank_priorities(
+        {"deadlines": [
+            Priority("later", confidence=0.8, date="2026-11-30"),
+            Priority("soon", confidence=0.8, date="2026-10-21")
+        ]},
+        now=NOW
+    )
+    assert titles(ranked)["deadlines"] == ["soon", "later"]
+
+
+def test_merge_skips_known_titles_ignoring_case_and_accents():
+    existing = {"engagements": [Priority("Appeler Hélène", score=0.9)]}
+    incoming = {"engagements": [Priority("appeler  helene", score=0.95), Priority("Relancer", score=0.5)]}
+
+    merged, added, dropped = merge_ranked(existing, incoming)
+
+    assert titles(merged)["engagements"] == ["Appeler Hélène", "Relancer"]
+    assert titles(added)["engagements"] == ["Relancer"]
+    assert dropped == 0
+
+
+def test_merge_cap_reports_only_kept_additions():
+    existing = {"engagements": [Priority("A", score=0.9), Priority("B", score=0.8)]}
+    incoming = {"demandes": [Priority("C", score=0.5), Priority("D", score=0.85)]}
+
+    merged, added, dropped = merge_ranked(existing, incoming, max_priorities=3)
+
+    assert titles(merged)["engagements"] == ["A", "B"]
+    assert titles(merged)["demandes"] == ["D"]
+    assert titles(added)["demandes"] == ["D"]
+    assert dropped == 1
@@ -0,0 +1,234 @@
+"""Tests for the resilience layer: retries, deadlines, circuit breaking and scheduling"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.connectors.notion import is_transient_error as notion_transient
+from src.utils.resilience import (
+    CircuitBreaker, CircuitOpenError, DeadlineExceededError,
+    Resilience, RetryPolicy, RunBudget
+)
+from src.utils.scheduling import FairScheduler
+
+
+class Transient(Exception):
+    pass
+
+
+def transient(error: Exception) -> bool:
+    return isinstance(error, Transient)
+
+
+def fast_policy(max_attempts: int = 3) -> RetryPolicy:
+    return RetryPolicy(max_attempts=max_attempts, base_delay=0.001, max_delay=0.001)
+
+
+def flaky(failures: int, result: str = "ok"):
+    """Coroutine factory failing `failures` times before answering"""
+    calls = {"count": 0}
+
+    async def func():
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            raise Transient()
+        return result
+
+    return func, calls
+
+
+def test_retries_transient_errors_until_success():
+    resilience = Resilience(policy=fast_policy())
+    func, calls = flaky(2)
+
+    assert asyncio.run(resilience.call("claude", "messages", func, transient)) == "ok"
+    assert calls["count"] == 3
+    assert resilience.stats()["retries"] == 2
+
+
+def test_gives_up_after_max_attempts():
+    resilience = Resilience(policy=fast_policy(max_attempts=2))
+    func, calls = flaky(5)
+
+    with pytest.raises(Transient):
+        asyncio.run(resilience.call("claude", "messages", func, transient))
+    assert calls["count"] == 2
+    assert resilience.stats()["failures"] == 1
+
+
+def test_does_not_retry_permanent_errors():
+    resilience = Resilience(policy=fast_policy())
+    calls = {"count": 0}
+
+    async def func():
+        calls["count"] += 1
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(resilience.call("claude", "messages", func, transient))
+    assert calls["count"] == 1
+
+
+def test_exhausted_budget_raises_deadline_exceeded():
+    budget = RunBudget(seconds=0.0)
+    resilience = Resilience(policy=fast_policy(), budget=budget)
+    func, calls = flaky(0)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(resilience.call("limitless", "lifelogs", func, transient))
+    assert calls["count"] == 0
+
+
+def test_exempt_endpoint_runs_after_budget_is_spent():
+    budget = RunBudget(seconds=0.0, exempt=["pages"])
+    resilience = Resilience(policy=fast_policy(), budget=budget)
+    func, _ = flaky(0)
+
+    assert budget.deadline_for("pages") is None
+    assert asyncio.run(resilience.call("notion", "pages", func, transient)) == "ok"
+
+
+def test_endpoint_share_caps_a_single_call():
+    budget = RunBudget(seconds=100.0, shares={"lifelogs": 0.25, "messages": 0.6})
+
+    assert budget.deadline_for("lifelogs") - time.monotonic() == pytest.approx(25.0, abs=0.5)
+    assert budget.deadline_for("messages") - time.monotonic() == pytest.approx(60.0, abs=0.5)
+
+
+def test_slow_call_times_out_at_deadline():
+    resilience = Resilience(policy=fast_policy(max_attempts=1), budget=RunBudget(seconds=0.05))
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(resilience.call("claude", "messages", slow, transient))
+
+
+def test_slot_wait_is_bounded_by_deadline():
+    scheduler = FairScheduler(limits={"claude": 1})
+    resilience = Resilience(
+        policy=fast_policy(max_attempts=1),
+        budget=RunBudget(seconds=0.1),
+        scheduler=scheduler
+    )
+
+    async def scenario():
+        async with scheduler.slot("claude"):
+            started = time.monotonic()
+            with pytest.raises(asyncio.TimeoutError):
+                await resilience.call("claude", "messages", flaky(0)[0], transient)
+            return time.monotonic() - started
+
+    assert asyncio.run(scenario()) < 0.5
+    assert scheduler._queue("claude").in_use == 0
+
+
+def test_hedged_duplicate_takes_its_own_slot():
+    scheduler = FairScheduler(limits={"limitless": 2})
+    resilience = Resilience(policy=fast_policy(max_attempts=1), scheduler=scheduler)
+    in_flight = {"now": 0, "peak": 0}
+    calls = {"count": 0}
+
+    async def request():
+        calls["count"] += 1
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], scheduler._queue("limitless").in_use)
+        try:
+            # The primary hangs, the duplicate answers
+            await asyncio.sleep(1 if calls["count"] == 1 else 0)
+            return calls["count"]
+        finally:
+            in_flight["now"] -= 1
+
+    result = asyncio.run(
+        resilience.call("limitless", "lifelogs", request, transient, hedge_after=0.01)
+    )
+
+    assert result == 2
+    assert in_flight["peak"] == 2
+    assert resilience.stats()["endpoints"]["limitless.lifelogs"]["hedge_wins"] == 1
+
+
+def test_circuit_opens_after_threshold_and_fails_fast():
+    resilience = Resilience(policy=fast_policy(max_attempts=1), failure_threshold=2, reset_timeout=60)
+    func, calls = flaky(10)
+
+    for _ in range(2):
+        with pytest.raises(Transient):
+            asyncio.run(resilience.call("notion", "pages", func, transient))
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(resilience.call("notion", "pages", func, transient))
+    assert calls["count"] == 2
+    assert resilience.stats()["open_circuits"] == ["notion"]
+
+
+def test_half_open_lets_a_single_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == "half_open"
+
+    assert breaker.check("notion") is True
+    with pytest.raises(CircuitOpenError):
+        breaker.check("notion")
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.check("notion") is False
+
+
+def test_concurrent_calls_share_one_probe():
+    resilience = Resilience(policy=fast_policy(max_attempts=1), failure_threshold=1, reset_timeout=0.0)
+    resilience.breaker("notion").record_failure()
+    calls = {"count": 0}
+
+    async def request():
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def scenario():
+        return await asyncio.gather(
+            *(resilience.call("notion", "pages", request, transient) for _ in range(3)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+
+    assert results.count("ok") == 1
+    assert sum(isinstance(r, CircuitOpenError) for r in results) == 2
+    assert calls["count"] == 1
+    assert resilience.breaker("notion").state == "closed"
+
+
+def test_failed_probe_reopens_circuit():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0.0)
+    breaker.failures = 5
+    breaker.opened_at = time.monotonic()
+
+    assert breaker.check("claude") is True
+    breaker.reset_timeout = 60
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.probing is False
+
+
+def test_notion_transport_errors_are_retried():
+    request = httpx.Request("POST", "https://api.notion.com/v1/pages")
+    calls = {"count": 0}
+
+    async def create_page():
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise httpx.ConnectError("connection reset", request=request)
+        return "page"
+
+    resilience = Resilience(policy=fast_policy())
+    assert asyncio.run(resilience.call("notion", "pages", create_page, notion_transient)) == "page"
+    assert calls["count"] == 2
+    assert notion_transient(httpx.ConnectTimeout("DNS lookup timed out", request=request))
+    assert not notion_transient(ValueError("bad property"))
@@ -0,0 +1,137 @@
+"""Tests for run history records and aggregates"""
+
+import asyncio
+from datetime import date, datetime
+
+from skills.priority_detector.scripts.analyze import analyze_priorities
+from skills.priority_detector.scripts.delta import LifelogDeltaStore
+from src.utils.models import Lifelog, Priority
+from src.utils.run_history import RunHistory, run_record
+
+
+class Claude:
+    """Claude connector stand-in returning fixed items"""
+
+    def __init__(self, priorities):
+        self.priorities = priorities
+        self.usage = {"calls": 0, "input_tokens": 10, "output_tokens": 5, "errors": 0}
+
+    async def analyze_priorities(self, lifelogs, period="today", context=None):
+        self.usage["calls"] += 1
+        return {
+            item_type: [Priority(title, lifelog_id=lifelogs[0].id) for title in titles]
+            for item_type, titles in self.priorities.items()
+        }
+
+
+class Notion:
+    """Notion connector stand-in failing the titles it is given"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.created = []
+
+    async def create_todos_batch(self, priorities, outcomes=None):
+        stats = {"engagements": 0, "demandes": 0, "deadlines": 0, "total": 0, "failed": 0}
+        for item_type, items in priorities.items():
+            for item in items:
+                ok = item.title not in self.failing
+                if ok:
+                    self.created.append(item.title)
+                    stats[item_type] += 1
+                    stats["total"] += 1
+                else:
+                    stats["failed"] += 1
+                if outcomes is not None:
+                    outcomes.setdefault(item_type, {})[item.title] = "created" if ok else "failed"
+        return stats
+
+    def get_database_url(self):
+        return "https://notion.so/db"
+
+
+def run(claude, notion, delta_store=None, dry_run=False):
+    return asyncio.run(analyze_priorities(
+        None, claude, notion,
+        dry_run=dry_run,
+        lifelogs=[Lifelog("a", "Réunion", "2026-10-19T10:00:00", "un")],
+        delta_store=delta_store
+    ))
+
+
+def outcomes(record):
+    return {item["title"]: item["outcome"] for item in record["items"]}
+
+
+def test_outcomes_reflect_created_failed_and_skipped(tmp_path):
+    claude = Claude({"engagements": ["Devis"], "demandes": ["Relire"]})
+    store_path = str(tmp_path / "delta.json")
+
+    first = run_record(
+        run(claude, Notion(failing={"Relire"}), LifelogDeltaStore(store_path)),
+        command="priorities", period="today", elapsed=1.0
+    )
+    assert outcomes(first) == {"Devis": "created", "Relire": "failed"}
+    assert first["stats"]["todos_created"] == 1
+    assert first["stats"]["todos_failed"] == 1
+
+    # The failed item is retried, the created one is skipped
+    notion = Notion()
+    second = run_record(
+        run(claude, notion, LifelogDeltaStore(store_path)),
+        command="priorities", period="today", elapsed=1.0
+    )
+    assert outcomes(second) == {"Devis": "skipped", "Relire": "created"}
+    assert notion.created == ["Relire"]
+    assert second["stats"]["todos_skipped"] == 1
+
+
+def test_dry_run_items_are_detected():
+    record = run_record(
+        run(Claude({"deadlines": ["Rapport"]}), Notion(), dry_run=True),
+        command="priorities", period="today", elapsed=0.5
+    )
+    assert outcomes(record) == {"Rapport": "detected"}
+
+
+def test_aggregates_count_failed_and_skipped_todos(tmp_path):
+    history = RunHistory(str(tmp_path))
+    run_at = datetime(2026, 10, 19, 9, 0)
+    for stats in (
+        {"todos_created": 2, "todos_failed": 1},
+        {"todos_created": 1, "todos_skipped": 2}
+    ):
+        history.record({
+            "run_at": run_at.isoformat(), "success": True, "dry_run": False,
+            "elapsed_seconds": 1.0, "stats": stats, "items": []
+        })
+
+    day = history.summary(weeks=1, today=date(2026, 10, 19))["days"][-1]
+    assert (day["runs"], day["todos_created"], day["todos_failed"], day["todos_skipped"]) == (2, 3, 1, 2)
+
+    # Rebuilding from the log gives the same counters
+    (tmp_path / "aggregates.json").unlink()
+    assert history.aggregates()["daily"]["2026-10-19"]["todos_failed"] == 1
+
+
+def test_profile_runs_are_split_by_profile(tmp_path):
+    history = RunHistory(str(tmp_path))
+    run_at = datetime(2026, 10, 19, 9, 0).isoformat()
+    for profile, created in (("christian", 2), ("associe", 1), ("christian", 3), (None, 4)):
+        history.record({
+            "run_at": run_at, "profile": profile, "success": True, "dry_run": False,
+            "elapsed_seconds": 1.0, "stats": {"todos_created": created}, "items": []
+        })
+
+    def day(profile=None):
+        bucket = history.summary(weeks=1, today=date(2026, 10, 19), profile=profile)["days"][-1]
+        return bucket["runs"], bucket["todos_created"]
+
+    assert day() == (4, 10)
+    assert day("christian") == (2, 5)
+    assert day("associe") == (1, 1)
+    assert day("inconnu") == (0, 0)
+    assert history.profiles() == ["associe", "christian"]
+
+    (tmp_path / "aggregates.json").unlink()
+    assert day("christian") == (2, 5)
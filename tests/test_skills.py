@@ -0,0 +1,84 @@
+"""Tests for the skill runner's shared fetch"""
+
+import asyncio
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+from src.utils.models import Lifelog
+from src.utils.skills import SkillRunner, compact_lifelog
+
+TODAY = date.today()
+
+
+def lifelog(log_id, days_ago, transcript="un"):
+    day = TODAY - timedelta(days=days_ago)
+    return {"id": log_id, "title": log_id, "date": datetime.combine(day, time(10)).isoformat(),
+            "transcript": transcript, "markdown": "# " + transcript}
+
+
+class Limitless:
+    """Limitless connector stand-in recording the windows asked for"""
+
+    def __init__(self, lifelogs):
+        self.lifelogs = lifelogs
+        self.windows = []
+
+    async def get_window(self, days=1, since=None):
+        self.windows.append(days)
+        return [log for log in self.lifelogs if log["date"] >= (TODAY - timedelta(days=days - 1)).isoformat()]
+
+
+def skill(skill_id, needed=None):
+    """Skill stand-in recording what it was given"""
+    seen = {}
+
+    async def run_skill(lifelogs, context):
+        seen["ids"] = sorted(log.id for log in lifelogs)
+        seen["window_days"] = context["window_days"]
+        return {"success": True}
+
+    module = SimpleNamespace(run_skill=run_skill)
+    if needed is not None:
+        module.fetch_days = lambda days, context: needed
+    return {"id": skill_id, "module": module}, seen
+
+
+def test_compact_lifelog_keeps_transcript_as_is():
+    compact = compact_lifelog({"id": "a", "title": "A", "transcript": "Marc :  oui\n\n\nMoi : non ", "extra": 1})
+
+    assert isinstance(compact, Lifelog)
+    assert compact.transcript == "Marc :  oui\n\n\nMoi : non "
+
+
+def test_runner_fetches_only_what_skills_need():
+    limitless = Limitless([lifelog("old", 5), lifelog("yesterday", 1), lifelog("today", 0)])
+    planned, planned_seen = skill("planned", needed=1)
+
+    report = asyncio.run(SkillRunner([planned]).run(limitless, {}, days=7))
+
+    assert limitless.windows == [1]
+    assert planned_seen == {"ids": ["today"], "window_days": 1}
+    assert report["lifelogs"] == 1
+
+
+def test_each_skill_gets_its_own_window():
+    limitless = Limitless([lifelog("old", 5), lifelog("yesterday", 1), lifelog("today", 0)])
+    planned, planned_seen = skill("planned", needed=2)
+    whole, whole_seen = skill("whole")
+
+    asyncio.run(SkillRunner([planned, whole]).run(limitless, {}, days=7))
+
+    # One fetch for the longest window
+    assert limitless.windows == [7]
+    assert planned_seen == {"ids": ["today", "yesterday"], "window_days": 2}
+    assert whole_seen == {"ids": ["old", "today", "yesterday"], "window_days": 7}
+
+
+def test_nothing_is_fetched_when_no_skill_needs_lifelogs():
+    limitless = Limitless([lifelog("today", 0)])
+    planned, planned_seen = skill("planned", needed=0)
+
+    asyncio.run(SkillRunner([planned]).run(limitless, {}, days=7))
+
+    assert limitless.windows == []
+    assert planned_seen == {"ids": [], "window_days": 0}